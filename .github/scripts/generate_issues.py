@@ -1,3 +1,11 @@
-# Placeholder script
 # Parses DESIGN_GUIDE.md and FEATURES.md
-# Calls GitHub API to create issues
+# Syncs unfinished steps to GitHub Issues (see flowchain/issues.py)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from flowchain.issues import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
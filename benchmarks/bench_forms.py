@@ -0,0 +1,51 @@
+"""Benchmark: project-form validation throughput.
+
+Streams a synthetic JSONL file of intake forms (mostly valid, with a share of
+placeholders, unknown fields and bad versions) through the compiled validator.
+
+    python benchmarks/bench_forms.py --forms 100000
+    python benchmarks/bench_forms.py --forms 500000 --invalid 0.2
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from corpus import write_forms  # noqa: E402
+from flowchain.forms import FormValidator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FlowChain form validation")
+    parser.add_argument("--forms", type=int, default=50_000)
+    parser.add_argument("--invalid", type=float, default=0.05, help="Share of forms with a fault")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "forms.jsonl"
+        write_forms(corpus, args.forms, args.invalid)
+        size = corpus.stat().st_size
+        print(f"📚 Corpus: {args.forms:,} forms, {size / 1e6:.1f} MB")
+
+        validator = FormValidator()
+        start = time.perf_counter()
+        invalid = sum(1 for result in validator.validate_stream(corpus) if result.errors)
+        streamed = time.perf_counter() - start
+        print(f"🌊 stream  : {streamed:8.3f}s  ({args.forms / streamed:,.0f} forms/s, {invalid:,} invalid)")
+
+        forms = [json.loads(line) for line in corpus.open("rb")]
+        start = time.perf_counter()
+        for form in forms:
+            validator.validate(form)
+        checked = time.perf_counter() - start
+        print(f"⚙️  schema  : {checked:8.3f}s  ({args.forms / checked:,.0f} forms/s, parsing excluded)")
+
+
+if __name__ == "__main__":
+    main()
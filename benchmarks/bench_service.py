@@ -0,0 +1,107 @@
+"""Load test: warm FlowChain service vs. one interpreter per call.
+
+Starts ``python -m flowchain.service`` and fires concurrent ``/state`` reads
+and ``/validate`` jobs at it, then times the same validation done the old way
+(a fresh ``python -m flowchain.validate`` process per call).
+
+    python benchmarks/bench_service.py --requests 500 --concurrency 16
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _call(url: str, body: dict = None) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def _wait_for_job(base: str, job_id: str) -> dict:
+    while True:
+        job = _call(f"{base}/jobs/{job_id}")
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.005)
+
+
+def _validate_via_service(base: str, root: str) -> float:
+    started = time.perf_counter()
+    _wait_for_job(base, _call(f"{base}/validate", {"root": root})["id"])
+    return time.perf_counter() - started
+
+
+def _state_via_service(base: str, root: str) -> float:
+    started = time.perf_counter()
+    _call(f"{base}/state?root={root}")
+    return time.perf_counter() - started
+
+
+def _validate_via_subprocess(root: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "flowchain.validate", root], cwd=REPO_ROOT, capture_output=True)
+    return time.perf_counter() - started
+
+
+def _report(name: str, latencies: list, wall: float):
+    latencies = sorted(latencies)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(
+        f"{name:<24} {len(latencies) / wall:8.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms"
+    )
+
+
+def _load(fn, requests: int, concurrency: int) -> tuple:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda _: fn(), range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the FlowChain service")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--root", default=str(REPO_ROOT / "core"), help="Project to validate")
+    args = parser.parse_args()
+
+    base = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "flowchain.service", "--port", str(args.port)],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            try:
+                _call(f"{base}/health")
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        state = _load(lambda: _state_via_service(base, args.root), args.requests, args.concurrency)
+        _report("service GET /state", *state)
+        validate = _load(lambda: _validate_via_service(base, args.root), args.requests, args.concurrency)
+        _report("service POST /validate", *validate)
+        spawned = max(1, args.requests // 10)
+        _report("subprocess validate", *_load(lambda: _validate_via_subprocess(args.root), spawned, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
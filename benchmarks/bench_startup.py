@@ -0,0 +1,105 @@
+"""Benchmark: ``flowchain`` start-up time per subcommand.
+
+Runs each command in a fresh interpreter several times and reports the
+median wall time, plus which heavy dependencies it imported. Exits 1 when a
+command misses its target or imports something it should not.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY = ("fastapi", "uvicorn", "google.genai", "requests")
+
+# command → (target ms or None, heavy modules it may import)
+COMMANDS = {
+    "state show": (100, ()),
+    "state check idea_captured": (100, ()),
+    "validate --help": (None, ()),
+    "scaffold --help": (None, ()),
+    "forms --help": (None, ()),
+    "rotate --help": (None, ()),
+    "issues --help": (None, ("requests",)),
+}
+
+PROBE = """
+import sys
+from flowchain.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stdout.flush()
+print("\\n@@" + ",".join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def command_argv(command: str, state_file: Path) -> list:
+    words = command.split()
+    if words[0] == "state":
+        words[1:1] = ["--file", str(state_file)]
+    return words
+
+
+def time_command(argv: list, runs: int, env: dict) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "flowchain", *argv], env=env, cwd=REPO_ROOT,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def heavy_imports(argv: list, env: dict) -> list:
+    done = subprocess.run([sys.executable, "-c", PROBE.format(heavy=HEAVY), *argv], env=env, cwd=REPO_ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    marker = done.stderr.rpartition("@@")[2].strip()
+    return [m for m in marker.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark flowchain CLI start-up")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    baseline = time_command(["--version"], args.runs, env)
+    report, failed = {"interpreter_ms": round(baseline, 1), "commands": {}}, False
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = Path(tmp) / "flow_state.json"
+        state_file.write_text((REPO_ROOT / "flowchain" / "flow_state.json").read_text())
+        for command, (target, allowed) in COMMANDS.items():
+            argv = command_argv(command, state_file)
+            ms = time_command(argv, args.runs, env)
+            unexpected = [m for m in heavy_imports(argv, env) if m not in allowed]
+            ok = not unexpected and (target is None or ms <= target)
+            failed |= not ok
+            report["commands"][command] = {"ms": round(ms, 1), "target_ms": target,
+                                           "unexpected_imports": unexpected, "ok": ok}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"🐍 flowchain --version: {baseline:7.1f} ms")
+        for command, row in report["commands"].items():
+            target = f"(target {row['target_ms']} ms)" if row["target_ms"] else ""
+            extra = f" imports {', '.join(row['unexpected_imports'])}!" if row["unexpected_imports"] else ""
+            print(f"{'✅' if row['ok'] else '❌'} flowchain {command:<28} {row['ms']:7.1f} ms {target}{extra}")
+    sys.exit(int(failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: native validator vs. the bash ``check_file`` loop in core/init.sh.
+
+Builds a synthetic corpus of FlowChain projects, then times both engines
+over every core file.
+
+    python benchmarks/bench_validate.py --projects 50 --lines 2000
+    python benchmarks/bench_validate.py --projects 500 --lines 20000 --jobs 1 2 4 8 --skip-shell
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from corpus import build_projects  # noqa: E402
+from flowchain.validate import CORE_FILES, validate_project, validate_projects  # noqa: E402
+
+INIT_SH = REPO_ROOT / "core" / "init.sh"
+
+
+def shell_harness() -> str:
+    """Extract the rule constants and ``check_file`` from init.sh into a loop without ``set -e``."""
+    script = INIT_SH.read_text()
+    start = script.index("UPPERCASE_SECTION_REGEX=")
+    end = script.index("# Prefer the native validator")
+    core_files = " ".join(f'"{name}"' for name in CORE_FILES)
+    return (
+        script[start:end]
+        + f"\nfor dir in \"$@\"; do\n  cd \"$dir\"\n  for file in {core_files}; do\n"
+        + "    check_file \"$file\" > /dev/null || true\n  done\ndone\n"
+    )
+
+
+def bench_shell(roots: list) -> float:
+    started = time.perf_counter()
+    subprocess.run(["bash", "-c", shell_harness(), "bench", *map(str, roots)], check=True)
+    return time.perf_counter() - started
+
+
+def bench_native(roots: list) -> float:
+    started = time.perf_counter()
+    for project in roots:
+        validate_project(project)
+    return time.perf_counter() - started
+
+
+def bench_pool(roots: list, jobs: int) -> float:
+    """Cold-cache run of the process-pool path used by ``--recursive``."""
+    started = time.perf_counter()
+    validate_projects(roots, jobs=jobs, use_cache=False)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FlowChain validators")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=1000, help="Lines per core file")
+    parser.add_argument("--jobs", type=int, nargs="*", default=[], help="Also time the process pool at these sizes")
+    parser.add_argument("--skip-shell", action="store_true", help="Only time the native validator")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        roots = build_projects(Path(tmp), args.projects, args.lines)
+        files = args.projects * len(CORE_FILES)
+        print(f"📚 Corpus: {args.projects} projects, {files} files, {args.lines} lines/file")
+
+        native = bench_native(roots)
+        print(f"🐍 native : {native:8.3f}s  ({files / native:,.0f} files/s)")
+        for jobs in args.jobs:
+            pooled = bench_pool(roots, jobs)
+            print(f"🧵 jobs={jobs:<3}: {pooled:8.3f}s  ({files / pooled:,.0f} files/s)")
+        if not args.skip_shell:
+            shell = bench_shell(roots)
+            print(f"🐚 shell  : {shell:8.3f}s  ({files / shell:,.0f} files/s)")
+            print(f"⚡ speedup: {shell / native:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Synthetic FlowChain corpora for the benchmarks.
+
+Projects get every core file with front matter, an UPPERCASE section and a
+configurable density of placeholder and contradiction markers, plus a
+``flow_state.json`` whose history can be made arbitrarily long. Forms are
+written as JSONL with a share of faulty entries.
+
+    python benchmarks/corpus.py OUT --projects 200 --lines 2000 --history 5000
+    python benchmarks/corpus.py OUT --forms 100000
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from flowchain.state import PHASES  # noqa: E402
+from flowchain.validate import CONTRADICTION_MARKER, CORE_FILES, PLACEHOLDER_MARKER, STATE_FILE  # noqa: E402
+
+FILLER = "FlowChain keeps docs and state in lockstep across every phase gate."
+
+
+def write_doc(path: Path, lines: int, rng: random.Random, placeholders: float, contradictions: float):
+    body = ["---", f'title: "{path.name}"', "env: global", "version: 0.1.0", "---", "", f"# {path.name}", "",
+            "## OVERVIEW"]
+    for i in range(lines):
+        roll = rng.random()
+        if roll < placeholders:
+            body.append(f"{PLACEHOLDER_MARKER} line {i}")
+        elif roll < placeholders + contradictions:
+            body.append(f"{CONTRADICTION_MARKER}: line {i}")
+        else:
+            body.append(f"{FILLER} ({i})")
+    path.write_text("\n".join(body) + "\n")
+
+
+def state_data(name: str, history: int) -> dict:
+    """A valid state at ``design_ready`` preceded by ``history`` earlier (replayed) entries."""
+    current = PHASES.index("design_ready")
+    replayed = [PHASES[i % current] for i in range(history)]
+    return {
+        "project_name": name,
+        "current_step": PHASES[current],
+        "last_validated_score": 9,
+        "override_flags": [],
+        "history": replayed + list(PHASES[:current + 1]),
+    }
+
+
+def build_projects(root: Path, projects: int, lines: int, placeholders: float = 0.001,
+                   contradictions: float = 0.0002, history: int = 0, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    roots = []
+    for p in range(projects):
+        project = Path(root) / f"project-{p:04d}"
+        project.mkdir(parents=True)
+        for name in CORE_FILES:
+            if name == STATE_FILE:
+                (project / name).write_text(json.dumps(state_data(project.name, history), indent=2) + "\n")
+            else:
+                write_doc(project / name, lines, rng, placeholders, contradictions)
+        roots.append(project)
+    return roots
+
+
+def make_form(rng: random.Random, i: int, invalid: float) -> dict:
+    form = {
+        "project_name": f"project-{i}",
+        "description": f"Project {i} keeps docs and state in lockstep.",
+        "purpose": "Intake benchmark",
+        "tech_stack": {
+            "languages": ["python", "bash"],
+            "frameworks": ["fastapi"],
+            "platforms": ["linux"],
+            "tools": ["gh", "invoke"],
+        },
+        "features": [f"Feature {n}" for n in range(rng.randint(1, 8))],
+        "integrations": {"GITHUB": "Issue sync", "GEMINI": "Agent calls"},
+        "definition_of_done": "All phase gates pass",
+        "flowchain_version": "1.0-draft",
+        "state_dependencies": {"requires": [f"project-{i - 1}"] if i else [], "unlocks": []},
+    }
+    if rng.random() < invalid:
+        fault = rng.randrange(3)
+        if fault == 0:
+            form["features"].append(PLACEHOLDER_MARKER)
+        elif fault == 1:
+            form["owner"] = "someone"
+        else:
+            form["flowchain_version"] = "2.0"
+    return form
+
+
+def write_forms(path: Path, forms: int, invalid: float = 0.05, seed: int = 7):
+    rng = random.Random(seed)
+    with Path(path).open("w") as handle:
+        for i in range(forms):
+            handle.write(json.dumps(make_form(rng, i, invalid)) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic FlowChain corpus")
+    parser.add_argument("out", type=Path)
+    parser.add_argument("--projects", type=int, default=0)
+    parser.add_argument("--lines", type=int, default=1000, help="Lines per core document")
+    parser.add_argument("--placeholders", type=float, default=0.001, help="Share of lines with a placeholder")
+    parser.add_argument("--contradictions", type=float, default=0.0002, help="Share of lines with a contradiction")
+    parser.add_argument("--history", type=int, default=0, help="Extra flow_state.json history entries")
+    parser.add_argument("--forms", type=int, default=0, help="Also write OUT/forms.jsonl with this many forms")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    if args.projects:
+        build_projects(args.out, args.projects, args.lines, args.placeholders, args.contradictions,
+                       args.history, args.seed)
+    if args.forms:
+        write_forms(args.out / "forms.jsonl", args.forms, seed=args.seed)
+    print(f"📚 Wrote {args.projects} projects and {args.forms} forms to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
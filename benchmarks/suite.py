@@ -0,0 +1,167 @@
+"""Component benchmark suite with JSON baselines and a regression gate.
+
+Times doc validation (cold and cached), state loads and transitions on long
+histories, form validation and scaffolding on a synthetic corpus. Every
+metric is seconds per unit (file, state, form, project), the best of
+``--repeat`` runs, so lower is better and runs of different sizes compare.
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.25 --json
+
+With ``--compare`` the exit status is 1 when any metric is slower than the
+baseline by more than ``--threshold`` (a fraction), like ``flowchain.validate
+--max-level`` in ``validate.yml``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from corpus import build_projects, state_data, write_forms  # noqa: E402
+from flowchain.forms import FormValidator  # noqa: E402
+from flowchain.scaffold import load_templates, scaffold_many  # noqa: E402
+from flowchain.state import STATE_FILE, FlowState, transaction  # noqa: E402
+from flowchain.validate import CORE_FILES, validate_projects  # noqa: E402
+
+SUITE_VERSION = 1
+
+SIZES = {
+    # name: (projects, lines per doc, history entries, states, forms, scaffolded projects)
+    "quick": (20, 500, 2_000, 50, 5_000, 50),
+    "full": (100, 2_000, 10_000, 200, 50_000, 500),
+}
+
+
+def best(fn, repeat: int, setup=None) -> float:
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def backdate(roots: list, seconds: float = 3600):
+    """Age the corpus past the cache's racy window so cached runs take the stat fast path."""
+    stamp = time.time() - seconds
+    for root in roots:
+        for path in Path(root).iterdir():
+            os.utime(path, (stamp, stamp))
+
+
+def run_suite(tmp: Path, size: str, repeat: int) -> dict:
+    projects, lines, history, states, forms, fleet = SIZES[size]
+    metrics = {}
+
+    roots = build_projects(tmp / "docs", projects, lines, history=history)
+    backdate(roots)
+    files = projects * len(CORE_FILES)
+    metrics["validate_cold_per_file"] = best(lambda: validate_projects(roots, jobs=1, use_cache=False), repeat) / files
+    validate_projects(roots, jobs=1)
+    metrics["validate_cached_per_file"] = best(lambda: validate_projects(roots, jobs=1), repeat) / files
+
+    state_dir = tmp / "states"
+    state_dir.mkdir()
+    paths = [state_dir / f"{i}-{STATE_FILE}" for i in range(states)]
+    text = json.dumps(state_data("bench", history), indent=2) + "\n"
+
+    def reset_states():
+        for path in paths:
+            path.write_text(text)
+
+    def transition_all():
+        for path in paths:
+            with transaction(path) as state:
+                state.advance("build_started")
+
+    reset_states()
+    metrics["state_load_per_state"] = best(lambda: [FlowState.load(p) for p in paths], repeat) / states
+    metrics["state_transition_per_state"] = best(transition_all, repeat, setup=reset_states) / states
+
+    forms_path = tmp / "forms.jsonl"
+    write_forms(forms_path, forms)
+    validator = FormValidator()
+    metrics["forms_stream_per_form"] = best(lambda: sum(1 for _ in validator.validate_stream(forms_path)), repeat) / forms
+
+    templates = load_templates()
+    names = [f"project-{i:04d}" for i in range(fleet)]
+    fleet_dir = tmp / "fleet"
+    metrics["scaffold_cold_per_project"] = best(
+        lambda: scaffold_many(fleet_dir, names, templates), repeat,
+        setup=lambda: shutil.rmtree(fleet_dir, ignore_errors=True),
+    ) / fleet
+    metrics["scaffold_unchanged_per_project"] = best(
+        lambda: scaffold_many(fleet_dir, names, templates, overwrite=True), repeat
+    ) / fleet
+    return metrics
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> dict:
+    rows, regressions = {}, []
+    for name, value in current.items():
+        base = baseline.get(name)
+        if base is None:
+            rows[name] = {"current": value, "baseline": None, "change": None}
+            continue
+        change = value / base - 1 if base else 0.0
+        rows[name] = {"current": value, "baseline": base, "change": round(change, 4)}
+        if change > threshold:
+            regressions.append(name)
+    return {"threshold": threshold, "metrics": rows, "regressions": regressions}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FlowChain component benchmarks")
+    parser.add_argument("--size", choices=SIZES, default="quick")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per metric; the fastest counts")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Baseline to gate against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction (default 0.25)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics = run_suite(Path(tmp), args.size, args.repeat)
+    result = {
+        "suite_version": SUITE_VERSION,
+        "size": args.size,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": metrics,
+    }
+    if args.save:
+        args.save.write_text(json.dumps(result, indent=2) + "\n")
+
+    report = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("size") != args.size:
+            print(f"⚠️  Baseline size '{baseline.get('size')}' differs from '{args.size}'", file=sys.stderr)
+        report = compare(metrics, baseline["metrics"], args.threshold)
+
+    if args.json:
+        print(json.dumps(report or result, indent=2))
+    else:
+        rows = report["metrics"] if report else {name: {"current": v} for name, v in metrics.items()}
+        for name, row in rows.items():
+            line = f"{name:<32} {row['current'] * 1e6:12.2f} µs"
+            if row.get("baseline") is not None:
+                mark = "❌" if name in report["regressions"] else "✅"
+                line += f"  (baseline {row['baseline'] * 1e6:.2f} µs, {row['change']:+.1%}) {mark}"
+            print(line)
+    sys.exit(int(bool(report and report["regressions"])))
+
+
+if __name__ == "__main__":
+    main()
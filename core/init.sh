@@ -13,6 +13,7 @@ set -e
 # ────────────────────────────────
 
 echo "🌀 Initializing FlowChain project..."
+FLOWCHAIN_HOME="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 mkdir -p flowchain/.github/{workflows,scripts,ISSUE_TEMPLATE}
 cd flowchain || exit 1
 
@@ -31,6 +32,12 @@ create_if_missing() {
   fi
 }
 
+# Prefer the scaffolding engine (flowchain/scaffold.py), which renders templates/
+# in one process; the create_if_missing calls below are kept for bare environments.
+if command -v python3 > /dev/null && PYTHONPATH="$FLOWCHAIN_HOME" python3 -c "import flowchain.scaffold" 2> /dev/null; then
+  PYTHONPATH="$FLOWCHAIN_HOME${PYTHONPATH:+:$PYTHONPATH}" python3 -m flowchain.scaffold . --verbose
+else
+
 # ────────────────────────────────
 # 📄 CORE DOCUMENTATION FILES
 # ────────────────────────────────
@@ -69,6 +76,8 @@ create_if_missing ".github/workflows/drift-watcher.yml" "name: Drift Watcher\non
 create_if_missing ".github/ISSUE_TEMPLATE/build-task.md" "---\nname: Build Task\nabout: Auto-generated FlowChain task\n---\n\n### Description\n_TODO: Fill in from DESIGN_GUIDE.md or FEATURES.md_\n\n### Checklist\n- [ ] Code written\n- [ ] Docs updated\n- [ ] Test passed"
 create_if_missing ".github/scripts/generate_issues.py" "# Placeholder script\n# Would parse DESIGN_GUIDE.md + FEATURES.md\n# Call GitHub API to generate build issues"
 
+fi
+
 echo ""
 echo "✅ FlowChain project scaffold created."
 
@@ -129,6 +138,14 @@ check_file() {
   return $level
 }
 
+# Prefer the native validator (flowchain/validate.py) when Python is available;
+# the bash loop below is kept as a fallback for bare environments.
+if command -v python3 > /dev/null && PYTHONPATH="$FLOWCHAIN_HOME" python3 -c "import flowchain.validate" 2> /dev/null; then
+  set +e
+  PYTHONPATH="$FLOWCHAIN_HOME${PYTHONPATH:+:$PYTHONPATH}" python3 -m flowchain.validate .
+  exit $?
+fi
+
 overall_status=0
 for file in "${CORE_FILES[@]}"; do
   check_file "$file"
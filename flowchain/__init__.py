@@ -0,0 +1,6 @@
+"""FlowChain – proof-driven, state-locked project protocol.
+
+Python engine behind ``core/init.sh`` and the GitHub workflows.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,5 @@
+import sys
+
+from flowchain.cli import main
+
+sys.exit(main())
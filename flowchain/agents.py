@@ -0,0 +1,247 @@
+"""Async multi-agent runner.
+
+Runs independent agent calls concurrently, with a bounded semaphore per
+provider and a timeout per call, so a validation round takes as long as its
+slowest agent rather than the sum of all of them. Streamed chunks are
+collected into an :class:`AgentResult` instead of being printed.
+
+    python -m flowchain.agents --doc docs/DESIGN_GUIDE.md [--timeout 120]
+    python -m flowchain.agents --doc docs/DESIGN_GUIDE.md --state core/flow_state.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from flowchain import telemetry
+from flowchain.response_cache import ResponseCache
+from flowchain.state import STATE_FILE
+
+# docs/TECHNICAL_GUIDE.md: every agent validates with 2 methods.
+AGENTS = ("Validator", "Scaffold", "Review", "Build", "Extension")
+METHODS = {
+    "internal_logic": "Check the document against FlowChain's own rules and phase order.",
+    "external_search": "Check the document against established external practice for this kind of project.",
+}
+
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass(slots=True)
+class AgentCall:
+    agent: str
+    method: str
+    prompt: str
+    provider: str = "gemini"
+    timeout: float = DEFAULT_TIMEOUT
+    refs: tuple = ()  # (doc_path, section_or_None) pairs the answer depends on
+
+
+@dataclass(slots=True)
+class AgentResult:
+    agent: str
+    method: str
+    provider: str
+    status: str = "pending"  # ok | timeout | cancelled | error
+    cached: bool = False
+    chunks: list = field(default_factory=list)
+    error: str = None
+    queued: float = 0.0  # seconds spent waiting for the provider semaphore
+    ttft: float = None
+    latency: float = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["chunks"]
+        data["text"] = self.text
+        return data
+
+
+class GeminiProvider:
+    """Streams completions through ``client.aio`` using the prompt context from ``flowchain.gemini``."""
+
+    name = "gemini"
+
+    def __init__(self, model: str = None, base_url: str = None, client=None, api_key: str = None):
+        from google import genai
+        from google.genai import errors, types
+
+        from flowchain import gemini
+
+        self.gemini = gemini
+        self.errors = errors
+        self.model = model or gemini.MODEL
+        base_url = base_url or os.environ.get("GEMINI_BASE_URL")
+        self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
+        self.client = client or genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(base_url=base_url) if base_url else None,
+        )
+        self._context = None
+        self._context_lock = asyncio.Lock()
+
+    async def stream(self, prompt: str):
+        # Concurrent calls fan out at once; only the first builds (and uploads) the context.
+        async with self._context_lock:
+            if self._context is None:
+                self._context = await asyncio.to_thread(
+                    self.gemini.prompt_context, self.client, self.model, self.api_key
+                )
+        for retry in (True, False):
+            contents, config, _ = self._context.request(prompt)
+            started = False
+            try:
+                async for chunk in await self.client.aio.models.generate_content_stream(
+                    model=self.model, contents=contents, config=config
+                ):
+                    started = True
+                    if chunk.text:
+                        yield chunk.text
+                return
+            except self.errors.ClientError as e:
+                # A server cache that vanished fails before the first chunk: recreate it once.
+                if started or not retry or not await asyncio.to_thread(self._context.recover, self.client, e):
+                    raise
+
+
+class AgentRunner:
+    def __init__(self, providers: dict, concurrency: dict = None, default_concurrency: int = DEFAULT_CONCURRENCY,
+                 cache=None):
+        self.providers = providers
+        self.cache = cache
+        concurrency = concurrency or {}
+        self.semaphores = {
+            name: asyncio.Semaphore(concurrency.get(name, default_concurrency)) for name in providers
+        }
+
+    async def _stream(self, call: AgentCall, result: AgentResult, started: float, on_chunk):
+        async for text in self.providers[call.provider].stream(call.prompt):
+            if result.ttft is None:
+                result.ttft = time.perf_counter() - started
+            result.chunks.append(text)
+            if on_chunk:
+                on_chunk(result, text)
+
+    async def run_one(self, call: AgentCall, on_chunk=None) -> AgentResult:
+        result = AgentResult(call.agent, call.method, call.provider)
+        if self.cache is not None:
+            model = getattr(self.providers[call.provider], "model", call.provider)
+            key = self.cache.key(model, call.prompt, call.refs)
+            cached = self.cache.get(key)
+            if cached is not None:
+                result.chunks.append(cached)
+                result.status, result.cached, result.latency = "ok", True, 0.0
+                telemetry.count("flowchain_agent_calls_total", agent=call.agent, provider=call.provider, status="cached")
+                return result
+        queued = time.perf_counter()
+        started = None
+        try:
+            async with self.semaphores[call.provider]:
+                started = time.perf_counter()
+                result.queued = started - queued
+                try:
+                    async with asyncio.timeout(call.timeout):
+                        await self._stream(call, result, started, on_chunk)
+                    result.status = "ok"
+                    if self.cache is not None:
+                        self.cache.put(key, model, result.text, call.refs)
+                except TimeoutError:
+                    result.status = "timeout"
+                except Exception as e:
+                    result.status, result.error = "error", f"{type(e).__name__}: {e}"
+        except asyncio.CancelledError:
+            result.status = "cancelled"
+            raise
+        finally:
+            if started is not None:
+                result.latency = time.perf_counter() - started
+        _record(call, result)
+        return result
+
+    async def run(self, calls: list, on_chunk=None) -> list:
+        """Run every call concurrently; results come back in call order."""
+        return list(await asyncio.gather(*(self.run_one(call, on_chunk) for call in calls)))
+
+
+def _record(call: AgentCall, result: AgentResult):
+    labels = {"agent": call.agent, "provider": call.provider}
+    telemetry.count("flowchain_agent_calls_total", status=result.status, **labels)
+    telemetry.observe("flowchain_agent_queue_seconds", result.queued, **labels)
+    if result.latency is not None:
+        telemetry.observe("flowchain_agent_latency_seconds", result.latency, **labels)
+    if result.ttft is not None:
+        telemetry.observe("flowchain_agent_ttft_seconds", result.ttft, **labels)
+
+
+def validation_calls(document: str, name: str, agents=AGENTS, timeout: float = DEFAULT_TIMEOUT, refs=()) -> list:
+    calls = []
+    for agent in agents:
+        for method, instruction in METHODS.items():
+            prompt = (
+                f"You are the FlowChain {agent} Agent. {instruction}\n"
+                f"Report every problem as a bullet, or reply PASS.\n\n--- {name} ---\n{document}"
+            )
+            calls.append(AgentCall(agent, method, prompt, timeout=timeout, refs=tuple(refs)))
+    return calls
+
+
+async def validation_round(runner: AgentRunner, document: str, name: str, **kwargs) -> dict:
+    started = time.perf_counter()
+    results = await runner.run(validation_calls(document, name, **kwargs))
+    wall = time.perf_counter() - started
+    report = {
+        "document": name,
+        "wall_time": wall,
+        "sum_latency": sum(r.latency or 0 for r in results),
+        "results": [r.to_dict() for r in results],
+    }
+    if runner.cache is not None:
+        report["cache"] = runner.cache.stats()
+    return report
+
+
+def find_state(doc: Path) -> Path:
+    """The nearest ``flow_state.json`` at or above ``doc``'s directory (cwd's if none)."""
+    for directory in Path(doc).resolve().parents:
+        if (directory / STATE_FILE).is_file():
+            return directory / STATE_FILE
+    return Path(STATE_FILE)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run a FlowChain multi-agent validation round")
+    parser.add_argument("--doc", default="docs/DESIGN_GUIDE.md", help="Document to validate")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-call timeout in seconds")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Concurrent calls per provider")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the model")
+    parser.add_argument("--state", type=Path,
+                        help=f"State file whose phase keys cached answers (default: nearest {STATE_FILE} above --doc)")
+    args = parser.parse_args(argv)
+
+    doc = Path(args.doc)
+    cache = None
+    if not args.no_cache:
+        state = args.state or find_state(doc)
+        if not state.is_file():
+            print(f"⚠️  {state} not found: cached answers will not be invalidated by phase changes", file=sys.stderr)
+        cache = ResponseCache(state_path=state)
+    runner = AgentRunner({"gemini": GeminiProvider()}, default_concurrency=args.concurrency, cache=cache)
+    report = asyncio.run(
+        validation_round(runner, doc.read_text(), doc.name, timeout=args.timeout, refs=[(doc, None)])
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return int(any(r["status"] != "ok" for r in report["results"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
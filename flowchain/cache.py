@@ -0,0 +1,94 @@
+"""Persistent validation cache.
+
+Stores one entry per validated file under ``.flowchain/cache`` keyed by path
+and guarded by (mtime, size, SHA-256, validator version). Unchanged files are
+answered from the cache; edited ones are hashed and rescanned.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(".flowchain") / "cache"
+CACHE_FILE = "validation.json"
+
+# Files modified this close to the moment they were cached may change again
+# within the same mtime tick, so their stat alone is never trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_json(path: Path, payload, **dump_args):
+    """Atomically replace ``path`` (unique temp file, fsync, rename), so concurrent savers never share a temp."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            json.dump(payload, handle, **dump_args)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ValidationCache:
+    def __init__(self, directory: Path, version: str):
+        self.path = Path(directory) / CACHE_FILE
+        self.version = version
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    @classmethod
+    def for_project(cls, root: Path, version: str) -> "ValidationCache":
+        cache = cls(Path(root) / CACHE_DIR, version)
+        cache.load()
+        return cache
+
+    def load(self):
+        try:
+            payload = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        if payload.get("version") == self.version:
+            self.entries = payload.get("entries", {})
+
+    def save(self):
+        if not self.dirty:
+            return
+        write_json(self.path, {"version": self.version, "entries": self.entries}, sort_keys=True)
+        self.dirty = False
+
+    def get(self, key: str, st: os.stat_result, digest: str = None):
+        """Return the cached level, or ``None`` when the file must be rescanned.
+
+        Without ``digest`` only the stat fast path is tried.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry["size"] != st.st_size:
+            return None
+        if digest is None:
+            if entry["racy"] or entry["mtime_ns"] != st.st_mtime_ns:
+                return None
+            return entry["level"]
+        return entry["level"] if entry["sha256"] == digest else None
+
+    def put(self, key: str, st: os.stat_result, digest: str, level: int):
+        self.entries[key] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": digest,
+            "level": level,
+            "racy": time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS,
+        }
+        self.dirty = True
@@ -0,0 +1,82 @@
+"""The ``flowchain`` command.
+
+Each subcommand lives in its own module and is imported only when it runs,
+so ``flowchain state show`` never pays for requests, FastAPI or google-genai.
+
+    flowchain validate --recursive .
+    flowchain state show
+    flowchain rotate --dual
+    flowchain --trace trace.json validate .   # or FLOWCHAIN_TRACE=trace.json
+"""
+
+import importlib
+import os
+import sys
+
+from flowchain import __version__
+
+# name → (module with ``main(argv)``, help). Kept as plain strings so listing
+# the commands imports nothing.
+COMMANDS = {
+    "validate": ("flowchain.validate", "Check core files against the enforcement levels"),
+    "state": ("flowchain.state", "Show, advance or check flow_state.json"),
+    "rotate": ("flowchain.rotate", "Rotate GPT_AGENT_API_KEY in chat.env"),
+    "scaffold": ("flowchain.scaffold", "Scaffold projects from templates/"),
+    "issues": ("flowchain.issues", "Sync unfinished steps to GitHub Issues"),
+    "forms": ("flowchain.forms", "Validate project intake forms"),
+    "deps": ("flowchain.deps", "Plan and check cross-project dependencies"),
+    "hooks": ("flowchain.hooks", "List and run language hooks"),
+    "patch": ("flowchain.patch", "Apply declarative doc patches to many repositories via git plumbing"),
+    "facts": ("flowchain.facts", "Find contradictions between JSON state/forms and Markdown docs"),
+    "drift": ("flowchain.drift", "Report doc/code drift against a base revision"),
+    "events": ("flowchain.events", "Inspect and compact the flow event log"),
+    "intake": ("flowchain.intake", "Queue and process agent requests from requests.jsonl"),
+    "agents": ("flowchain.agents", "Run agent validation rounds"),
+    "serve": ("flowchain.service", "Run the FlowChain HTTP service"),
+}
+
+
+def usage() -> str:
+    width = max(map(len, COMMANDS))
+    lines = ["usage: flowchain [--trace FILE] <command> [args]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {text}" for name, (_, text) in COMMANDS.items()]
+    lines += ["", "Run 'flowchain <command> --help' for a command's options."]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+    if argv[0] == "--version":
+        print(f"flowchain {__version__}")
+        return 0
+
+    trace = os.environ.get("FLOWCHAIN_TRACE")
+    if argv[0] == "--trace" and len(argv) > 2:
+        trace, argv = argv[1], argv[2:]
+
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"flowchain: unknown command '{name}'\n\n{usage()}", file=sys.stderr)
+        return 2
+    # argparse takes its prog from argv[0]; make sub-help read "usage: flowchain state ...".
+    sys.argv = [f"flowchain {name}", *rest]
+    if not trace:
+        result = importlib.import_module(COMMANDS[name][0]).main(rest)
+        return result if isinstance(result, int) else 0
+
+    from flowchain import telemetry
+
+    telemetry.enable()
+    try:
+        with telemetry.span("flowchain_command", command=name):
+            result = importlib.import_module(COMMANDS[name][0]).main(rest)
+    finally:
+        telemetry.write_trace(trace)
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
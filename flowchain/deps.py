@@ -0,0 +1,283 @@
+"""Cross-project dependency scheduler.
+
+Builds a DAG from every project's ``state_dependencies`` (in
+``project_form.json`` and/or ``flow_state.json``). A requirement is
+``"other-project"`` (met once it is released) or ``"other-project:phase"``;
+``unlocks`` declares the same edge from the other side. Each project keeps
+its set of unmet requirements, so advancing one project only touches its
+direct dependents to find what just became unblocked.
+
+    python -m flowchain.deps plan ROOT
+    python -m flowchain.deps check ROOT --jobs 8
+    python -m flowchain.deps advance ROOT my-project design_ready
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowchain.state import PHASE_INDEX, PHASES, STATE_FILE, FlowState, TransitionError, transaction
+from flowchain.validate import LEVEL_PLACEHOLDER, discover_projects, validate_projects
+
+FORM_FILE = "project_form.json"
+DEFAULT_PHASE = PHASES[-1]
+
+
+class DependencyError(ValueError):
+    """Raised for cycles and requirements on unknown projects."""
+
+
+@dataclass(slots=True)
+class Project:
+    name: str
+    root: Path
+    state: FlowState
+    requires: list = field(default_factory=list)  # [(project, phase)]
+    unlocks: list = field(default_factory=list)  # [(project, phase)]
+
+    @property
+    def remaining(self) -> int:
+        return len(PHASES) - 1 - PHASE_INDEX[self.state.current_step]
+
+
+def parse_requirement(text: str) -> tuple:
+    name, _, phase = text.partition(":")
+    phase = phase or DEFAULT_PHASE
+    if phase not in PHASE_INDEX:
+        raise DependencyError(f"Unknown phase '{phase}' in requirement '{text}'")
+    return name, phase
+
+
+def _declared(data: dict) -> tuple:
+    deps = data.get("state_dependencies") or {}
+    return (
+        [parse_requirement(r) for r in deps.get("requires", [])],
+        [parse_requirement(u) for u in deps.get("unlocks", [])],
+    )
+
+
+def load_project(root: Path) -> Project:
+    root = Path(root)
+    state = FlowState.load(root / STATE_FILE)
+    name, requires, unlocks = state.project_name, *_declared(state.extra)
+    form_path = root / FORM_FILE
+    if form_path.is_file():
+        form = json.loads(form_path.read_text())
+        name = form.get("project_name") or name
+        more_requires, more_unlocks = _declared(form)
+        requires += more_requires
+        unlocks += more_unlocks
+    return Project(name, root, state, requires, unlocks)
+
+
+class DependencyGraph:
+    def __init__(self, projects):
+        self.projects = {}
+        for project in projects:
+            if project.name in self.projects:
+                raise DependencyError(
+                    f"Duplicate project '{project.name}' in {project.root} and {self.projects[project.name].root}"
+                )
+            self.projects[project.name] = project
+
+        # requires[name] = {dep: phase}; dependents[dep] = {name: phase}
+        self.requires = defaultdict(dict)
+        self.dependents = defaultdict(dict)
+        for project in self.projects.values():
+            for dep, phase in project.requires:
+                self._add_edge(dep, project.name, phase)
+            for target, phase in project.unlocks:
+                self._add_edge(project.name, target, phase)
+
+        self.order = self._topological_order()
+        self.unmet = {
+            name: {dep for dep, phase in self.requires[name].items() if not self.projects[dep].state.reached(phase)}
+            for name in self.projects
+        }
+
+    @classmethod
+    def discover(cls, top: Path) -> "DependencyGraph":
+        return cls(load_project(root) for root in discover_projects(Path(top)))
+
+    def _add_edge(self, dep: str, name: str, phase: str):
+        for end in (dep, name):
+            if end not in self.projects:
+                raise DependencyError(f"Unknown project '{end}' in state_dependencies")
+        if dep == name:
+            raise DependencyError(f"Project '{name}' depends on itself")
+        # Two declarations of the same edge keep the stricter phase.
+        if PHASE_INDEX[phase] >= PHASE_INDEX[self.requires[name].get(dep, PHASES[0])]:
+            self.requires[name][dep] = phase
+            self.dependents[dep][name] = phase
+
+    def _topological_order(self) -> list:
+        indegree = {name: len(self.requires[name]) for name in self.projects}
+        queue = sorted(name for name, n in indegree.items() if n == 0)
+        order = []
+        while queue:
+            name = queue.pop()
+            order.append(name)
+            for dependent in self.dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) < len(self.projects):
+            raise DependencyError("Dependency cycle: " + " → ".join(self._find_cycle(set(self.projects) - set(order))))
+        return order
+
+    def _find_cycle(self, candidates: set) -> list:
+        # Every leftover node lies on or behind a cycle, so walking requirements must revisit one.
+        name = min(candidates)
+        seen = []
+        while name not in seen:
+            seen.append(name)
+            name = min(dep for dep in self.requires[name] if dep in candidates)
+        return seen[seen.index(name):] + [name]
+
+    # ────────── queries ──────────
+
+    def blocked(self) -> dict:
+        return {
+            name: sorted(f"{dep}:{self.requires[name][dep]}" for dep in unmet)
+            for name, unmet in sorted(self.unmet.items())
+            if unmet
+        }
+
+    def waves(self) -> list:
+        """Group projects so each wave only depends on earlier ones."""
+        depth = {}
+        for name in self.order:
+            depth[name] = 1 + max((depth[dep] for dep in self.requires[name]), default=-1)
+        waves = defaultdict(list)
+        for name, d in depth.items():
+            waves[d].append(name)
+        return [sorted(waves[d]) for d in sorted(waves)]
+
+    def critical_path(self) -> tuple:
+        """Longest chain by remaining phase steps; returns ``(names, steps)``."""
+        best, prev = {}, {}
+        for name in self.order:
+            dep = max(self.requires[name], key=lambda d: best[d], default=None)
+            best[name] = self.projects[name].remaining + (best[dep] if dep else 0)
+            prev[name] = dep
+        if not best:
+            return [], 0
+        name = max(best, key=best.get)
+        steps, path = best[name], []
+        while name:
+            path.append(name)
+            name = prev[name]
+        return path[::-1], steps
+
+    # ────────── incremental updates ──────────
+
+    def advance(self, name: str, phase: str, save: bool = True) -> list:
+        """Advance ``name`` to ``phase`` and return the projects it newly unblocked."""
+        if name not in self.projects:
+            raise DependencyError(f"Unknown project '{name}'")
+        project = self.projects[name]
+        if self.unmet[name]:
+            raise TransitionError(f"'{name}' is blocked by: {', '.join(self.blocked()[name])}")
+        if save:
+            with transaction(project.root / STATE_FILE) as state:
+                state.advance(phase)
+            project.state = state
+        else:
+            project.state.advance(phase)
+        return self.satisfied(name)
+
+    def satisfied(self, name: str) -> list:
+        """Re-check only the dependents of ``name`` after it changed phase."""
+        state = self.projects[name].state
+        unblocked = []
+        for dependent, phase in self.dependents[name].items():
+            unmet = self.unmet[dependent]
+            if name in unmet and state.reached(phase):
+                unmet.discard(name)
+                if not unmet:
+                    unblocked.append(dependent)
+        return sorted(unblocked)
+
+    # ────────── gate checks ──────────
+
+    def check(self, jobs: int = None, max_level: int = LEVEL_PLACEHOLDER) -> dict:
+        """Validate projects wave by wave; dependents of a failing project are skipped."""
+        results, failed = {}, set()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for wave in self.waves():
+                runnable = []
+                for name in wave:
+                    if failed.intersection(self.requires[name]):
+                        results[name] = {"status": "skipped", "level": None}
+                        failed.add(name)
+                    else:
+                        runnable.append(name)
+                roots = [self.projects[name].root for name in runnable]
+                levels, _ = validate_projects(roots, jobs=jobs, executor=pool)
+                for name, root in zip(runnable, roots):
+                    level = max(levels[root].values())
+                    ok = level <= max_level
+                    results[name] = {"status": "passed" if ok else "failed", "level": level}
+                    if not ok:
+                        failed.add(name)
+        return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain cross-project dependency scheduler")
+    sub = parser.add_subparsers(dest="command", required=True)
+    plan = sub.add_parser("plan", help="Show waves, blocked projects and the critical path")
+    check = sub.add_parser("check", help="Run gate checks wave by wave in parallel")
+    check.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    check.add_argument("--max-level", type=int, default=LEVEL_PLACEHOLDER, help="Highest passing level")
+    advance = sub.add_parser("advance", help="Advance one project and list what it unblocked")
+    advance.add_argument("root")
+    advance.add_argument("project")
+    advance.add_argument("phase", choices=PHASES)
+    for command in (plan, check):
+        command.add_argument("root", nargs="?", default=".")
+    for command in (plan, check, advance):
+        command.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        graph = DependencyGraph.discover(args.root)
+        if args.command == "plan":
+            path, steps = graph.critical_path()
+            report = {"waves": graph.waves(), "blocked": graph.blocked(), "critical_path": path, "critical_steps": steps}
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                for i, wave in enumerate(report["waves"]):
+                    print(f"🌊 wave {i}: {', '.join(wave)}")
+                for name, unmet in report["blocked"].items():
+                    print(f"⛔ {name} waits on {', '.join(unmet)}")
+                print(f"📏 Critical path: {' → '.join(path) or '-'} ({steps} phase steps)")
+        elif args.command == "check":
+            results = graph.check(args.jobs, args.max_level)
+            if args.json:
+                print(json.dumps(results, indent=2))
+            else:
+                for name, result in results.items():
+                    print(f"{result['status']:>7}  {name}  (LEVEL {result['level']})")
+            return int(any(r["status"] != "passed" for r in results.values()))
+        else:
+            unblocked = graph.advance(args.project, args.phase)
+            if args.json:
+                print(json.dumps({"project": args.project, "phase": args.phase, "unblocked": unblocked}))
+            else:
+                print(f"✅ Advanced '{args.project}' to '{args.phase}'")
+                for name in unblocked:
+                    print(f"🔓 Unblocked: {name}")
+    except (DependencyError, TransitionError) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
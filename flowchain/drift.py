@@ -0,0 +1,273 @@
+"""Doc ↔ code drift engine.
+
+Builds a graph from every Markdown doc to the repository paths it names
+(inline code spans such as `generate_issues.py` and quoted strings such as
+"lang-hooks/python/runner.py"). The graph is persisted in ``.flowchain/cache``;
+on a PR only the docs touched by ``git diff``, and the docs that reference a
+touched file, are re-evaluated.
+
+    python -m flowchain.drift --base origin/main [--json]
+    python -m flowchain.drift --rebuild
+"""
+
+import argparse
+import json
+import posixpath
+import re
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from flowchain.cache import CACHE_DIR, write_json
+from flowchain.sections import index_document
+
+GRAPH_FILE = "drift.json"
+GRAPH_VERSION = 1
+
+DOC_SUFFIX = ".md"
+PATH_EXTENSIONS = {"py", "md", "json", "jsonl", "yml", "yaml", "sh", "txt", "toml", "js", "ts", "java", "env", "example"}
+
+_REFERENCE = re.compile(rb'`([^`\s]+)`|"([^"\s]+)"')
+_PATH_CHARS = re.compile(r"^[\w.\-/]+$")
+
+
+def looks_like_path(text: str, top_dirs=frozenset(), root: Path = None) -> bool:
+    """A known file extension, or a ``dir/...`` token under a tracked top-level dir or existing under ``root``.
+
+    Extension-less slashed tokens such as "application/json" or "owner/repo"
+    are not paths unless the repository says otherwise.
+    """
+    if "://" in text or not _PATH_CHARS.match(text) or text.strip("./") == "":
+        return False
+    name = text.rstrip("/").rsplit("/", 1)[-1]
+    ext = name.rsplit(".", 1)[-1] if "." in name[1:] else ""
+    if ext in PATH_EXTENSIONS:
+        return True
+    if "/" not in text or ext:
+        return False
+    key = text.strip("/").removeprefix("./")
+    return key.split("/", 1)[0] in top_dirs or (root is not None and (Path(root) / key).exists())
+
+
+def extract_references(path: Path, top_dirs=frozenset(), root: Path = None) -> list:
+    """Return sorted ``[ref, section]`` pairs named in one doc."""
+    index = index_document(path)
+    data = index.read_bytes(0, index.size)
+    refs = set()
+    for match in _REFERENCE.finditer(data):
+        text = (match.group(1) or match.group(2)).decode("utf-8", "replace")
+        if looks_like_path(text, top_dirs, root):
+            refs.add((text, index.section_at(match.start()).title))
+    return sorted([ref, section] for ref, section in refs)
+
+
+def _git(root: Path, *args) -> str:
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+def _parse_name_status(output: str) -> list:
+    """``git diff --name-status -z`` → ``[(status, path)]``; renames become delete + add."""
+    fields = output.split("\0")
+    changes, i = [], 0
+    while i < len(fields) - 1:
+        status = fields[i][:1]
+        if status in "RC":
+            if status == "R":
+                changes.append(("D", fields[i + 1]))
+            changes.append(("A", fields[i + 2]))
+            i += 3
+        else:
+            changes.append((status, fields[i + 1]))
+            i += 2
+    return changes
+
+
+class DriftGraph:
+    def __init__(self, root: Path = "."):
+        self.root = Path(root)
+        self.path = self.root / CACHE_DIR / GRAPH_FILE
+        self.docs = {}  # doc → [[ref, section], ...]
+        self.files = set()
+        self.head = None
+        self._basenames = defaultdict(set)
+        self._dirs = Counter()
+        self._referrers = defaultdict(set)  # ref key → docs
+
+    # ────────── indexes ──────────
+
+    def _add_file(self, file: str):
+        if file in self.files:
+            return
+        self.files.add(file)
+        self._basenames[posixpath.basename(file)].add(file)
+        parent = posixpath.dirname(file)
+        while parent:
+            self._dirs[parent] += 1
+            parent = posixpath.dirname(parent)
+
+    def _remove_file(self, file: str):
+        if file not in self.files:
+            return
+        self.files.discard(file)
+        self._basenames[posixpath.basename(file)].discard(file)
+        parent = posixpath.dirname(file)
+        while parent:
+            self._dirs[parent] -= 1
+            if not self._dirs[parent]:
+                del self._dirs[parent]
+            parent = posixpath.dirname(parent)
+
+    @staticmethod
+    def _ref_key(ref: str) -> str:
+        return ref.strip("/").removeprefix("./")
+
+    def _set_doc(self, doc: str, refs: list):
+        for ref, _ in self.docs.pop(doc, []):
+            key = self._ref_key(ref)
+            self._referrers[key].discard(doc)
+            self._referrers[posixpath.basename(key)].discard(doc)
+        if refs is None:
+            return
+        self.docs[doc] = refs
+        for ref, _ in refs:
+            key = self._ref_key(ref)
+            self._referrers[key].add(doc)
+            self._referrers[posixpath.basename(key)].add(doc)
+
+    def resolve(self, doc: str, ref: str) -> list:
+        """Return the tracked paths ``ref`` points at from ``doc`` (empty if missing)."""
+        key = self._ref_key(ref)
+        for candidate in (key, posixpath.normpath(posixpath.join(posixpath.dirname(doc), key))):
+            if candidate in self.files or candidate in self._dirs:
+                return [candidate]
+        if "/" not in key:
+            return sorted(self._basenames.get(key, ()))
+        return []
+
+    def _extract(self, doc: str) -> list:
+        top_dirs = {parent for parent in self._dirs if "/" not in parent}
+        return extract_references(self.root / doc, top_dirs, self.root)
+
+    def referrers(self, file: str) -> set:
+        """Docs whose references may resolve to ``file``: by path, by basename or by parent dir."""
+        docs = set(self._referrers.get(file, ())) | self._referrers.get(posixpath.basename(file), set())
+        parent = posixpath.dirname(file)
+        while parent:
+            docs |= self._referrers.get(parent, set())
+            parent = posixpath.dirname(parent)
+        return docs
+
+    # ────────── build / update ──────────
+
+    def rebuild(self):
+        self.__init__(self.root)
+        for file in _git(self.root, "ls-files", "-z").split("\0"):
+            if file:
+                self._add_file(file)
+        for file in sorted(self.files):
+            if file.endswith(DOC_SUFFIX) and (self.root / file).is_file():
+                self._set_doc(file, self._extract(file))
+        self.head = _git(self.root, "rev-parse", "HEAD").strip()
+        return set(self.docs)
+
+    def apply(self, changes: list) -> tuple:
+        """Fold ``[(status, path)]`` into the graph; return ``(docs to re-evaluate, changed paths)``."""
+        affected, changed = set(), set()
+        for status, file in changes:
+            changed.add(file)
+            if status == "D":
+                self._remove_file(file)
+                if file in self.docs:
+                    self._set_doc(file, None)
+            else:
+                self._add_file(file)
+                if file.endswith(DOC_SUFFIX) and (self.root / file).is_file():
+                    self._set_doc(file, self._extract(file))
+                    affected.add(file)
+            affected |= self.referrers(file)
+        return affected & set(self.docs), changed
+
+    def evaluate(self, docs, changed=frozenset()) -> dict:
+        missing, stale = [], []
+        for doc in sorted(docs):
+            for ref, section in self.docs[doc]:
+                targets = self.resolve(doc, ref)
+                if not targets:
+                    missing.append({"doc": doc, "section": section, "ref": ref})
+                elif doc not in changed:
+                    for target in targets:
+                        if target in changed:
+                            stale.append({"doc": doc, "section": section, "ref": ref, "target": target})
+        return {"evaluated_docs": len(docs), "missing": missing, "changed": stale}
+
+    # ────────── persistence ──────────
+
+    def load(self) -> bool:
+        try:
+            payload = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return False
+        if payload.get("version") != GRAPH_VERSION:
+            return False
+        for file in payload["files"]:
+            self._add_file(file)
+        for doc, refs in payload["docs"].items():
+            self._set_doc(doc, refs)
+        self.head = payload.get("head")
+        return True
+
+    def save(self):
+        payload = {"version": GRAPH_VERSION, "head": self.head, "files": sorted(self.files), "docs": self.docs}
+        write_json(self.path, payload, sort_keys=True)
+
+
+def _changes(root: Path, *revisions: str) -> list:
+    return _parse_name_status(_git(root, "diff", "--name-status", "-z", *revisions))
+
+
+def check_drift(root: Path = ".", base: str = None, rebuild: bool = False) -> dict:
+    graph = DriftGraph(root)
+    pr_range = [f"{base}...HEAD"] if base else []
+    changes = None
+    if not rebuild and graph.load():
+        try:
+            # Working-tree changes since the last persisted HEAD, plus the PR range.
+            changes = _changes(graph.root, graph.head) + (_changes(graph.root, *pr_range) if base else [])
+        except subprocess.CalledProcessError:
+            changes = None  # persisted HEAD is not in this clone
+    if changes is None:
+        docs = graph.rebuild()
+        changed = {file for _, file in _changes(graph.root, *pr_range)} if base else set()
+    else:
+        docs, changed = graph.apply(changes)
+        graph.head = _git(graph.root, "rev-parse", "HEAD").strip()
+    report = graph.evaluate(docs, changed)
+    graph.save()
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain doc/code drift watcher")
+    parser.add_argument("--root", default=".", help="Repository root (default: .)")
+    parser.add_argument("--base", help="Compare against BASE...HEAD (e.g. origin/main)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the persisted graph")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = check_drift(Path(args.root), args.base, args.rebuild)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔍 Evaluated {report['evaluated_docs']} doc(s)")
+        for item in report["missing"]:
+            print(f"❌ {item['doc']} ({item['section'] or 'preamble'}): `{item['ref']}` does not exist")
+        for item in report["changed"]:
+            print(f"⚠  {item['doc']} ({item['section'] or 'preamble'}): `{item['target']}` changed, doc did not")
+        if not report["missing"] and not report["changed"]:
+            print("✅ No drift detected")
+    return int(bool(report["missing"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Append-only event log for FlowChain state.
+
+Agents append one JSON line per event to ``flow_events.jsonl`` instead of
+rewriting ``flow_state.json``. Every ``SNAPSHOT_EVERY`` events the log is
+compacted: the replayed state is written back to ``flow_state.json`` (the
+snapshot) together with the byte offset it covers, so reconstructing the
+current state only replays the short tail after that offset.
+:meth:`flowchain.state.FlowState.load` does that replay whenever a log
+exists, so readers never see the snapshot alone.
+
+    python -m flowchain.events append transition design_ready --agent review
+    python -m flowchain.events phase-at 2025-04-02T03:13:54
+    python -m flowchain.events compact
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from flowchain.state import PHASE_INDEX, PHASES, STATE_FILE, FlowState, TransitionError, locked
+
+EVENT_LOG = "flow_events.jsonl"
+SNAPSHOT_EVERY = 256
+
+EVENT_TYPES = ("transition", "score", "override")
+
+
+def apply_event(state: FlowState, event: dict):
+    kind = event.get("type")
+    if kind == "transition":
+        state.advance(event["phase"])
+    elif kind == "score":
+        state.last_validated_score = event["value"]
+    elif kind == "override":
+        state.override_flags.append(event["flag"])
+
+
+def _changes(before: tuple, state: FlowState) -> list:
+    """Events that turn a state with ``before`` = (step, score, override count) into ``state``."""
+    step, score, overrides = before
+    events = [{"type": "transition", "phase": phase} for phase in PHASES[PHASE_INDEX[step] + 1:state._index + 1]]
+    if state.last_validated_score != score:
+        events.append({"type": "score", "value": state.last_validated_score})
+    events += [{"type": "override", "flag": flag} for flag in state.override_flags[overrides:]]
+    return events
+
+
+class EventLog:
+    def __init__(self, root: Path = ".", state_path: Path = None):
+        self.root = Path(root)
+        self.state_path = Path(state_path) if state_path else self.root / STATE_FILE
+        self.log_path = self.root / EVENT_LOG
+
+    @classmethod
+    def for_state(cls, state_path: Path) -> "EventLog":
+        return cls(Path(state_path).parent, state_path)
+
+    # ────────── reading ──────────
+
+    def _snapshot(self) -> FlowState:
+        return FlowState.read(self.state_path)
+
+    def _tail(self, offset: int):
+        """Yield ``(end_offset, event)`` for every complete line after ``offset``."""
+        try:
+            handle = self.log_path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            handle.seek(offset)
+            for line in handle:
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break  # a torn final write; ignored until completed
+                try:
+                    yield offset, json.loads(line)
+                except ValueError:
+                    continue
+
+    def replay(self):
+        """Return ``(state, end_offset, tail_events)`` from the snapshot plus the log tail."""
+        state = self._snapshot()
+        offset = state.extra.get("event_offset", 0)
+        timeline = state.extra.setdefault("phase_timeline", [])
+        count = 0
+        for offset, event in self._tail(offset):
+            apply_event(state, event)
+            if event.get("type") == "transition":
+                timeline.append([event["ts"], event["phase"]])
+            count += 1
+        return state, offset, count
+
+    def current(self) -> FlowState:
+        return self.replay()[0]
+
+    def phase_at(self, ts: float):
+        """Return the phase the project was in at Unix time ``ts`` (``None`` if unknown)."""
+        state = self.current()
+        timeline = state.extra["phase_timeline"]
+        i = bisect.bisect_right([entry[0] for entry in timeline], ts)
+        if i:
+            return timeline[i - 1][1]
+        if timeline:
+            # Before the first logged transition: the phase it moved on from.
+            first = PHASE_INDEX[timeline[0][1]]
+            return PHASES[first - 1] if first else None
+        return state.current_step
+
+    # ────────── writing ──────────
+
+    def _write(self, event: dict):
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        with self.log_path.open("ab") as handle:
+            if handle.tell():
+                with self.log_path.open("rb") as check:
+                    check.seek(-1, os.SEEK_END)
+                    if check.read(1) != b"\n":
+                        line = b"\n" + line
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def append(self, kind: str, agent: str = None, **data) -> dict:
+        """Validate ``kind`` against the replayed state and append it; O(tail), not O(history)."""
+        if kind not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type '{kind}'. Expected one of: {', '.join(EVENT_TYPES)}")
+        event = {"ts": time.time(), "type": kind, "agent": agent, **data}
+        with locked(self.state_path):
+            state, _, count = self.replay()
+            apply_event(state, event)
+            self._write(event)
+            if count + 1 >= SNAPSHOT_EVERY:
+                self._compact()
+        return event
+
+    def _compact(self):
+        state, offset, _ = self.replay()
+        state.extra["event_offset"] = offset
+        state.save(self.state_path)
+
+    @contextmanager
+    def transaction(self, agent: str = None):
+        """Mutate the replayed state under the lock; the change is logged and snapshotted.
+
+        This is what :func:`flowchain.state.transaction` uses when a log exists, so
+        direct writers never leave ``event_offset`` behind the log.
+        """
+        with locked(self.state_path):
+            state, _, _ = self.replay()
+            before = (state.current_step, state.last_validated_score, len(state.override_flags))
+            yield state
+            timeline = state.extra["phase_timeline"]
+            for change in _changes(before, state):
+                event = {"ts": time.time(), "agent": agent, **change}
+                self._write(event)
+                if event["type"] == "transition":
+                    timeline.append([event["ts"], event["phase"]])
+            state.extra["event_offset"] = self.log_path.stat().st_size
+            state.save(self.state_path)
+
+    def compact(self):
+        """Fold the log tail into ``flow_state.json``."""
+        with locked(self.state_path):
+            self._compact()
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain event log")
+    parser.add_argument("--root", default=".", help="Project directory (default: .)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    append = sub.add_parser("append", help="Append an event")
+    append.add_argument("type", choices=EVENT_TYPES)
+    append.add_argument("value", help="Phase, score or override flag")
+    append.add_argument("--agent")
+    at = sub.add_parser("phase-at", help="Phase at a Unix timestamp or ISO date")
+    at.add_argument("when")
+    sub.add_parser("show", help="Print the reconstructed state")
+    sub.add_parser("compact", help="Write a snapshot into flow_state.json")
+    args = parser.parse_args(argv)
+
+    log = EventLog(args.root)
+    try:
+        if args.command == "append":
+            key = {"transition": "phase", "score": "value", "override": "flag"}[args.type]
+            value = int(args.value) if args.type == "score" else args.value
+            log.append(args.type, agent=args.agent, **{key: value})
+            print(f"✅ Logged {args.type}: {args.value}")
+        elif args.command == "phase-at":
+            print(log.phase_at(_parse_time(args.when)))
+        elif args.command == "show":
+            print(json.dumps(log.current().to_dict(), indent=2, ensure_ascii=False))
+        else:
+            log.compact()
+            print(f"✅ Snapshot written to {log.state_path}")
+    except TransitionError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""JSON ↔ Markdown contradiction detection ("Mirror JSON and Markdown inputs").
+
+Facts — project name, tech stack, features, integrations, definition of
+done and phase progress — are extracted from ``project_form.json``,
+``flow_state.json`` and the Markdown docs into a store keyed by subject. Two
+sources asserting different values for one subject is a contradiction
+(LEVEL 3), found without anyone typing the marker by hand.
+
+The store is persisted in ``.flowchain/cache/facts.json`` with a (mtime,
+size, SHA-256) signature per source, so only changed files are re-extracted
+and only their subjects are re-compared.
+
+Markdown conventions read:
+
+* ``# Doc Title – Project`` (H1) names the project, as templates/ renders it
+* ``- ✅ Design Locked`` / ``- [x] Build Started`` claim a phase was reached
+* ``## Tech Stack`` (``- Languages: Python, Bash``), ``## Features``,
+  ``## Integrations`` and ``## Definition of Done`` mirror the form fields
+
+    python -m flowchain.facts [ROOT] [--state core/flow_state.json] [--json]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from flowchain.cache import CACHE_DIR, RACY_WINDOW_NS, file_digest, write_json
+from flowchain.sections import index_document
+from flowchain.state import PHASE_FLAGS, PHASE_INDEX, PHASES, STATE_FILE
+from flowchain.validate import LEVEL_CONTRADICTION, LEVEL_VALID, PLACEHOLDER_MARKER
+
+FORM_FILE = "project_form.json"
+STORE_FILE = "facts.json"
+# Bump whenever extraction changes so stored facts are discarded.
+EXTRACTOR_VERSION = "1"
+
+DOC_DIRS = (".", "docs")
+TECH_CATEGORIES = ("languages", "frameworks", "platforms", "tools")
+
+# Checklist phrasing → the phase it claims (docs/SIMULATION_REPORT.md "Stage Completion").
+PHASE_CLAIMS = {
+    "idea captured": "idea_captured",
+    "validation": "validation_passed",
+    "scaffold generated": "scaffold_generated",
+    "design locked": "design_ready",
+    "design ready": "design_ready",
+    "design complete": "design_ready",
+    "build started": "build_started",
+    "review passed": "review_passed",
+    "released": "released",
+}
+
+_CLAIM = re.compile(r"^\s*[-*]\s*(?:✅|\[[xX]\])\s*(.+?)\s*$", re.MULTILINE)
+_BULLET = re.compile(r"^\s*[-*]\s+(?:\[[ xX]\]\s*)?(.+?)\s*$", re.MULTILINE)
+_TITLE_SPLIT = re.compile(r"\s+[–—-]\s+")
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+_DECORATION = re.compile(r"[*_`]|^[^\w]+")
+
+
+def _norm(text: str) -> str:
+    return " ".join(_DECORATION.sub("", text).split()).rstrip(".").lower()
+
+
+def _items(values) -> list:
+    return sorted({_norm(v) for v in values if isinstance(v, str) and PLACEHOLDER_MARKER not in v and _norm(v)})
+
+
+# ────────────────────────────────
+# 🔎 EXTRACTION
+# ────────────────────────────────
+
+
+def _fact(subject: str, value, where: str) -> dict:
+    return {"subject": subject, "value": value, "where": where}
+
+
+def extract_form(path: Path) -> list:
+    data = json.loads(path.read_text())
+    facts = []
+    name = data.get("project_name")
+    if isinstance(name, str) and PLACEHOLDER_MARKER not in name:
+        facts.append(_fact("project_name", _norm(name), "project_name"))
+    for category, values in (data.get("tech_stack") or {}).items():
+        if items := _items(values):
+            facts.append(_fact(f"tech_stack.{category}", items, f"tech_stack.{category}"))
+    if features := _items(data.get("features") or []):
+        facts.append(_fact("features", features, "features"))
+    if integrations := _items(data.get("integrations") or {}):
+        facts.append(_fact("integrations", integrations, "integrations"))
+    done = data.get("definition_of_done")
+    if isinstance(done, str) and PLACEHOLDER_MARKER not in done and done.strip():
+        facts.append(_fact("definition_of_done", _norm(done), "definition_of_done"))
+    return facts
+
+
+def extract_state(path: Path) -> list:
+    data = json.loads(path.read_text())
+    facts = []
+    if isinstance(data.get("project_name"), str):
+        facts.append(_fact("project_name", _norm(data["project_name"]), "project_name"))
+    current = PHASE_INDEX.get(data.get("current_step"))
+    if current is not None:
+        facts.append(_fact("current_step", PHASES[current], "current_step"))
+    flags = {phase: flag for flag, phase in PHASE_FLAGS.items()}
+    for phase in PHASES:
+        flag = flags.get(phase)
+        if flag and isinstance(data.get(flag), bool):
+            facts.append(_fact(f"phase.{phase}", data[flag], flag))
+        elif current is not None:
+            facts.append(_fact(f"phase.{phase}", PHASE_INDEX[phase] <= current, "current_step"))
+    return facts
+
+
+def extract_markdown(path: Path) -> list:
+    index = index_document(path)
+    facts = []
+    for section in index.sections:
+        if section.level == 1:
+            parts = _TITLE_SPLIT.split(_PARENTHETICAL.sub("", section.title), maxsplit=1)
+            if len(parts) == 2 and _norm(parts[1]):
+                facts.append(_fact("project_name", _norm(parts[1]), section.title))
+                break
+    phase = index.front_matter.get("phase")
+    if phase in PHASE_INDEX:
+        facts.append(_fact("current_step", phase, "front matter"))
+
+    text = index.read_bytes(0, index.size).decode("utf-8", "replace")
+    for match in _CLAIM.finditer(text):
+        claim = _norm(match.group(1))
+        for phrase, claimed in PHASE_CLAIMS.items():
+            if claim.startswith(phrase):
+                facts.append(_fact(f"phase.{claimed}", True, index.section_at(match.start()).title or "preamble"))
+                break
+
+    for section in index.sections:
+        key = _norm(section.title)
+        if key not in ("tech stack", "features", "integrations", "definition of done"):
+            continue
+        body = index.read(section, include_heading=False)
+        if PLACEHOLDER_MARKER in body:
+            continue
+        bullets = [m.group(1) for m in _BULLET.finditer(body)]
+        if key == "tech stack":
+            stack = {}
+            for bullet in bullets:
+                category, sep, values = bullet.partition(":")
+                category = _norm(category)
+                if sep and category in TECH_CATEGORIES:
+                    stack.setdefault(category, []).extend(values.split(","))
+            for category, values in stack.items():
+                if items := _items(values):
+                    facts.append(_fact(f"tech_stack.{category}", items, section.title))
+        elif key == "features" and (items := _items(bullets)):
+            facts.append(_fact("features", items, section.title))
+        elif key == "integrations" and (items := _items(re.split(r":|\s[–—-]\s", b, maxsplit=1)[0] for b in bullets)):
+            facts.append(_fact("integrations", items, section.title))
+        elif key == "definition of done" and (done := _norm(body)):
+            facts.append(_fact("definition_of_done", done, section.title))
+    return facts
+
+
+def extract(path: Path) -> list:
+    if path.name == FORM_FILE or path.name.endswith(".form.json"):
+        return extract_form(path)
+    if path.suffix == ".json":
+        return extract_state(path)
+    return extract_markdown(path)
+
+
+# ────────────────────────────────
+# 🗃 FACT STORE
+# ────────────────────────────────
+
+
+class FactStore:
+    def __init__(self, root: Path = "."):
+        self.root = Path(root)
+        self.path = self.root / CACHE_DIR / STORE_FILE
+        self.files = {}  # source → {"mtime_ns", "size", "sha256", "racy", "facts"}
+        self.subjects = {}  # subject → {source: fact}
+        self.conflicts = {}  # subject → conflict
+        self.extracted = 0
+
+    def load(self) -> bool:
+        try:
+            payload = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return False
+        if payload.get("version") != EXTRACTOR_VERSION:
+            return False
+        self.files = payload["files"]
+        self.conflicts = payload["conflicts"]
+        for source, entry in self.files.items():
+            self._index(source, entry["facts"])
+        return True
+
+    def save(self):
+        write_json(self.path, {"version": EXTRACTOR_VERSION, "files": self.files, "conflicts": self.conflicts},
+                   sort_keys=True, ensure_ascii=False)
+
+    def _index(self, source: str, facts: list):
+        for fact in facts:
+            self.subjects.setdefault(fact["subject"], {})[source] = fact
+
+    def _drop(self, source: str) -> set:
+        entry = self.files.pop(source, None)
+        if entry is None:
+            return set()
+        subjects = {fact["subject"] for fact in entry["facts"]}
+        for subject in subjects:
+            self.subjects[subject].pop(source, None)
+        return subjects
+
+    def refresh(self, sources: list) -> set:
+        """Re-extract changed sources (paths relative to the root) and forget vanished ones.
+
+        Returns the subjects whose facts changed.
+        """
+        touched = set()
+        wanted = set(map(os.fspath, sources))
+        for source in set(self.files) - wanted:
+            touched |= self._drop(source)
+        for source in sorted(wanted):
+            path = self.root / source
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                touched |= self._drop(source)
+                continue
+            entry = self.files.get(source)
+            if entry and not entry["racy"] and (entry["mtime_ns"], entry["size"]) == (st.st_mtime_ns, st.st_size):
+                continue
+            digest = file_digest(path.read_bytes())
+            if entry and entry["sha256"] == digest:
+                facts = entry["facts"]
+            else:
+                try:
+                    facts = extract(path)
+                except ValueError as e:
+                    facts = []
+                    print(f"⚠️  Skipped {source}: {e}", file=sys.stderr)
+                self.extracted += 1
+                touched |= self._drop(source)
+                touched |= {fact["subject"] for fact in facts}
+                self._index(source, facts)
+            self.files[source] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": digest,
+                "racy": time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS,
+                "facts": facts,
+            }
+        return touched
+
+    def compare(self, subjects) -> None:
+        """Recompute the conflict for each subject: more than one distinct value across sources."""
+        for subject in subjects:
+            groups = {}
+            for source, fact in sorted(self.subjects.get(subject, {}).items()):
+                key = json.dumps(fact["value"], sort_keys=True)
+                groups.setdefault(key, []).append({"source": source, "where": fact["where"]})
+            if len(groups) > 1:
+                self.conflicts[subject] = {
+                    "subject": subject,
+                    "values": [{"value": json.loads(key), "sources": found} for key, found in groups.items()],
+                }
+            else:
+                self.conflicts.pop(subject, None)
+
+
+def doc_sources(root: Path) -> list:
+    """The Markdown files under ``root`` (and its ``docs/``) that facts are extracted from."""
+    root = Path(root)
+    return [path for directory in DOC_DIRS for path in sorted((root / directory).glob("*.md"))]
+
+
+def default_sources(root: Path, state: Path = None, form: Path = None, docs: list = ()) -> list:
+    """Sources relative to ``root``: the state, the form, ``root``'s docs and any extra ``docs`` paths."""
+    root = Path(root)
+    sources = [state or root / STATE_FILE, form or root / FORM_FILE, *doc_sources(root), *docs]
+    return list(dict.fromkeys(os.path.relpath(source, root) for source in sources))
+
+
+def check_facts(root: Path = ".", sources: list = None, rebuild: bool = False) -> dict:
+    store = FactStore(root)
+    if rebuild or not store.load():
+        store = FactStore(root)
+    touched = store.refresh(sources if sources is not None else default_sources(root))
+    store.compare(touched)
+    store.save()
+    return {
+        "sources": len(store.files),
+        "extracted": store.extracted,
+        "facts": sum(len(entry["facts"]) for entry in store.files.values()),
+        "conflicts": sorted(store.conflicts.values(), key=lambda conflict: conflict["subject"]),
+    }
+
+
+def conflicted_sources(report: dict) -> set:
+    return {found["source"] for conflict in report["conflicts"] for value in conflict["values"] for found in value["sources"]}
+
+
+def describe_conflict(conflict: dict) -> str:
+    claims = "; ".join(
+        f"{value['value']!r} in " + ", ".join(f"{s['source']} ({s['where']})" for s in value["sources"])
+        for value in conflict["values"]
+    )
+    return f"🚨 {conflict['subject']}: {claims}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain JSON ↔ Markdown contradiction check")
+    parser.add_argument("root", nargs="?", default=".", help="Project directory (default: .)")
+    parser.add_argument("--state", type=Path, help=f"State file (default: ROOT/{STATE_FILE})")
+    parser.add_argument("--form", type=Path, help=f"Project form (default: ROOT/{FORM_FILE})")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the persisted fact store")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    report = check_facts(root, default_sources(root, args.state, args.form), args.rebuild)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔎 {report['facts']} facts from {report['sources']} file(s), {report['extracted']} re-extracted")
+        for conflict in report["conflicts"]:
+            print(describe_conflict(conflict))
+        if not report["conflicts"]:
+            print("✅ JSON and Markdown agree")
+    return LEVEL_CONTRADICTION if report["conflicts"] else LEVEL_VALID
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Project intake form validator.
+
+The schema for ``templates/project_form.example.json`` is compiled once into
+two closures per node: a fast ``ok(value)`` predicate that answers the common
+"form is fine" case without building paths or messages, and an ``explain``
+pass that only runs on forms that failed it. JSONL files are streamed a line
+at a time, so memory stays flat however many forms they hold.
+
+    python -m flowchain.forms templates/project_form.example.json
+    python -m flowchain.forms --json submissions.jsonl
+    python -m flowchain.forms --field form intake.jsonl
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowchain.validate import (
+    LEVEL_FILE_MISSING,
+    LEVEL_MISSING_SECTION,
+    LEVEL_PLACEHOLDER,
+    LEVEL_VALID,
+    PLACEHOLDER_MARKER,
+)
+
+# ────────────────────────────────
+# 📋 SCHEMA
+# ────────────────────────────────
+
+SUPPORTED_MAJOR = "1"
+VERSION = re.compile(rf"^{SUPPORTED_MAJOR}\.\d+(-[0-9A-Za-z.]+)?$")
+PROJECT_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+# ``str`` is any string, a compiled pattern is a string that must match it,
+# ``[spec]`` is a list of ``spec``, ``{str: spec}`` is a free-form mapping and
+# any other dict is an object whose keys are all required and the only ones
+# allowed.
+PROJECT_FORM_SCHEMA = {
+    "project_name": PROJECT_NAME,
+    "description": str,
+    "purpose": str,
+    "tech_stack": {
+        "languages": [str],
+        "frameworks": [str],
+        "platforms": [str],
+        "tools": [str],
+    },
+    "features": [str],
+    "integrations": {str: str},
+    "definition_of_done": str,
+    "flowchain_version": VERSION,
+    "state_dependencies": {
+        "requires": [str],
+        "unlocks": [str],
+    },
+}
+
+CODE_LEVELS = {
+    "placeholder": LEVEL_PLACEHOLDER,
+    "missing_field": LEVEL_MISSING_SECTION,
+    "unknown_field": LEVEL_MISSING_SECTION,
+    "type": LEVEL_MISSING_SECTION,
+    "format": LEVEL_MISSING_SECTION,
+    "json": LEVEL_FILE_MISSING,
+    "file": LEVEL_FILE_MISSING,
+}
+
+
+@dataclass(slots=True)
+class FormError:
+    path: str
+    code: str
+    message: str
+
+    @property
+    def level(self) -> int:
+        return CODE_LEVELS[self.code]
+
+
+@dataclass(slots=True)
+class FormResult:
+    source: str
+    line: int
+    errors: list = field(default_factory=list)
+
+    @property
+    def level(self) -> int:
+        return max((e.level for e in self.errors), default=LEVEL_VALID)
+
+    def to_dict(self) -> dict:
+        return {
+            "source": self.source,
+            "line": self.line,
+            "level": self.level,
+            "errors": [{"path": e.path, "code": e.code, "message": e.message} for e in self.errors],
+        }
+
+
+# ────────────────────────────────
+# ⚙️ COMPILER
+# ────────────────────────────────
+
+def _child(where: str, key) -> str:
+    if isinstance(key, int):
+        return f"{where}[{key}]"
+    return f"{where}.{key}" if where else key
+
+
+def _compile(spec):
+    """Return ``(ok, explain)`` closures for one schema node."""
+    if spec is str or isinstance(spec, re.Pattern):
+        match = spec.match if isinstance(spec, re.Pattern) else None
+
+        def ok(value):
+            return (
+                type(value) is str
+                and PLACEHOLDER_MARKER not in value
+                and (match is None or match(value) is not None)
+            )
+
+        def explain(value, where, errors):
+            if type(value) is not str:
+                errors.append(FormError(where, "type", f"expected string, got {type(value).__name__}"))
+            elif PLACEHOLDER_MARKER in value:
+                errors.append(FormError(where, "placeholder", "still contains a placeholder"))
+            elif match is not None and match(value) is None:
+                errors.append(FormError(where, "format", f"{value!r} does not match {spec.pattern}"))
+
+        return ok, explain
+
+    if isinstance(spec, list):
+        item_ok, item_explain = _compile(spec[0])
+
+        def ok(value):
+            return type(value) is list and all(map(item_ok, value))
+
+        def explain(value, where, errors):
+            if type(value) is not list:
+                errors.append(FormError(where, "type", f"expected list, got {type(value).__name__}"))
+                return
+            for i, item in enumerate(value):
+                if not item_ok(item):
+                    item_explain(item, _child(where, i), errors)
+
+        return ok, explain
+
+    if set(spec) == {str}:
+        value_ok, value_explain = _compile(spec[str])
+
+        def ok(value):
+            return type(value) is dict and all(map(value_ok, value.values()))
+
+        def explain(value, where, errors):
+            if type(value) is not dict:
+                errors.append(FormError(where, "type", f"expected object, got {type(value).__name__}"))
+                return
+            for key, item in value.items():
+                if not value_ok(item):
+                    value_explain(item, _child(where, key), errors)
+
+        return ok, explain
+
+    fields = {name: _compile(sub) for name, sub in spec.items()}
+    checks = tuple((name, ok) for name, (ok, _) in fields.items())
+    allowed = frozenset(fields)
+
+    def ok(value):
+        if type(value) is not dict or value.keys() != allowed:
+            return False
+        for name, check in checks:
+            if not check(value[name]):
+                return False
+        return True
+
+    def explain(value, where, errors):
+        if type(value) is not dict:
+            errors.append(FormError(where or "$", "type", f"expected object, got {type(value).__name__}"))
+            return
+        for name in sorted(value.keys() - allowed):
+            errors.append(FormError(_child(where, name), "unknown_field", "not part of the project form"))
+        for name, (check, detail) in fields.items():
+            if name not in value:
+                errors.append(FormError(_child(where, name), "missing_field", "required field is missing"))
+            elif not check(value[name]):
+                detail(value[name], _child(where, name), errors)
+
+    return ok, explain
+
+
+class FormValidator:
+    """A schema compiled once and reused for every form."""
+
+    def __init__(self, schema: dict = PROJECT_FORM_SCHEMA):
+        self._ok, self._explain = _compile(schema)
+
+    def validate(self, form) -> list:
+        """Return the list of :class:`FormError` for ``form`` (empty when valid)."""
+        if self._ok(form):
+            return []
+        errors = []
+        self._explain(form, "", errors)
+        return errors
+
+    def validate_file(self, path: Path) -> FormResult:
+        """Validate a single pretty-printed ``.json`` form; an unreadable file is a failed result."""
+        result = FormResult(str(path), 0)
+        try:
+            form = json.loads(Path(path).read_bytes())
+        except OSError as e:
+            result.errors.append(FormError("$", "file", e.strerror or str(e)))
+        except ValueError as e:  # JSONDecodeError, or bytes that are not UTF-8/16/32
+            result.errors.append(FormError("$", "json", str(e)))
+        else:
+            result.errors = self.validate(form)
+        return result
+
+    def validate_stream(self, path: Path, key: str = None):
+        """Yield a :class:`FormResult` per non-blank line of a JSONL file.
+
+        A file that cannot be opened or read ends with one failed result (line 0,
+        or the last line read) instead of raising.
+        """
+        source = str(path)
+        number = 0
+        try:
+            with open(path, "rb") as handle:
+                for number, line in enumerate(handle, 1):
+                    if not line.strip():
+                        continue
+                    result = FormResult(source, number)
+                    try:
+                        form = json.loads(line)
+                        if key is not None:
+                            form = form[key]
+                    except ValueError as e:  # JSONDecodeError, or bytes that are not UTF-8/16/32
+                        result.errors.append(FormError("$", "json", str(e)))
+                    except (KeyError, TypeError):
+                        result.errors.append(FormError(key, "missing_field", "wrapper has no form under this key"))
+                    else:
+                        result.errors = self.validate(form)
+                    yield result
+        except OSError as e:
+            yield FormResult(source, number, [FormError("$", "file", e.strerror or str(e))])
+
+
+def iter_results(paths, key: str = None, validator: FormValidator = None):
+    validator = validator or FormValidator()
+    for path in paths:
+        if Path(path).suffix == ".jsonl":
+            yield from validator.validate_stream(path, key)
+        else:
+            yield validator.validate_file(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate FlowChain project forms")
+    parser.add_argument("paths", nargs="+", help=".json forms or .jsonl files with one form per line")
+    parser.add_argument("--field", help="For JSONL: read the form from this key of each line")
+    parser.add_argument("--json", action="store_true", help="Print one JSON line per invalid form")
+    parser.add_argument(
+        "--max-level",
+        type=int,
+        help="Exit 1 only if any form exceeds this level (default: exit with the worst level)",
+    )
+    args = parser.parse_args(argv)
+
+    total = invalid = worst = 0
+    for result in iter_results(args.paths, args.field):
+        total += 1
+        if not result.errors:
+            continue
+        invalid += 1
+        worst = max(worst, result.level)
+        if args.json:
+            print(json.dumps(result.to_dict()))
+            continue
+        where = f"{result.source}:{result.line}" if result.line else result.source
+        for error in result.errors:
+            print(f"LEVEL {error.level}: {where}: {error.path}: {error.message}")
+
+    if not args.json:
+        print(f"📋 {total} forms checked, {invalid} invalid, worst level {worst}")
+    if args.max_level is not None:
+        return int(worst > args.max_level)
+    return worst
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,34 @@
 import base64
+import hashlib
+import itertools
+import json
 import os
+import sys
+import time
+
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
+from flowchain import telemetry
+from flowchain.cache import CACHE_DIR, write_json
+from flowchain.uploads import UploadCache
 
-def generate():
-    client = genai.Client(
-        api_key=os.environ.get("GEMINI_API_KEY"),
-    )
+# Please ensure that the files are available in the local working directory or change the file paths.
+CONTEXT_FILES = [
+    "cody-chat-history-2025-03-28T16-13-05.json",
+    "cody-chat-history-2025-04-02T03-13-54.json",
+]
 
-    files = [
-        # Please ensure that the file is available in local system working direrctory or change the file path.
-        client.files.upload(file="cody-chat-history-2025-03-28T16-13-05.json"),
-        # Please ensure that the file is available in local system working direrctory or change the file path.
-        client.files.upload(file="cody-chat-history-2025-04-02T03-13-54.json"),
-    ]
-    model = "gemini-2.5-pro-exp-03-25"
-    contents = [
+MODEL = "gemini-2.5-pro-exp-03-25"
+CONTEXT_TTL = 3600
+CONTEXT_CACHE = CACHE_DIR / "gemini-context.json"
+# A cached content that was deleted, expired early or belongs to another key.
+STALE_CACHE_CODES = (403, 404)
+
+
+def transcript(files):
+    """The static few-shot prefix: the scaffolding conversation every request continues."""
+    return [
         types.Content(
             role="user",
             parts=[
@@ -573,23 +585,143 @@ flow-system/
 This scaffolding provides a robust starting point. You'll need to fill in the specific logic for your tools, memory interactions, state transitions, and potentially more complex routing within the LangGraph `edges.py`. Remember to replace placeholder comments and logic with your actual implementations."""),
             ],
         ),
-        types.Content(
+    ]
+
+
+class PromptContext:
+    """The transcript prefix, built and serialized once per process.
+
+    Where the model supports explicit context caching the prefix is stored
+    server-side and each request sends only the new user turn; otherwise the
+    prebuilt contents are reused locally.
+    """
+
+    def __init__(self, client, model, files, scope: str):
+        self.model = model
+        self.contents = transcript(files)
+        serialized = [content.model_dump_json(exclude_none=True) for content in self.contents]
+        self.prefix_bytes = sum(len(text.encode()) for text in serialized)
+        # Server caches belong to one API key, so the stored name is scoped to it as well as the model.
+        self.key = hashlib.sha256("\0".join([scope, model, *serialized]).encode()).hexdigest()
+        self.cached_content = self._server_cache(client)
+
+    def _server_cache(self, client, stale: bool = False):
+        try:
+            stored = json.loads(CONTEXT_CACHE.read_text())
+        except (FileNotFoundError, ValueError):
+            stored = {}
+        if stale:
+            stored.pop(self.key, None)
+        entry = stored.get(self.key)
+        if entry and entry["expires_at"] > time.time() + 60:
+            return entry["name"]
+        try:
+            cache = client.caches.create(
+                model=self.model,
+                config=types.CreateCachedContentConfig(contents=self.contents, ttl=f"{CONTEXT_TTL}s"),
+            )
+        except errors.ClientError:
+            # Model or tier without explicit caching: local fallback.
+            if stale:
+                write_json(CONTEXT_CACHE, stored)
+            return None
+        stored[self.key] = {"name": cache.name, "expires_at": time.time() + CONTEXT_TTL}
+        write_json(CONTEXT_CACHE, stored)
+        return cache.name
+
+    def recover(self, client, error: Exception) -> bool:
+        """Replace a server cache the API no longer serves; ``True`` if the request should be retried."""
+        if not (self.cached_content and isinstance(error, errors.ClientError) and error.code in STALE_CACHE_CODES):
+            return False
+        telemetry.count("flowchain_model_context_recreated_total", model=self.model, code=error.code)
+        self.cached_content = self._server_cache(client, stale=True)
+        return True
+
+    def request(self, prompt: str):
+        """Return ``(contents, config, payload_bytes)`` for one new user turn."""
+        turn = types.Content(
             role="user",
             parts=[
-                types.Part.from_text(text="""INSERT_INPUT_HERE"""),
+                types.Part.from_text(text=prompt),
             ],
-        ),
-    ]
-    generate_content_config = types.GenerateContentConfig(
-        response_mime_type="text/plain",
-    )
+        )
+        turn_bytes = len(turn.model_dump_json(exclude_none=True).encode())
+        if self.cached_content:
+            config = types.GenerateContentConfig(response_mime_type="text/plain", cached_content=self.cached_content)
+            return [turn], config, turn_bytes
+        config = types.GenerateContentConfig(response_mime_type="text/plain")
+        return [*self.contents, turn], config, self.prefix_bytes + turn_bytes
 
-    for chunk in client.models.generate_content_stream(
-        model=model,
-        contents=contents,
-        config=generate_content_config,
-    ):
+
+def account(api_key: str = None) -> str:
+    """Short fingerprint of the API key the client was built with (never the key itself).
+
+    Defaults to ``GEMINI_API_KEY``, which is what :func:`generate` and the agent runner build clients from.
+    """
+    if api_key is None:
+        api_key = os.environ.get("GEMINI_API_KEY")
+    return hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+
+
+_UPLOADS = {}
+_CONTEXTS = {}
+
+
+def prompt_context(client, model: str = MODEL, api_key: str = None) -> PromptContext:
+    """The shared context for ``client``; pass ``api_key`` if it was not built from ``GEMINI_API_KEY``."""
+    scope = account(api_key)
+    if scope not in _UPLOADS:
+        # Uploaded files are only visible to the key that uploaded them.
+        _UPLOADS[scope] = UploadCache(client, CACHE_DIR / f"uploads-{scope}.json")
+    files = _UPLOADS[scope].upload_all(CONTEXT_FILES)
+    key = (scope, model, *(f.uri for f in files))
+    if key not in _CONTEXTS:
+        _CONTEXTS[key] = PromptContext(client, model, files, scope)
+    return _CONTEXTS[key]
+
+
+def generate(prompt: str, client=None, model: str = MODEL, api_key: str = None) -> str:
+    api_key = api_key or os.environ.get("GEMINI_API_KEY")
+    client = client or genai.Client(
+        api_key=api_key,
+    )
+    context = prompt_context(client, model, api_key)
+
+    started = time.perf_counter()
+    first_chunk = None
+    chunks = []
+    for retry in (True, False):
+        contents, generate_content_config, payload_bytes = context.request(prompt)
+        stream = client.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=generate_content_config,
+        )
+        try:
+            head = next(stream, None)
+        except errors.ClientError as e:
+            if retry and context.recover(client, e):
+                continue
+            raise
+        break
+    for chunk in itertools.chain([head] if head else [], stream):
+        if first_chunk is None:
+            first_chunk = time.perf_counter()
+        chunks.append(chunk.text or "")
         print(chunk.text, end="")
 
+    finished = time.perf_counter()
+    ttft = (first_chunk or finished) - started
+    prefix = "server cache" if context.cached_content else "local"
+    telemetry.observe("flowchain_model_ttft_seconds", ttft, model=model, prefix=prefix)
+    telemetry.observe("flowchain_model_latency_seconds", finished - started, model=model, prefix=prefix)
+    print(
+        f"\n⏱  ttft {ttft * 1000:.0f} ms · total {(finished - started) * 1000:.0f} ms"
+        f" · payload {payload_bytes:,} B (prefix: {prefix})",
+        file=sys.stderr,
+    )
+    return "".join(chunks)
+
+
 if __name__ == "__main__":
-    generate()
+    generate(" ".join(sys.argv[1:]) or sys.stdin.read())
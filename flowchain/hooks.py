@@ -0,0 +1,395 @@
+"""Language-hook registry and runner.
+
+Hooks are declared as JSON blocks in ``FLEX_LOGIC.md`` (see "Declaring a
+Hook")::
+
+    {"extension": "python", "entry": "lang-hooks/python/runner.py", "required": true}
+
+Optional ``timeout`` (seconds) and ``memory_mb`` keys override the runner's
+defaults. Python entries define ``run(context) -> result`` and are imported
+lazily inside long-lived pool workers, so interpreter start-up and imports
+are paid once per session; other entries run as a subprocess that receives
+the context as JSON on stdin. Declared hooks whose entry does not exist are
+reported as missing and turned into issues by ``flowchain.issues``.
+
+    python -m flowchain.hooks list [ROOT]
+    python -m flowchain.hooks run [ROOT] --all --timeout 30 --memory-mb 512
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, hooks run without a memory cap
+    resource = None
+
+FLEX_LOGIC = "FLEX_LOGIC.md"
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MEMORY_MB = 1024
+# Extra time the parent waits past a hook's own timeout before killing the worker.
+KILL_GRACE = 5.0
+POLL_INTERVAL = 0.1
+
+INTERPRETERS = {".sh": ["bash"], ".java": ["java"], ".js": ["node"], ".rb": ["ruby"]}
+
+# A fence left open at the end of the doc still counts as a block.
+_JSON_BLOCK = re.compile(r"^```json\s*\n(.*?)(?:^```|\Z)", re.MULTILINE | re.DOTALL)
+
+
+@dataclass(slots=True)
+class Hook:
+    extension: str
+    entry: str
+    path: Path
+    required: bool = False
+    timeout: float = None
+    memory_mb: int = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.extension}:{self.entry}"
+
+    @property
+    def missing(self) -> bool:
+        return not self.path.is_file()
+
+
+@dataclass(slots=True)
+class HookResult:
+    hook: str
+    status: str  # ok | failed | timeout | memory | missing
+    duration: float = 0.0
+    output: object = None
+    error: str = None
+
+    def to_dict(self) -> dict:
+        return {
+            "hook": self.hook,
+            "status": self.status,
+            "duration": round(self.duration, 4),
+            "output": self.output,
+            "error": self.error,
+        }
+
+
+# ────────────────────────────────
+# 📜 DISCOVERY
+# ────────────────────────────────
+
+
+def find_flex_logic(root: Path):
+    for candidate in (Path(root) / FLEX_LOGIC, Path(root) / "docs" / FLEX_LOGIC):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def declared_hooks(root: Path) -> list:
+    """Parse every hook declaration in ``FLEX_LOGIC.md`` under ``root``."""
+    doc = find_flex_logic(root)
+    if doc is None:
+        return []
+    # Entries are relative to the project root, which is above docs/ when the doc lives there.
+    base = doc.parent.parent if doc.parent.name == "docs" else doc.parent
+    hooks = []
+    for block in _JSON_BLOCK.findall(doc.read_text()):
+        try:
+            data = json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and "extension" in item and "entry" in item:
+                hooks.append(Hook(
+                    extension=item["extension"],
+                    entry=item["entry"],
+                    path=base / item["entry"],
+                    required=bool(item.get("required", False)),
+                    timeout=item.get("timeout"),
+                    memory_mb=item.get("memory_mb"),
+                ))
+    return hooks
+
+
+# ────────────────────────────────
+# 🧵 WORKER SIDE
+# ────────────────────────────────
+
+_modules = {}
+# Worker side: where a worker announces ``(token, pid)`` as it starts a task.
+_started = None
+
+
+class HookTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise HookTimeout()
+
+
+def _address_space() -> int:
+    with open("/proc/self/statm") as handle:
+        return int(handle.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _memory_cap(memory_mb: int):
+    """Return an ``RLIMIT_AS`` soft limit allowing ``memory_mb`` beyond current usage, or ``None``."""
+    if resource is None or not memory_mb:
+        return None
+    try:
+        return _address_space() + memory_mb * 1024 * 1024
+    except OSError:
+        return None
+
+
+def _load(path: str):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _modules.get(path)
+    if cached is None or cached[0] != mtime:
+        spec = importlib.util.spec_from_file_location(f"flowchain_hook_{len(_modules)}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        cached = _modules[path] = (mtime, module)
+    return cached[1]
+
+
+def _run_python(path: str, context: dict, timeout: float, memory_mb: int):
+    cap = _memory_cap(memory_mb)
+    limits = resource.getrlimit(resource.RLIMIT_AS) if cap else None
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if cap:
+            hard = limits[1]
+            resource.setrlimit(resource.RLIMIT_AS, (cap if hard == resource.RLIM_INFINITY else min(cap, hard), hard))
+        return _load(path).run(context)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if cap:
+            resource.setrlimit(resource.RLIMIT_AS, limits)
+
+
+def _run_process(path: str, context: dict, timeout: float, memory_mb: int):
+    command = INTERPRETERS.get(Path(path).suffix, []) + [path]
+
+    def limit():
+        if memory_mb:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_mb * 1024 * 1024,) * 2)
+
+    try:
+        done = subprocess.run(
+            command,
+            input=json.dumps(context),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            preexec_fn=limit if resource is not None else None,
+        )
+    except subprocess.TimeoutExpired:
+        raise HookTimeout() from None
+    if done.returncode:
+        raise RuntimeError(done.stderr.strip() or f"exit status {done.returncode}")
+    return done.stdout.strip()
+
+
+def _init_worker(started):
+    global _started
+    _started = started
+
+
+def _execute(task):
+    """Pool worker: run one hook and return ``(status, duration, output, error)``."""
+    token, path, context, timeout, memory_mb = task
+    if _started is not None:
+        _started.put((token, os.getpid()))
+    start = time.perf_counter()
+    try:
+        run = _run_python if path.endswith(".py") else _run_process
+        output = run(path, context, timeout, memory_mb)
+        status, error = "ok", None
+    except HookTimeout:
+        status, output, error = "timeout", None, f"exceeded {timeout}s"
+    except MemoryError:
+        status, output, error = "memory", None, f"exceeded {memory_mb} MB"
+    except Exception as e:  # a hook's own failure must not take the worker down
+        status, output, error = "failed", None, f"{type(e).__name__}: {e}"
+    try:
+        json.dumps(output)
+    except (TypeError, ValueError):
+        output = repr(output)
+    return status, time.perf_counter() - start, output, error
+
+
+# ────────────────────────────────
+# 🏃 RUNNER
+# ────────────────────────────────
+
+
+class HookRunner:
+    """Keeps one process pool warm across ``run`` calls.
+
+    Workers report their pid as they pick up a hook, so a hook that outlives its
+    timeout (e.g. stuck in C code, where the alarm cannot interrupt it) gets
+    only its own worker killed; the pool starts a replacement and every other
+    hook keeps running.
+    """
+
+    def __init__(self, workers: int = None, timeout: float = DEFAULT_TIMEOUT, memory_mb: int = DEFAULT_MEMORY_MB):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.timings = {}
+        self._pool = None
+        self._queue = None
+        self._running = {}  # token -> (worker pid, monotonic start)
+        self._tokens = itertools.count()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "HookRunner":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                self._queue = multiprocessing.Queue()
+                self._pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(self._queue,))
+            return self._pool
+
+    def _started(self, token: int):
+        """Return ``(pid, start)`` once a worker has picked up ``token``, else ``None``."""
+        with self._lock:
+            while True:
+                try:
+                    started, pid = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._running[started] = (pid, time.monotonic())
+            return self._running.get(token)
+
+    @staticmethod
+    def _alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def _wait(self, token: int, pending, limit: float):
+        """Wait for ``pending``, timing out ``limit`` seconds after it started running (not after it was queued).
+
+        Raises :class:`TimeoutError` after killing the hook's worker, or
+        :class:`ChildProcessError` if the worker died under it (e.g. hard memory limit).
+        """
+        try:
+            while True:
+                try:
+                    return pending.get(timeout=POLL_INTERVAL)
+                except multiprocessing.TimeoutError:
+                    started = self._started(token)
+                    if started is None:
+                        continue
+                    pid, start = started
+                    if not self._alive(pid):
+                        raise ChildProcessError(f"worker {pid} died") from None
+                    if time.monotonic() - start > limit:
+                        os.kill(pid, signal.SIGKILL)
+                        raise TimeoutError() from None
+        finally:
+            with self._lock:
+                self._running.pop(token, None)
+
+    def close(self):
+        if self._pool is not None:
+            # terminate, not close+join: a killed worker's task never reports back and join would wait for it.
+            self._pool.terminate()
+            self._pool.join()
+            self._queue.close()
+            self._pool = self._queue = None
+
+    def run(self, hooks, context: dict = None, required_only: bool = True) -> list:
+        """Run hooks concurrently; results come back in declaration order."""
+        context = context or {}
+        results, pending = [], []
+        for hook in hooks:
+            if required_only and not hook.required:
+                continue
+            if hook.missing:
+                results.append(HookResult(hook.name, "missing", error=f"{hook.entry} not found"))
+                continue
+            timeout = hook.timeout or self.timeout
+            token = next(self._tokens)
+            task = (token, os.fspath(hook.path.resolve()), context, timeout, hook.memory_mb or self.memory_mb)
+            pending.append((hook, timeout, token, self._executor().apply_async(_execute, (task,)), len(results)))
+            results.append(None)
+
+        for hook, timeout, token, result, slot in pending:
+            try:
+                status, duration, output, error = self._wait(token, result, timeout + KILL_GRACE)
+            except TimeoutError:
+                status, duration, output, error = "timeout", timeout, None, f"killed after {timeout + KILL_GRACE}s"
+            except Exception as e:  # the worker died (e.g. hard memory limit) or the result could not be sent
+                status, duration, output, error = "failed", 0.0, None, f"{type(e).__name__}: {e}"
+            results[slot] = HookResult(hook.name, status, duration, output, error)
+            self.timings.setdefault(hook.name, []).append(duration)
+        return results
+
+    def stats(self) -> dict:
+        return {
+            name: {"runs": len(times), "mean": sum(times) / len(times), "max": max(times)}
+            for name, times in self.timings.items()
+        }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain language hooks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Show declared hooks").add_argument("root", nargs="?", default=".")
+    run = sub.add_parser("run", help="Run hooks in a process pool")
+    run.add_argument("root", nargs="?", default=".")
+    run.add_argument("--all", action="store_true", help="Also run optional hooks")
+    run.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    run.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Default per-hook timeout (s)")
+    run.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_MB, help="Default per-hook memory limit")
+    run.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    hooks = declared_hooks(args.root)
+    if args.command == "list":
+        for hook in hooks:
+            state = "missing" if hook.missing else "present"
+            print(f"{'required' if hook.required else 'optional':>8}  {state:<7}  {hook.name}")
+        return 0
+
+    with HookRunner(args.jobs, args.timeout, args.memory_mb) as runner:
+        results = runner.run(hooks, {"root": os.path.abspath(args.root)}, required_only=not args.all)
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        for result in results:
+            icon = "✅" if result.status == "ok" else "❌"
+            detail = f" — {result.error}" if result.error else ""
+            print(f"{icon} {result.hook} [{result.status}] {result.duration * 1000:.1f} ms{detail}")
+    required = {hook.name for hook in hooks if hook.required}
+    return int(any(r.status != "ok" and r.hook in required for r in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+"""Durable intake queue for agent requests backed by ``requests.jsonl``.
+
+Producers append one JSON object per line to ``requests.jsonl`` (fsynced,
+under the queue lock). Consumers never rescan it: a sidecar index under
+``.flowchain/intake`` records the read cursor and every claimed-but-unacked
+request, so a restarted consumer resumes where the last one stopped.
+
+* Requests are claimed in batches under a lease; unacked requests are
+  redelivered when the lease expires (at-least-once).
+* After ``max_attempts`` failures a request goes to ``dead.jsonl`` with its
+  last error instead of blocking the queue.
+* ``put`` raises :class:`QueueFull` once the unread backlog exceeds
+  ``max_backlog`` bytes, so producers slow down instead of filling the disk.
+* The active file is rotated into ``segments/`` at ``segment_bytes``; sealed
+  segments are deleted once every request in them is settled.
+
+    python -m flowchain.intake put '{"agent": "Review", "doc": "docs/DESIGN_GUIDE.md"}'
+    python -m flowchain.intake run --handler mypkg.handlers:handle --workers 8
+    python -m flowchain.intake stats
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from flowchain import telemetry
+from flowchain.state import locked
+
+QUEUE_FILE = "requests.jsonl"
+INTAKE_DIR = Path(".flowchain") / "intake"
+INDEX_FILE = "index.json"
+DEAD_FILE = "dead.jsonl"
+SEGMENT_DIR = "segments"
+
+DEFAULT_BATCH = 32
+DEFAULT_WORKERS = 4
+DEFAULT_LEASE = 300.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_BACKLOG = 256 * 1024 * 1024
+
+
+class QueueFull(RuntimeError):
+    """Raised by :meth:`Intake.put` while the unread backlog is over its limit."""
+
+
+@dataclass(slots=True)
+class QueuedRequest:
+    id: str  # "<segment>:<byte offset>"
+    data: dict
+    attempts: int
+
+
+def _request_id(segment: int, offset: int) -> str:
+    return f"{segment}:{offset}"
+
+
+def _parse_id(request_id: str) -> tuple:
+    segment, _, offset = request_id.partition(":")
+    return int(segment), int(offset)
+
+
+def _encode(request: dict) -> bytes:
+    return json.dumps(request, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+class Intake:
+    def __init__(self, root: Path = ".", segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 max_backlog: int = DEFAULT_MAX_BACKLOG, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.root = Path(root)
+        self.queue_path = self.root / QUEUE_FILE
+        self.dir = self.root / INTAKE_DIR
+        self.index_path = self.dir / INDEX_FILE
+        self.dead_path = self.dir / DEAD_FILE
+        self.segment_bytes = segment_bytes
+        self.max_backlog = max_backlog
+        self.max_attempts = max_attempts
+
+    # ────────── index ──────────
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.index_path.read_text())
+        except FileNotFoundError:
+            return {"active": 0, "segments": [], "cursor": [0, 0], "inflight": {},
+                    "stats": {"put": 0, "claimed": 0, "acked": 0, "retried": 0, "dead": 0}}
+
+    def _save(self, index: dict):
+        """Atomically replace the index (temp file, fsync, rename)."""
+        fd, tmp = tempfile.mkstemp(prefix=f".{INDEX_FILE}.", dir=self.dir)
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(index, handle, separators=(",", ":"))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, self.index_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _lock(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        return locked(self.index_path)
+
+    def _segment_path(self, index: dict, segment: int) -> Path:
+        if segment == index["active"]:
+            return self.queue_path
+        return self.dir / SEGMENT_DIR / f"{segment:06d}.jsonl"
+
+    def _size(self, index: dict, segment: int) -> int:
+        try:
+            return self._segment_path(index, segment).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _backlog(self, index: dict) -> int:
+        """Unread bytes from the cursor to the end of the active file."""
+        cursor, offset = index["cursor"]
+        later = [s for s in index["segments"] if s > cursor] + [index["active"]] * (index["active"] > cursor)
+        return self._size(index, cursor) - offset + sum(self._size(index, s) for s in later)
+
+    # ────────── producing ──────────
+
+    def put_many(self, requests: list) -> list:
+        """Durably append ``requests``; returns their IDs. Raises :class:`QueueFull` under backpressure."""
+        payload = b"".join(_encode(request) for request in requests)
+        with self._lock():
+            index = self._load()
+            if self._backlog(index) + len(payload) > self.max_backlog:
+                telemetry.count("flowchain_intake_rejected_total", len(requests))
+                raise QueueFull(f"Intake backlog is over {self.max_backlog} bytes; retry later")
+            with self.queue_path.open("ab") as handle:
+                offset = handle.tell()
+                if offset:
+                    with self.queue_path.open("rb") as check:
+                        check.seek(-1, os.SEEK_END)
+                        if check.read(1) != b"\n":
+                            handle.write(b"\n")  # seal a torn write so it is dead-lettered, not merged
+                            offset += 1
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            ids = []
+            for request in requests:
+                ids.append(_request_id(index["active"], offset))
+                offset += len(_encode(request))
+            index["stats"]["put"] += len(requests)
+            if offset >= self.segment_bytes:
+                self._rotate(index)
+            self._save(index)
+        telemetry.count("flowchain_intake_put_total", len(requests))
+        return ids
+
+    def put(self, request: dict, block: bool = False, timeout: float = None) -> str:
+        """Append one request. With ``block``, wait (up to ``timeout``) for room instead of raising."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            try:
+                return self.put_many([request])[0]
+            except QueueFull:
+                if not block or (deadline is not None and time.monotonic() >= deadline):
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+
+    def _rotate(self, index: dict):
+        """Seal the active file as a numbered segment; IDs keep pointing at the same bytes."""
+        sealed = index["active"]
+        (self.dir / SEGMENT_DIR).mkdir(exist_ok=True)
+        os.replace(self.queue_path, self.dir / SEGMENT_DIR / f"{sealed:06d}.jsonl")
+        index["segments"].append(sealed)
+        index["active"] = sealed + 1
+
+    # ────────── consuming ──────────
+
+    def _read_at(self, index: dict, request_id: str):
+        segment, offset = _parse_id(request_id)
+        with self._segment_path(index, segment).open("rb") as handle:
+            handle.seek(offset)
+            return json.loads(handle.readline())
+
+    def _dead_letter(self, index: dict, letters: list):
+        """Append ``(request_id, attempts, error, request)`` entries to ``dead.jsonl`` and drop them from flight."""
+        if not letters:
+            return
+        lines = []
+        for request_id, attempts, error, data in letters:
+            index["inflight"].pop(request_id, None)
+            lines.append(_encode({"id": request_id, "attempts": attempts, "error": error,
+                                  "failed_at": time.time(), "request": data}))
+        with self.dead_path.open("ab") as handle:
+            handle.write(b"".join(lines))
+            handle.flush()
+            os.fsync(handle.fileno())
+        index["stats"]["dead"] += len(letters)
+        telemetry.count("flowchain_intake_dead_total", len(letters))
+
+    def claim(self, limit: int = DEFAULT_BATCH, lease: float = DEFAULT_LEASE) -> list:
+        """Lease up to ``limit`` requests: expired leases first, then unread lines from the cursor."""
+        now = time.time()
+        claimed, dead = [], []
+        with self._lock():
+            index = self._load()
+            inflight = index["inflight"]
+            for request_id, entry in list(inflight.items()):
+                if len(claimed) >= limit:
+                    break
+                if entry["until"] > now:
+                    continue
+                data = self._read_at(index, request_id)
+                if entry["attempts"] >= self.max_attempts:
+                    dead.append((request_id, entry["attempts"], entry.get("error") or "lease expired", data))
+                    continue
+                entry["attempts"] += 1
+                entry["until"] = now + lease
+                index["stats"]["retried"] += 1
+                claimed.append(QueuedRequest(request_id, data, entry["attempts"]))
+
+            segment, offset = index["cursor"]
+            while len(claimed) < limit:
+                path = self._segment_path(index, segment)
+                try:
+                    handle = path.open("rb")
+                except FileNotFoundError:
+                    handle = None
+                if handle is not None:
+                    with handle:
+                        handle.seek(offset)
+                        while len(claimed) < limit:
+                            line = handle.readline()
+                            if not line.endswith(b"\n"):
+                                break  # end of file, or a torn write still being completed
+                            request_id = _request_id(segment, offset)
+                            offset += len(line)
+                            if not line.strip():
+                                continue
+                            try:
+                                data = json.loads(line)
+                            except ValueError as e:
+                                dead.append((request_id, 0, f"Invalid JSON: {e}", line.decode(errors="replace")))
+                                continue
+                            inflight[request_id] = {"attempts": 1, "until": now + lease, "error": None}
+                            claimed.append(QueuedRequest(request_id, data, 1))
+                if len(claimed) >= limit or segment == index["active"]:
+                    break
+                later = [s for s in index["segments"] if s > segment]
+                segment, offset = (later[0] if later else index["active"]), 0
+            index["cursor"] = [segment, offset]
+            index["stats"]["claimed"] += len(claimed)
+            self._dead_letter(index, dead)
+            self._compact(index)
+            self._save(index)
+        telemetry.count("flowchain_intake_claimed_total", len(claimed))
+        return claimed
+
+    def ack(self, ids: list) -> int:
+        """Settle processed requests; unknown or already-settled IDs are ignored."""
+        with self._lock():
+            index = self._load()
+            settled = sum(index["inflight"].pop(request_id, None) is not None for request_id in ids)
+            index["stats"]["acked"] += settled
+            self._compact(index)
+            self._save(index)
+        telemetry.count("flowchain_intake_acked_total", settled)
+        return settled
+
+    def nack(self, errors: dict) -> int:
+        """Release failed requests (``{id: error}``) for immediate retry; returns how many were dead-lettered."""
+        with self._lock():
+            index = self._load()
+            dead = []
+            for request_id, error in errors.items():
+                entry = index["inflight"].get(request_id)
+                if entry is None:
+                    continue
+                entry["error"] = error
+                if entry["attempts"] >= self.max_attempts:
+                    dead.append((request_id, entry["attempts"], error, self._read_at(index, request_id)))
+                else:
+                    entry["until"] = 0
+            self._dead_letter(index, dead)
+            self._compact(index)
+            self._save(index)
+        return len(dead)
+
+    def _compact(self, index: dict):
+        """Delete sealed segments that are fully read and have nothing left in flight."""
+        busy = {_parse_id(request_id)[0] for request_id in index["inflight"]}
+        cursor = index["cursor"][0]
+        for segment in list(index["segments"]):
+            if segment < cursor and segment not in busy:
+                self._segment_path(index, segment).unlink(missing_ok=True)
+                index["segments"].remove(segment)
+
+    def compact(self, rotate: bool = False) -> dict:
+        """Drop settled segments; with ``rotate``, seal a non-empty active file first."""
+        with self._lock():
+            index = self._load()
+            if rotate and self._size(index, index["active"]):
+                self._rotate(index)
+                if index["cursor"][0] == index["segments"][-1] and index["cursor"][1] >= self._size(index, index["cursor"][0]):
+                    index["cursor"] = [index["active"], 0]
+            self._compact(index)
+            self._save(index)
+        return self.stats()
+
+    def stats(self) -> dict:
+        index = self._load()
+        return {
+            **index["stats"],
+            "backlog_bytes": self._backlog(index),
+            "inflight": len(index["inflight"]),
+            "segments": len(index["segments"]) + 1,
+        }
+
+    # ────────── worker pool ──────────
+
+    def run(self, handler, workers: int = DEFAULT_WORKERS, batch: int = DEFAULT_BATCH,
+            lease: float = DEFAULT_LEASE, follow: bool = False, poll: float = 1.0, stop=None) -> dict:
+        """Feed claimed batches to ``handler(request_dict)`` on a thread pool.
+
+        Successes are acked and failures nacked once per batch. Returns when the
+        queue is drained, or with ``follow`` when ``stop`` (a ``threading.Event``) is set.
+        """
+        totals = {"ok": 0, "failed": 0, "dead": 0}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while stop is None or not stop.is_set():
+                requests = self.claim(batch, lease)
+                if not requests:
+                    if not follow:
+                        break
+                    (stop.wait if stop is not None else time.sleep)(poll)
+                    continue
+                futures = [(request, pool.submit(self._handle, handler, request)) for request in requests]
+                done, failed = [], {}
+                for request, future in futures:
+                    error = future.result()
+                    if error is None:
+                        done.append(request.id)
+                    else:
+                        failed[request.id] = error
+                self.ack(done)
+                totals["dead"] += self.nack(failed) if failed else 0
+                totals["ok"] += len(done)
+                totals["failed"] += len(failed)
+        return totals
+
+    @staticmethod
+    def _handle(handler, request: QueuedRequest):
+        with telemetry.span("flowchain_intake_request") as span:
+            try:
+                handler(request.data)
+            except Exception as e:
+                span.set(error=type(e).__name__)
+                return f"{type(e).__name__}: {e}"
+        return None
+
+
+def load_handler(spec: str):
+    """Resolve ``module:function`` (e.g. ``mypkg.handlers:handle``)."""
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"Handler '{spec}' must look like module:function")
+    return getattr(importlib.import_module(module), name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain request intake queue")
+    parser.add_argument("--root", default=".", help=f"Directory holding {QUEUE_FILE} (default: .)")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help="Deliveries before dead-lettering")
+    sub = parser.add_subparsers(dest="command", required=True)
+    put = sub.add_parser("put", help="Append requests (JSON arguments, or JSON lines on stdin with '-')")
+    put.add_argument("requests", nargs="+")
+    put.add_argument("--block", type=float, metavar="SECONDS", help="Wait up to SECONDS for backlog room")
+    run = sub.add_parser("run", help="Process requests with a worker pool")
+    run.add_argument("--handler", required=True, help="module:function called with each request")
+    run.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    run.add_argument("--batch", type=int, default=DEFAULT_BATCH)
+    run.add_argument("--lease", type=float, default=DEFAULT_LEASE, help="Seconds before an unacked request is redelivered")
+    run.add_argument("--follow", action="store_true", help="Keep polling for new requests instead of exiting when drained")
+    sub.add_parser("stats", help="Print queue counters and backlog")
+    compact = sub.add_parser("compact", help="Delete settled segments")
+    compact.add_argument("--rotate", action="store_true", help="Seal the active file first")
+    args = parser.parse_args(argv)
+
+    intake = Intake(args.root, max_attempts=args.max_attempts)
+    if args.command == "put":
+        lines = sys.stdin.read().splitlines() if args.requests == ["-"] else args.requests
+        requests = [json.loads(line) for line in lines if line.strip()]
+        try:
+            if args.block is None:
+                ids = intake.put_many(requests)
+            else:
+                ids = [intake.put(request, block=True, timeout=args.block) for request in requests]
+        except QueueFull as e:
+            print(f"⏳ {e}")
+            return 75  # EX_TEMPFAIL
+        print(f"📥 Queued {len(ids)} request(s)")
+    elif args.command == "run":
+        try:
+            totals = intake.run(load_handler(args.handler), args.workers, args.batch, args.lease, args.follow)
+        except KeyboardInterrupt:
+            return 130
+        print(f"✅ {totals['ok']} processed, {totals['failed']} failed, {totals['dead']} dead-lettered")
+        return 1 if totals["dead"] else 0
+    elif args.command == "stats":
+        print(json.dumps(intake.stats(), indent=2))
+    else:
+        print(json.dumps(intake.compact(args.rotate), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
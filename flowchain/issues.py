@@ -0,0 +1,297 @@
+"""Sync unfinished FlowChain work to GitHub Issues.
+
+"Unfinished Steps → GitHub Issues": placeholders, missing sections and open
+checklist items in ``DESIGN_GUIDE.md``, the features in ``FEATURES.md`` and
+hooks declared in ``FLEX_LOGIC.md`` whose entry does not exist become one
+issue each. Every issue body carries a hidden marker with a
+stable key and a content hash, so a sync only creates, updates, reopens or
+closes what actually changed.
+
+    python -m flowchain.issues --repo owner/name [--root .] [--dry-run]
+
+``GITHUB_TOKEN``, ``GITHUB_REPOSITORY`` and ``GITHUB_API_URL`` are read from
+the environment; pointing ``GITHUB_API_URL`` at a local mock server is enough
+to exercise the whole flow offline.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from flowchain import telemetry
+from flowchain.cache import CACHE_DIR, write_json
+from flowchain.hooks import FLEX_LOGIC, declared_hooks
+from flowchain.sections import SectionIndex, index_document
+
+SOURCES = ("DESIGN_GUIDE.md", "FEATURES.md")
+LABEL = "flowchain"
+DEFAULT_API_URL = "https://api.github.com"
+ETAG_CACHE = "github-etags.json"
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+# GitHub asks for at least a second between content-creating requests.
+WRITE_INTERVAL = 1.0
+
+MISSING_SECTION_RE = re.compile(r"<!-- MISSING_SECTION:\s*(?P<name>.*?)\s*-->")
+BULLET_RE = re.compile(r"^\s*[-*]\s+(?:\[(?P<check>[ xX])\]\s+)?(?P<text>.+?)\s*$")
+ISSUE_MARKER_RE = re.compile(r"<!-- flowchain-issue: (?P<key>[0-9a-f]{16}) (?P<digest>[0-9a-f]{16}) -->")
+
+CHECKLIST = "### Checklist\n- [ ] Code written\n- [ ] Docs updated\n- [ ] Test passed"
+
+
+def _short_hash(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class DesiredIssue:
+    key: str
+    title: str
+    description: str
+    source: str
+
+    @property
+    def digest(self) -> str:
+        return _short_hash(self.title, self.description, self.source)
+
+    @property
+    def body(self) -> str:
+        return (
+            f"### Description\n{self.description}\n\n_Source: {self.source}_\n\n{CHECKLIST}\n\n"
+            f"<!-- flowchain-issue: {self.key} {self.digest} -->"
+        )
+
+
+# ────────────────────────────────
+# 📄 DESIRED ISSUE SET
+# ────────────────────────────────
+
+
+def _issue(file: str, kind: str, section: str, text: str, title: str, description: str) -> DesiredIssue:
+    source = f"`{file}` → {section}" if section else f"`{file}`"
+    return DesiredIssue(_short_hash(file, kind, section, text), title, description, source)
+
+
+def parse_doc(file: str, index: SectionIndex) -> list:
+    issues = []
+    for section in index.sections:
+        name = section.title
+        kinds = {kind for kind, _ in section.markers}
+        body = index.read(section, include_children=False, include_heading=False)
+        if "placeholder" in kinds:
+            issues.append(_issue(file, "placeholder", name, "", f"Complete {file}: {name or 'document'}",
+                                 f"Section **{name or file}** still contains a placeholder."))
+        if "missing_section" in kinds:
+            for missing in MISSING_SECTION_RE.finditer(body):
+                title = missing["name"]
+                issues.append(_issue(file, "missing", name, title, f"Add missing section to {file}: {title}",
+                                     f"`{file}` is missing the **{title}** section."))
+        for line in body.splitlines():
+            bullet = BULLET_RE.match(line)
+            if not bullet:
+                continue
+            if bullet["check"] == " ":
+                issues.append(_issue(file, "task", name, bullet["text"], f"Task: {bullet['text']}", bullet["text"]))
+            elif bullet["check"] is None and file == "FEATURES.md":
+                issues.append(_issue(file, "feature", name, bullet["text"], f"Build feature: {bullet['text']}",
+                                     bullet["text"]))
+    return issues
+
+
+def collect_issues(root: Path, sources=SOURCES) -> dict:
+    """Return ``{key: DesiredIssue}`` for every unfinished item under ``root``."""
+    desired = {}
+    for file in sources:
+        path = Path(root) / file
+        if path.is_file():
+            for issue in parse_doc(file, index_document(path)):
+                desired.setdefault(issue.key, issue)
+    for hook in declared_hooks(root):
+        if hook.missing:
+            kind = "required" if hook.required else "optional"
+            issue = _issue(FLEX_LOGIC, "hook", "", hook.name, f"Add {hook.extension} hook: {hook.entry}",
+                           f"The {kind} `{hook.extension}` hook is declared but `{hook.entry}` does not exist.")
+            desired.setdefault(issue.key, issue)
+    return desired
+
+
+def plan(desired: dict, existing: dict) -> dict:
+    """Diff desired issues against ``{key: (number, digest, state)}`` from GitHub."""
+    actions = {"create": [], "update": [], "close": []}
+    for key, issue in desired.items():
+        if key not in existing:
+            actions["create"].append(issue)
+            continue
+        number, digest, state = existing[key]
+        if digest != issue.digest or state != "open":
+            actions["update"].append((number, issue))
+    for key, (number, _, state) in existing.items():
+        if key not in desired and state == "open":
+            actions["close"].append(number)
+    return actions
+
+
+# ────────────────────────────────
+# 🌐 GITHUB CLIENT
+# ────────────────────────────────
+
+
+class GitHubClient:
+    def __init__(self, repo: str, token: str = None, api_url: str = DEFAULT_API_URL, etag_path: Path = None,
+                 write_interval: float = WRITE_INTERVAL):
+        self.repo = repo
+        self.api_url = api_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.mount(self.api_url, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.headers.update({"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"})
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        self.etag_path = etag_path
+        self.etags = {}
+        if etag_path and etag_path.is_file():
+            self.etags = json.loads(etag_path.read_text())
+        self.write_interval = write_interval
+        self.remaining = None
+        self.reset_at = 0.0
+        self.last_write = 0.0
+        self.calls = 0
+        self.not_modified = 0
+
+    def _wait_for_budget(self):
+        if self.remaining == 0 and self.reset_at > time.time():
+            time.sleep(self.reset_at - time.time() + 1)
+
+    def _track_limits(self, response):
+        if "X-RateLimit-Remaining" in response.headers:
+            self.remaining = int(response.headers["X-RateLimit-Remaining"])
+            self.reset_at = float(response.headers.get("X-RateLimit-Reset", 0))
+
+    def _retry_delay(self, response, attempt: int):
+        """Seconds to wait before retrying ``response``, or ``None`` if it is final."""
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        if response.status_code in (403, 429) and self.remaining == 0:
+            return max(self.reset_at - time.time(), 0) + 1
+        if response.status_code == 429 or response.status_code >= 500:
+            return BACKOFF_BASE * 2 ** attempt
+        return None
+
+    def request(self, method: str, path: str, **kwargs):
+        url = path if path.startswith("http") else f"{self.api_url}{path}"
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_budget()
+            if method != "GET":
+                pause = self.last_write + self.write_interval - time.time()
+                if pause > 0:
+                    time.sleep(pause)
+            sent = time.perf_counter()
+            response = self.session.request(method, url, timeout=30, **kwargs)
+            telemetry.observe("flowchain_github_request_seconds", time.perf_counter() - sent, method=method)
+            telemetry.count("flowchain_github_requests_total", method=method, status=response.status_code)
+            self.calls += 1
+            self._track_limits(response)
+            if method != "GET":
+                self.last_write = time.time()
+            delay = self._retry_delay(response, attempt) if response.status_code >= 400 else None
+            if delay is None or attempt == MAX_RETRIES:
+                response.raise_for_status()
+                return response
+            time.sleep(delay)
+
+    def get_cached(self, url: str, params: dict = None):
+        """Conditional GET: a 304 replays the stored body (and does not count against the limit)."""
+        key = requests.Request("GET", url, params=params).prepare().url
+        cached = self.etags.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = self.request("GET", url, params=params, headers=headers)
+        if response.status_code == 304:
+            self.not_modified += 1
+            return cached["body"], cached.get("next")
+        body = response.json()
+        next_url = response.links.get("next", {}).get("url")
+        if "ETag" in response.headers:
+            self.etags[key] = {"etag": response.headers["ETag"], "body": body, "next": next_url}
+        return body, next_url
+
+    def save_etags(self):
+        if self.etag_path:
+            write_json(self.etag_path, self.etags)
+
+    def existing_issues(self) -> dict:
+        """Return ``{key: (number, digest, state)}`` for every FlowChain-managed issue."""
+        existing = {}
+        url = f"{self.api_url}/repos/{self.repo}/issues"
+        params = {"labels": LABEL, "state": "all", "per_page": 100}
+        while url:
+            page, url = self.get_cached(url, params)
+            params = None  # the "next" link already carries the query
+            for item in page:
+                marker = ISSUE_MARKER_RE.search(item.get("body") or "")
+                if marker and "pull_request" not in item:
+                    existing[marker["key"]] = (item["number"], marker["digest"], item["state"])
+        return existing
+
+    def create(self, issue: DesiredIssue):
+        self.request("POST", f"/repos/{self.repo}/issues", json={"title": issue.title, "body": issue.body, "labels": [LABEL]})
+
+    def update(self, number: int, issue: DesiredIssue):
+        self.request("PATCH", f"/repos/{self.repo}/issues/{number}",
+                     json={"title": issue.title, "body": issue.body, "state": "open"})
+
+    def close(self, number: int):
+        self.request("PATCH", f"/repos/{self.repo}/issues/{number}", json={"state": "closed", "state_reason": "completed"})
+
+
+def sync(root: Path, client: GitHubClient, dry_run: bool = False) -> dict:
+    actions = plan(collect_issues(root), client.existing_issues())
+    if not dry_run:
+        for issue in actions["create"]:
+            client.create(issue)
+        for number, issue in actions["update"]:
+            client.update(number, issue)
+        for number in actions["close"]:
+            client.close(number)
+    client.save_etags()
+    return {
+        "created": [issue.title for issue in actions["create"]],
+        "updated": [number for number, _ in actions["update"]],
+        "closed": actions["close"],
+        "api_calls": client.calls,
+        "not_modified": client.not_modified,
+        "dry_run": dry_run,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sync unfinished FlowChain steps to GitHub Issues")
+    parser.add_argument("--repo", default=os.environ.get("GITHUB_REPOSITORY"), help="owner/name (default: $GITHUB_REPOSITORY)")
+    parser.add_argument("--root", default=".", help="Directory holding DESIGN_GUIDE.md / FEATURES.md")
+    parser.add_argument("--api-url", default=os.environ.get("GITHUB_API_URL", DEFAULT_API_URL))
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without writing to GitHub")
+    args = parser.parse_args(argv)
+
+    if not args.repo:
+        raise EnvironmentError("Repository not set. Pass --repo or set GITHUB_REPOSITORY.")
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token and not args.dry_run:
+        raise EnvironmentError("GITHUB_TOKEN not found in environment.")
+
+    root = Path(args.root)
+    client = GitHubClient(args.repo, token, args.api_url, etag_path=root / CACHE_DIR / ETAG_CACHE)
+    report = sync(root, client, args.dry_run)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
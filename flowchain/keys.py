@@ -0,0 +1,130 @@
+"""Hot-reloading API key provider.
+
+Holds the current and (during a rotation grace window) previous key from
+``chat.env`` in memory and swaps them when the file changes, so a running
+service picks up ``flowchain rotate --dual`` without a restart and never
+re-reads the file per request. Changes are picked up through inotify on
+Linux, with a stat-polling fallback elsewhere.
+"""
+
+import ctypes
+import ctypes.util
+import hmac
+import os
+import select
+import threading
+import time
+from pathlib import Path
+
+ENV_FILE = "chat.env"
+ENV_VAR = "GPT_AGENT_API_KEY"
+PREVIOUS_SUFFIX = "_PREVIOUS"
+EXPIRES_SUFFIX = "_PREVIOUS_EXPIRES"
+POLL_INTERVAL = 1.0
+
+# inotify(7) events that mean "the file in this directory may have changed".
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+
+
+def parse_env(text: str) -> dict:
+    values = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep and key not in values:
+            values[key] = value
+    return values
+
+
+def _inotify_fd(directory: Path):
+    """Return an inotify fd watching ``directory``, or ``None`` where unsupported."""
+    name = ctypes.util.find_library("c")
+    if not name:
+        return None
+    try:
+        libc = ctypes.CDLL(name, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class KeyProvider:
+    def __init__(self, path: Path = ENV_FILE, name: str = ENV_VAR, poll_interval: float = POLL_INTERVAL):
+        self.path = Path(path)
+        self.name = name
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self._keys = ((), 0.0)  # (accepted keys as bytes, previous-key expiry)
+        self._stamp = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.reload()
+
+    # ────────── hot path ──────────
+
+    def verify(self, presented: str) -> bool:
+        """Constant-time check against every accepted key (current, and previous until it expires)."""
+        keys, expires = self._keys
+        candidate = presented.encode()
+        ok = False
+        for i, key in enumerate(keys):
+            match = hmac.compare_digest(candidate, key)
+            ok |= match and (i == 0 or time.time() < expires)
+        return ok
+
+    # ────────── reload ──────────
+
+    def reload(self) -> bool:
+        """Re-read the file if its stat changed; return ``True`` when the keys were swapped."""
+        try:
+            st = self.path.stat()
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if stamp == self._stamp:
+            return False
+        values = parse_env(self.path.read_text()) if stamp else {}
+        keys = tuple(
+            values[name].encode() for name in (self.name, self.name + PREVIOUS_SUFFIX) if values.get(name)
+        )
+        expires = float(values.get(self.name + EXPIRES_SUFFIX) or 0)
+        self._keys = (keys, expires)  # a single reference swap; readers never see a mix
+        self._stamp = stamp
+        self.reloads += 1
+        return True
+
+    def _watch(self):
+        fd = _inotify_fd(self.path.parent.resolve())
+        try:
+            while not self._stop.is_set():
+                if fd is None:
+                    self._stop.wait(self.poll_interval)
+                else:
+                    ready, _, _ = select.select([fd], [], [], self.poll_interval)
+                    if ready:
+                        os.read(fd, 64 * 1024)
+                self.reload()
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def start(self) -> "KeyProvider":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="flowchain-keys", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,368 @@
+"""Bulk enforcement-patch applier built on git plumbing.
+
+A patch spec is declarative JSON; every operation is idempotent, so
+re-running a rollout only commits to repositories that still need it:
+
+    {
+      "message": "Add enforcement logic section to TECHNICAL_GUIDE and README",
+      "patches": [
+        {"op": "ensure_section", "file": ["TECHNICAL_GUIDE.md", "docs/TECHNICAL_GUIDE.md"],
+         "heading": "## Enforcement Mechanisms", "body": "- **Missing Files = PR Blocked**"},
+        {"op": "ensure_bullet", "file": "README.md", "heading": "## Enforced Rules",
+         "bullet": "Unfinished logic or references → converted into GitHub Issues"},
+        {"op": "ensure_file", "file": "docs/FLOWCHAIN_BUILDER_GUIDE.md", "content": "# FlowChain Builder Guide\\n"}
+      ]
+    }
+
+``file`` may list candidates; the first one present in the tree is patched
+(the first one is created if none is, starting from the op's ``content``
+for ``ensure_section`` / ``ensure_bullet``). ``ensure_file`` ops run before
+the others whatever the spec order, so a file they seed is not pre-empted by
+an edit that would create it bare. Files are read from the branch tip
+with ``git cat-file --batch`` and the commit is built with ``hash-object``,
+``mktree`` and ``commit-tree``; ``update-ref`` moves the branch only if it
+has not moved meanwhile. Working trees and indexes are never touched.
+
+    python -m flowchain.patch -p templates/patches/enforcement.json --branch flowchain/enforcement ~/src/*/
+    python -m flowchain.patch -p templates/patches/enforcement.json --discover ~/src --dry-run
+"""
+
+import argparse
+import difflib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+MAX_WORKERS = 16
+DEFAULT_MESSAGE = "Apply FlowChain enforcement patch"
+ZERO_OID = "0" * 40
+BLOB_MODE = "100644"
+# Regular files; symlinks (120000) and submodules (160000) are never rewritten.
+BLOB_MODES = (BLOB_MODE, "100755")
+TREE_MODE = "040000"
+
+# op → keys it needs besides "file"
+OPERATIONS = {"ensure_file": ("content",), "ensure_section": ("heading",), "ensure_bullet": ("heading", "bullet")}
+
+
+class PatchError(ValueError):
+    """Raised for malformed patch specs and repositories that cannot be patched."""
+
+
+# ────────────────────────────────
+# 📝 DOC OPERATIONS (pure text → text)
+# ────────────────────────────────
+
+
+def _heading_level(line: str) -> int:
+    stripped = line.lstrip()
+    level = len(stripped) - len(stripped.lstrip("#"))
+    return level if 0 < level <= 6 and stripped[level:level + 1] in (" ", "\t") else 0
+
+
+def _find_heading(lines: list, heading: str):
+    wanted = heading.strip()
+    for i, line in enumerate(lines):
+        if line.strip() == wanted:
+            return i
+    return None
+
+
+def _append_block(text: str, block: str) -> str:
+    text = text.rstrip("\n")
+    return f"{text}\n\n{block}\n" if text else f"{block}\n"
+
+
+def ensure_file(text, patch: dict) -> str:
+    return patch["content"] if text is None else text
+
+
+def ensure_section(text, patch: dict) -> str:
+    text = patch.get("content", "") if text is None else text
+    if _find_heading(text.splitlines(), patch["heading"]) is not None:
+        return text
+    body = patch.get("body", "").strip("\n")
+    return _append_block(text, f"{patch['heading'].strip()}\n\n{body}" if body else patch["heading"].strip())
+
+
+def ensure_bullet(text, patch: dict) -> str:
+    """Add ``- bullet`` after the last list item directly under ``heading`` (creating the section if needed).
+
+    Items under a deeper subsection (``### Sub``) belong to it: the bullet goes
+    before the first subheading, but an identical item anywhere in the section counts.
+    """
+    text = patch.get("content", "") if text is None else text
+    bullet = patch["bullet"].strip()
+    bullet = bullet[2:].strip() if bullet[:2] in ("- ", "* ") else bullet
+    lines = text.splitlines()
+    start = _find_heading(lines, patch["heading"])
+    if start is None:
+        return _append_block(text, f"{patch['heading'].strip()}\n\n- {bullet}")
+    level = _heading_level(lines[start]) or 6
+    end = next((i for i in range(start + 1, len(lines)) if 0 < _heading_level(lines[i]) <= level), len(lines))
+    own = next((i for i in range(start + 1, end) if _heading_level(lines[i])), end)
+    insert_at = start + 1
+    for i in range(start + 1, end):
+        item = lines[i].strip()
+        if item[:2] in ("- ", "* "):
+            if item[2:].strip() == bullet:
+                return text
+            if i < own:
+                insert_at = i + 1
+    lines.insert(insert_at, f"- {bullet}")
+    return "\n".join(lines) + "\n"
+
+
+APPLY = {"ensure_file": ensure_file, "ensure_section": ensure_section, "ensure_bullet": ensure_bullet}
+
+
+def load_spec(paths: list) -> dict:
+    """Merge spec files in order; the first ``message`` wins."""
+    message, patches = None, []
+    for path in paths:
+        data = json.loads(Path(path).read_text())
+        message = message or data.get("message")
+        for patch in data.get("patches", []):
+            if patch.get("op") not in OPERATIONS:
+                raise PatchError(f"{path}: unknown op '{patch.get('op')}'. Expected one of: {', '.join(OPERATIONS)}")
+            missing = [key for key in ("file", *OPERATIONS[patch["op"]]) if key not in patch]
+            if missing:
+                raise PatchError(f"{path}: {patch['op']} needs {', '.join(missing)}")
+            files = patch["file"] if isinstance(patch["file"], list) else [patch["file"]]
+            patches.append({**patch, "file": files})
+    patches.sort(key=lambda patch: patch["op"] != "ensure_file")  # stable: spec order otherwise
+    return {"message": message or DEFAULT_MESSAGE, "patches": patches}
+
+
+# ────────────────────────────────
+# 🔧 GIT PLUMBING
+# ────────────────────────────────
+
+
+def _git(repo: Path, *args, input: bytes = None) -> bytes:
+    result = subprocess.run(["git", "-C", os.fspath(repo), *args], input=input, capture_output=True)
+    if result.returncode:
+        raise PatchError(f"git {args[0]} failed in {repo}: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout
+
+
+def _read_blobs(repo: Path, commit: str, paths: list) -> dict:
+    """Read every ``commit:path`` as bytes in one ``cat-file --batch`` call; missing paths map to ``None``."""
+    if not paths:
+        return {}
+    out = _git(repo, "cat-file", "--batch", input="".join(f"{commit}:{p}\n" for p in paths).encode())
+    blobs, pos = {}, 0
+    for path in paths:
+        end = out.index(b"\n", pos)
+        header = out[pos:end]
+        pos = end + 1
+        if header.endswith(b" missing"):
+            blobs[path] = None
+            continue
+        _, kind, size = header.split()
+        size = int(size)
+        blobs[path] = out[pos:pos + size] if kind == b"blob" else None
+        pos += size + 1
+    return blobs
+
+
+def _modes(repo: Path, commit: str, paths: list) -> dict:
+    """``{path: mode}`` for the candidates present at ``commit`` (one ``ls-tree`` call)."""
+    modes = {}
+    if not paths:
+        return modes
+    for record in _git(repo, "ls-tree", "-z", "--full-tree", commit, "--", *paths).split(b"\0"):
+        if record:
+            meta, _, name = record.partition(b"\t")
+            modes[name.decode(errors="surrogateescape")] = meta.split()[0].decode()
+    return modes
+
+
+def _unpatchable(mode: str, data) -> str:
+    """Why a present target must be left alone, or ``None`` for a regular text file."""
+    if mode not in BLOB_MODES:
+        return f"not a regular file (mode {mode})"
+    if data is not None and b"\0" in data:
+        return "binary file"
+    return None
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "surrogateescape")
+
+
+def _display(text: str) -> str:
+    return _encode(text).decode("utf-8", "replace")
+
+
+def _ls_tree(repo: Path, tree: str) -> dict:
+    entries = {}
+    if tree is None:
+        return entries
+    for record in _git(repo, "ls-tree", "-z", tree).split(b"\0"):
+        if record:
+            meta, _, name = record.partition(b"\t")
+            mode, kind, oid = meta.decode().split()
+            entries[name] = (mode, kind, oid)
+    return entries
+
+
+def _write_tree(repo: Path, tree: str, changes: dict, prefix: str = "") -> str:
+    """Return a tree equal to ``tree`` with ``{path: blob_oid}`` applied, rebuilding only the touched subtrees.
+
+    Only regular files are replaced (keeping their mode); a symlink, submodule or
+    directory in the way of a change raises :class:`PatchError`.
+    """
+    entries = _ls_tree(repo, tree)
+    nested = {}
+    for path, oid in changes.items():
+        head, sep, rest = path.partition("/")
+        if sep:
+            nested.setdefault(head, {})[rest] = oid
+            continue
+        name = head.encode()
+        mode = entries[name][0] if name in entries else BLOB_MODE
+        if mode not in BLOB_MODES:
+            raise PatchError(f"{repo}: refusing to replace {prefix}{head} (mode {mode}) with a regular file")
+        entries[name] = (mode, "blob", oid)
+    for directory, sub in nested.items():
+        name = directory.encode()
+        current = entries.get(name)
+        if current and current[1] != "tree":
+            raise PatchError(f"{repo}: {prefix}{directory} is not a directory (mode {current[0]})")
+        entries[name] = (TREE_MODE, "tree", _write_tree(repo, current and current[2], sub, f"{prefix}{directory}/"))
+    records = b"".join(f"{mode} {kind} {oid}\t".encode() + name + b"\0" for name, (mode, kind, oid) in entries.items())
+    return _git(repo, "mktree", "-z", input=records).decode().strip()
+
+
+def _resolve_target(repo: Path, branch: str, base: str) -> tuple:
+    """Return ``(ref, parent_commit, expected_old)``; refuse a branch checked out in a working tree."""
+    bare, head = _git(repo, "rev-parse", "--is-bare-repository", "--symbolic-full-name", "HEAD").decode().split()
+    ref = f"refs/heads/{branch}" if branch else head
+    if ref == "HEAD":
+        raise PatchError(f"{repo}: HEAD is detached; pass --branch")
+    if bare == "false" and ref == head:
+        raise PatchError(f"{repo}: {ref} is checked out; pass --branch so the working tree is left alone")
+    try:
+        old = _git(repo, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}").decode().strip()
+        return ref, old, old
+    except PatchError:
+        parent = _git(repo, "rev-parse", "--verify", f"{base}^{{commit}}").decode().strip()
+        return ref, parent, ZERO_OID
+
+
+def patch_repo(repo: Path, spec: dict, branch: str = None, base: str = "HEAD", dry_run: bool = False) -> dict:
+    start = time.perf_counter()
+    report = {"repo": os.fspath(repo), "status": "unchanged", "files": {}}
+    try:
+        ref, parent, old = _resolve_target(repo, branch, base)
+        report["ref"] = ref
+        candidates = sorted({path for patch in spec["patches"] for path in patch["file"]})
+        data = _read_blobs(repo, parent, candidates)
+        modes = _modes(repo, parent, candidates)
+        skipped = {path: reason for path, mode in modes.items() if (reason := _unpatchable(mode, data.get(path)))}
+        # surrogateescape: text that is not valid UTF-8 is written back byte for byte.
+        blobs = {path: None if blob is None else blob.decode("utf-8", "surrogateescape") for path, blob in data.items()}
+        original = dict(blobs)
+        for patch in spec["patches"]:
+            path = next((p for p in patch["file"] if p in modes), patch["file"][0])
+            if path in skipped:
+                continue
+            blobs[path] = APPLY[patch["op"]](blobs.get(path), patch)
+        if skipped:
+            report["skipped"] = dict(sorted(skipped.items()))
+        changed = {path: text for path, text in blobs.items() if text is not None and text != original[path]}
+        for path in sorted(changed):
+            report["files"][path] = "added" if original[path] is None else "modified"
+
+        if changed and dry_run:
+            report["status"] = "would-patch"
+            report["diff"] = "".join(
+                "".join(difflib.unified_diff(
+                    _display(original[path] or "").splitlines(keepends=True),
+                    _display(changed[path]).splitlines(keepends=True),
+                    fromfile="/dev/null" if original[path] is None else f"a/{path}", tofile=f"b/{path}",
+                ))
+                for path in sorted(changed)
+            )
+        elif changed:
+            oids = {path: _git(repo, "hash-object", "-w", "--stdin", input=_encode(text)).decode().strip()
+                    for path, text in changed.items()}
+            tree = _write_tree(repo, f"{parent}^{{tree}}", oids)
+            commit = _git(repo, "commit-tree", tree, "-p", parent, input=spec["message"].encode()).decode().strip()
+            _git(repo, "update-ref", "-m", "flowchain patch", ref, commit, old)
+            report.update(status="patched", commit=commit)
+    except (PatchError, OSError) as e:
+        report.update(status="error", error=str(e))
+    report["seconds"] = round(time.perf_counter() - start, 4)
+    return report
+
+
+def discover_repos(top: Path) -> list:
+    """Git repositories directly under ``top`` (``name/.git`` or bare ``name.git``)."""
+    return sorted(p for p in Path(top).iterdir() if (p / ".git").exists() or (p.suffix == ".git" and (p / "HEAD").is_file()))
+
+
+def patch_many(repos: list, spec: dict, branch: str = None, base: str = "HEAD", dry_run: bool = False,
+               workers: int = MAX_WORKERS) -> dict:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(pool.map(lambda repo: patch_repo(Path(repo), spec, branch, base, dry_run), repos))
+    statuses = [r["status"] for r in reports]
+    return {
+        "dry_run": dry_run,
+        "repos": len(reports),
+        "patched": statuses.count("would-patch" if dry_run else "patched"),
+        "unchanged": statuses.count("unchanged"),
+        "errors": statuses.count("error"),
+        "seconds": round(time.perf_counter() - start, 4),
+        "results": reports,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Apply declarative FlowChain doc patches to many repositories")
+    parser.add_argument("repos", nargs="*", type=Path, help="Local repositories (default: .)")
+    parser.add_argument("-p", "--patch", action="append", required=True, type=Path, help="Patch spec (repeatable)")
+    parser.add_argument("--discover", type=Path, help="Also patch every repository directly under this directory")
+    parser.add_argument("--branch", help="Branch to commit to (created from --base if missing; default: the current branch of bare repos)")
+    parser.add_argument("--base", default="HEAD", help="Start point for a new --branch (default: HEAD)")
+    parser.add_argument("--message", help="Commit message (default: the spec's)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Repositories processed in parallel")
+    parser.add_argument("--dry-run", action="store_true", help="Print the diff for each repository; write nothing")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        spec = load_spec(args.patch)
+    except (PatchError, OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+    if args.message:
+        spec["message"] = args.message
+    repos = list(args.repos) + (discover_repos(args.discover) if args.discover else [])
+    report = patch_many(repos or [Path(".")], spec, args.branch, args.base, args.dry_run, args.workers)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        icons = {"patched": "✅", "would-patch": "🧪", "unchanged": "⏭ ", "error": "❌"}
+        for result in report["results"]:
+            print(result.get("diff", ""), end="")
+            detail = result.get("error") or ", ".join(
+                [f"{path} {status}" for path, status in result["files"].items()]
+                + [f"{path} skipped ({reason})" for path, reason in result.get("skipped", {}).items()]
+            )
+            print(f"{icons[result['status']]} {result['repo']} [{result['status']}] {result['seconds'] * 1000:.0f} ms"
+                  + (f" — {detail}" if detail else ""))
+        print(f"📦 {report['patched']} patched, {report['unchanged']} unchanged, {report['errors']} failed "
+              f"across {report['repos']} repo(s) in {report['seconds']:.2f}s")
+    return int(bool(report["errors"]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""LLM response cache for repeated agent validations.
+
+Keys are built from the model, the normalized prompt, a hash of every doc
+section the prompt relies on, and the current phase (``flow_state.json``
+plus any logged events).
+When a referenced section or the phase changes the key changes with it, so
+only affected validations go back to the network; stale rows age out via
+LRU + TTL eviction. Entries live in SQLite under ``.flowchain/cache``.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+
+from flowchain.cache import CACHE_DIR
+from flowchain.events import EVENT_LOG
+from flowchain.sections import index_document
+from flowchain.state import STATE_FILE, FlowState
+
+RESPONSE_CACHE = "responses.sqlite3"
+MAX_ENTRIES = 10_000
+TTL = 7 * 24 * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    refs TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", prompt)).strip()
+
+
+class ResponseCache:
+    def __init__(self, path: Path = CACHE_DIR / RESPONSE_CACHE, max_entries: int = MAX_ENTRIES, ttl: float = TTL,
+                 state_path: Path = STATE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.state_path = Path(state_path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._section_hashes = {}
+        self._phase = (None, None)
+
+    # ────────── key material ──────────
+
+    def phase(self) -> str:
+        """The current phase, event log included (re-read only when the snapshot or log changed)."""
+        stamp = []
+        for path in (self.state_path, self.state_path.parent / EVENT_LOG):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                if path == self.state_path:
+                    return ""
+                st = None
+            stamp.append(st and (st.st_mtime_ns, st.st_size))
+        stamp = tuple(stamp)
+        if self._phase[0] != stamp:
+            self._phase = (stamp, FlowState.load(self.state_path).current_step)
+        return self._phase[1]
+
+    def section_hash(self, path: Path, section: str = None) -> str:
+        """SHA-256 of one section (or the whole doc when ``section`` is ``None``)."""
+        st = Path(path).stat()
+        memo = (os.fspath(Path(path).resolve()), section, st.st_mtime_ns, st.st_size)
+        if memo not in self._section_hashes:
+            index = index_document(path)
+            if section is None:
+                data = index.read_bytes(0, index.size)
+            else:
+                found = index.get(section)
+                data = index.read(found).encode() if found else b""
+            self._section_hashes[memo] = hashlib.sha256(data).hexdigest()
+        return self._section_hashes[memo]
+
+    def key(self, model: str, prompt: str, refs=()) -> str:
+        """``refs`` is an iterable of ``(doc_path, section_title_or_None)``."""
+        parts = [model, normalize_prompt(prompt), self.phase()]
+        for doc, section in sorted(refs, key=lambda ref: (os.fspath(ref[0]), ref[1] or "")):
+            parts.append(f"{doc}#{section or ''}={self.section_hash(doc, section)}")
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    # ────────── storage ──────────
+
+    def get(self, key: str):
+        now = time.time()
+        row = self.db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        if row[1] + self.ttl <= now:
+            with self.db:
+                self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            self.misses += 1
+            return None
+        with self.db:
+            self.db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, model: str, response: str, refs=()):
+        now = time.time()
+        refs = json.dumps([[os.fspath(doc), section] for doc, section in refs])
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, refs, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, refs, now, now),
+            )
+            (count,) = self.db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if count > self.max_entries:
+                cursor = self.db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+                self.evictions += cursor.rowcount
+
+    def purge_expired(self) -> int:
+        with self.db:
+            cursor = self.db.execute("DELETE FROM responses WHERE created <= ?", (time.time() - self.ttl,))
+        self.evictions += cursor.rowcount
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        (entries,) = self.db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,262 @@
+"""Rotate ``GPT_AGENT_API_KEY`` in ``chat.env`` — singly, dual-key with a grace window, or in bulk from a manifest.
+
+    python -m flowchain.rotate [--dry-run] [--dual --grace 3600] [--prune]
+    python -m flowchain.rotate --manifest envs.json --workers 16
+"""
+
+import os
+import secrets
+import difflib
+import hashlib
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import argparse
+
+# Constants
+ENV_FILE = "chat.env"
+ENV_EXAMPLE = "chat.env.example"
+ENV_VAR = "GPT_AGENT_API_KEY"
+MAX_WORKERS = 16
+PREVIOUS_SUFFIX = "_PREVIOUS"
+EXPIRES_SUFFIX = "_PREVIOUS_EXPIRES"
+DEFAULT_GRACE = 3600
+
+def generate_api_key() -> str:
+    return secrets.token_hex(32)
+
+def fingerprint(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:12]
+
+class EnvFile:
+    """An env file parsed once into its lines plus a KEY → line-number index."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.existed = path.exists()
+        self.original = path.read_text() if self.existed else ""
+        self.lines = self.original.splitlines()
+        self.index = {}
+        for i, line in enumerate(self.lines):
+            key, sep, _ = line.partition("=")
+            if sep and key not in self.index:
+                self.index[key] = i
+
+    def get(self, key: str):
+        i = self.index.get(key)
+        return None if i is None else self.lines[i].partition("=")[2]
+
+    def set(self, key: str, value: str) -> str:
+        """Set ``key`` and return "updated", "added" or "unchanged"."""
+        line = f"{key}={value}"
+        i = self.index.get(key)
+        if i is None:
+            self.index[key] = len(self.lines)
+            self.lines.append(line)
+            return "added"
+        if self.lines[i] == line:
+            return "unchanged"
+        self.lines[i] = line
+        return "updated"
+
+    def delete(self, key: str) -> bool:
+        i = self.index.pop(key, None)
+        if i is None:
+            return False
+        del self.lines[i]
+        self.index = {k: j - (j > i) for k, j in self.index.items()}
+        return True
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+    def diff(self, mask: bool = True) -> str:
+        before, after = self.original, self.render()
+        if mask:
+            before, after = _mask(before), _mask(after)
+        return "".join(difflib.unified_diff(
+            before.splitlines(keepends=True), after.splitlines(keepends=True),
+            fromfile=f"a/{self.path}", tofile=f"b/{self.path}",
+        ))
+
+    def write(self):
+        """Atomically replace the file: temp file in the same dir, fsync, rename."""
+        mode = self.path.stat().st_mode & 0o777 if self.existed else 0o600
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(self.render())
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.chmod(tmp, mode)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+def _mask(text: str) -> str:
+    lines = []
+    for line in text.splitlines(keepends=True):
+        key, sep, value = line.rstrip("\n").partition("=")
+        lines.append(f"{key}=<sha256:{fingerprint(value)}>\n" if sep and value else line)
+    return "".join(lines)
+
+def update_env_file(path: Path, key_name: str, new_key: str, dry_run: bool = False):
+    env = EnvFile(path)
+    env.set(key_name, new_key)
+
+    if dry_run:
+        print(f"[DRY-RUN] Would update {path.name}:\n" + env.diff())
+        return
+
+    env.write()
+    print(f"✅ Updated {path.name}")
+
+def rotate_dual(path: Path, key_name: str, new_key: str, grace: float, dry_run: bool = False):
+    """Zero-downtime rotation: the old key stays valid as ``<KEY>_PREVIOUS`` until the grace window ends."""
+    env = EnvFile(path)
+    current = env.get(key_name)
+    if current:
+        env.set(key_name + PREVIOUS_SUFFIX, current)
+        env.set(key_name + EXPIRES_SUFFIX, str(int(time.time() + grace)))
+    env.set(key_name, new_key)
+
+    if dry_run:
+        print(f"[DRY-RUN] Would update {path.name}:\n" + env.diff())
+        return
+
+    env.write()
+    print(f"✅ Updated {path.name} (previous key valid for {grace:.0f}s)")
+
+def prune_previous(path: Path, key_name: str, dry_run: bool = False, now: float = None) -> bool:
+    """Drop the previous key once its grace window has passed."""
+    env = EnvFile(path)
+    expires = env.get(key_name + EXPIRES_SUFFIX)
+    if expires is None or float(expires) > (now or time.time()):
+        return False
+    env.delete(key_name + PREVIOUS_SUFFIX)
+    env.delete(key_name + EXPIRES_SUFFIX)
+    if dry_run:
+        print(f"[DRY-RUN] Would prune {path.name}:\n" + env.diff())
+    else:
+        env.write()
+        print(f"🧹 Pruned expired previous key from {path.name}")
+    return True
+
+def rotate_file(path: Path, keys: dict, dry_run: bool = False, mask: bool = True) -> dict:
+    """Apply every key update for one file in a single parse/write; ``None`` values get a fresh key."""
+    try:
+        env = EnvFile(path)
+        changes = {}
+        for key, value in keys.items():
+            value = generate_api_key() if value is None else value
+            changes[key] = {"status": env.set(key, value), "fingerprint": fingerprint(value)}
+        changed = any(c["status"] != "unchanged" for c in changes.values())
+        report = {"file": str(path), "status": "ok", "changed": changed, "keys": changes}
+        if dry_run:
+            report["diff"] = env.diff(mask)
+        elif changed:
+            env.write()
+        return report
+    except OSError as e:
+        return {"file": str(path), "status": "error", "error": str(e)}
+
+def load_manifest(path: Path) -> list:
+    """Manifest: ``[{"file": "agents/a/chat.env", "keys": {"GPT_AGENT_API_KEY": null}}, ...]``.
+
+    Entries naming the same file (however spelled) are merged, later keys
+    winning, so each file gets exactly one read-modify-write.
+    """
+    entries = json.loads(path.read_text())
+    if not isinstance(entries, list):
+        raise ValueError("expected a JSON list of {\"file\": ..., \"keys\": {...}} entries")
+    base = path.parent
+    manifest = {}
+    for i, entry in enumerate(entries):
+        try:
+            file, keys = base / entry["file"], dict(entry["keys"])
+            manifest.setdefault(file.resolve(), (file, {}))[1].update(keys)
+        except KeyError as e:
+            raise ValueError(f"entry {i} has no {e} field") from None
+        except (TypeError, ValueError):
+            raise ValueError(f"entry {i} must be an object with a \"file\" path and a \"keys\" object") from None
+    return list(manifest.values())
+
+def rotate_batch(manifest: list, dry_run: bool = False, workers: int = MAX_WORKERS, mask: bool = True) -> dict:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(pool.map(lambda item: rotate_file(item[0], item[1], dry_run, mask), manifest))
+    return {
+        "dry_run": dry_run,
+        "files": len(reports),
+        "changed": sum(1 for r in reports if r.get("changed")),
+        "errors": sum(1 for r in reports if r["status"] == "error"),
+        "results": reports,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GPT Agent API Key Rotator")
+    parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying them")
+    parser.add_argument("--manifest", type=Path, help="Batch mode: JSON list of env files and the keys to rotate in each")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Files processed in parallel in batch mode")
+    parser.add_argument("--report", type=Path, help="Write the batch rotation report here instead of stdout")
+    parser.add_argument("--show-secrets", action="store_true", help="Do not mask values in dry-run diffs")
+    parser.add_argument("--dual", action="store_true", help="Keep the old key valid as the previous key for --grace seconds")
+    parser.add_argument("--grace", type=float, default=DEFAULT_GRACE, help="Grace window for --dual (seconds)")
+    parser.add_argument("--prune", action="store_true", help="Remove the previous key if its grace window has ended")
+    args = parser.parse_args(argv)
+
+    if args.prune:
+        if not prune_previous(Path(ENV_FILE), ENV_VAR, args.dry_run):
+            print("⏳ No expired previous key to prune.")
+        return
+
+    if args.manifest:
+        try:
+            manifest = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"❌ Invalid manifest {args.manifest}: {e}")
+            raise SystemExit(1)
+        report = rotate_batch(manifest, args.dry_run, args.workers, not args.show_secrets)
+        if args.dry_run:
+            for result in report["results"]:
+                print(result.get("diff", ""), end="")
+        output = json.dumps(report, indent=2)
+        if args.report:
+            args.report.write_text(output + "\n")
+        if args.dry_run or args.report:
+            for result in report["results"]:
+                if result["status"] == "error":
+                    print(f"❌ {result['file']}: {result['error']}")
+            summary = "🧪 Dry-run: {changed}/{files} files would change" if args.dry_run else "🔁 {changed}/{files} files changed"
+            print((summary + ", {errors} errors").format(**report))
+            if args.report:
+                print(f"🧾 Rotation report written to {args.report}")
+        else:
+            print(output)
+        if report["errors"]:
+            raise SystemExit(1)
+        return
+
+    current_key = os.getenv(ENV_VAR) or EnvFile(Path(ENV_FILE)).get(ENV_VAR)
+    if not current_key:
+        raise EnvironmentError(f"{ENV_VAR} not found in the environment or {ENV_FILE}. Run 'make check-env' first.")
+
+    print("🔐 Rotating API key...")
+
+    new_key = generate_api_key()
+
+    if args.dual:
+        rotate_dual(Path(ENV_FILE), ENV_VAR, new_key, args.grace, args.dry_run)
+    else:
+        update_env_file(Path(ENV_FILE), ENV_VAR, new_key, args.dry_run)
+    update_env_file(Path(ENV_EXAMPLE), ENV_VAR, "your-api-key-here", args.dry_run)
+
+    if args.dry_run:
+        print("🧪 Dry-run complete. No changes written.")
+    else:
+        print("🔁 API key rotated successfully.")
+
+if __name__ == "__main__":
+    main()
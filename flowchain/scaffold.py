@@ -0,0 +1,187 @@
+"""Project scaffolding engine.
+
+Renders every file a FlowChain project starts with from ``templates/``:
+the tree under ``templates/project/`` plus each top-level
+``NAME.template.EXT`` (written as ``NAME.EXT``). Templates are read and
+compiled once per run into literal/variable segments, so a project is a
+handful of string joins and writes rather than a fork/exec per file.
+``$project_name`` is the only variable today.
+
+Existing files are kept (like ``create_if_missing`` in ``core/init.sh``);
+with ``--overwrite`` they are re-rendered, and files whose content already
+matches are left untouched so their mtimes (and the validation cache)
+stay valid.
+
+    python -m flowchain.scaffold .                         # scaffold in place
+    python -m flowchain.scaffold fleet/ --count 500        # fleet/project-000 … project-499
+    python -m flowchain.scaffold fleet/ --name api --name ui --overwrite
+"""
+
+import argparse
+import json
+import os
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from flowchain.cache import CACHE_DIR
+from flowchain.forms import PROJECT_NAME
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+PROJECT_TREE = "project"
+TEMPLATE_INFIX = ".template"
+# Local state a validate/scaffold run may leave inside the template tree; never copied.
+# Other hidden directories (``.github``) are part of the template.
+SKIP_DIRS = {CACHE_DIR.parts[0], ".git", "__pycache__", "node_modules"}
+
+
+class ScaffoldError(ValueError):
+    """Raised for an invalid project name or an unknown template variable."""
+
+
+class CompiledTemplate:
+    """A ``string.Template`` split once into ``(literal, variable)`` segments."""
+
+    __slots__ = ("segments", "static")
+
+    def __init__(self, text: str):
+        segments, pos = [], 0
+        for match in string.Template.pattern.finditer(text):
+            name = match["named"] or match["braced"]
+            if name is None:
+                # ``$$`` is a literal ``$``; an invalid placeholder (e.g. ``${{ ... }}``) stays as written.
+                literal = "$" if match["escaped"] is not None else match.group()
+                segments.append((text[pos:match.start()] + literal, None))
+            else:
+                segments.append((text[pos:match.start()], name))
+            pos = match.end()
+        segments.append((text[pos:], None))
+        self.segments = tuple(segments)
+        self.static = None if any(name for _, name in segments) else "".join(lit for lit, _ in segments).encode()
+
+    def render(self, variables: dict) -> bytes:
+        if self.static is not None:
+            return self.static
+        try:
+            return "".join(lit + (variables[name] if name else "") for lit, name in self.segments).encode()
+        except KeyError as e:
+            raise ScaffoldError(f"Unknown template variable ${e.args[0]}") from None
+
+
+def load_templates(directory: Path = TEMPLATES_DIR) -> dict:
+    """Walk ``directory`` once and return ``{relative output path: CompiledTemplate}``."""
+    directory = Path(directory)
+    templates = {}
+    for entry in os.scandir(directory):
+        stem, dot, ext = entry.name.partition(TEMPLATE_INFIX + ".")
+        if entry.is_file() and dot:
+            templates[f"{stem}.{ext}"] = CompiledTemplate(Path(entry.path).read_text())
+    tree = directory / PROJECT_TREE
+    for dirpath, dirnames, filenames in os.walk(tree):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            templates.setdefault(path.relative_to(tree).as_posix(), CompiledTemplate(path.read_text()))
+    return dict(sorted(templates.items()))
+
+
+def _existing(root: Path, directories) -> dict:
+    """Stat everything in the template's directories with one ``scandir`` each."""
+    found = {}
+    for rel in directories:
+        try:
+            with os.scandir(root / rel) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        found[f"{rel}/{entry.name}" if rel else entry.name] = entry.stat().st_size
+        except FileNotFoundError:
+            (root / rel).mkdir(parents=True, exist_ok=True)
+    return found
+
+
+def scaffold_project(root: Path, templates: dict, project_name: str = None, overwrite: bool = False) -> dict:
+    """Render ``templates`` into ``root``; return ``{path: created|updated|unchanged|skipped}``."""
+    root = Path(root)
+    project_name = project_name or root.resolve().name
+    if not PROJECT_NAME.match(project_name):
+        raise ScaffoldError(f"Invalid project name '{project_name}'")
+    variables = {"project_name": project_name}
+
+    existing = _existing(root, sorted({os.path.dirname(rel) for rel in templates}))
+    outcome = {}
+    for rel, template in templates.items():
+        size = existing.get(rel)
+        if size is not None and not overwrite:
+            outcome[rel] = "skipped"
+            continue
+        data = template.render(variables)
+        path = root / rel
+        if size == len(data) and path.read_bytes() == data:
+            outcome[rel] = "unchanged"
+            continue
+        path.write_bytes(data)
+        outcome[rel] = "created" if size is None else "updated"
+    return outcome
+
+
+def scaffold_many(top: Path, names: list, templates: dict = None, overwrite: bool = False, jobs: int = 8) -> dict:
+    """Scaffold ``top/<name>`` for every name; returns ``{name: outcome}``."""
+    templates = templates if templates is not None else load_templates()
+    top = Path(top)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        outcomes = pool.map(lambda name: scaffold_project(top / name, templates, name, overwrite), names)
+        return dict(zip(names, outcomes))
+
+
+ICONS = {"created": "✅ Created", "updated": "🔄 Updated", "unchanged": "➖ Unchanged", "skipped": "⚠️  Skipped"}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scaffold FlowChain projects from templates/")
+    parser.add_argument("dest", nargs="?", default=".", help="Project directory, or the parent with --name/--count")
+    parser.add_argument("--name", action="append", default=[], help="Scaffold DEST/NAME (repeatable)")
+    parser.add_argument("--count", type=int, default=0, help="Scaffold COUNT numbered projects under DEST")
+    parser.add_argument("--prefix", default="project-", help="Name prefix for --count (default: project-)")
+    parser.add_argument("--project-name", help="Name for in-place scaffolding (default: DEST's basename)")
+    parser.add_argument("--templates", default=TEMPLATES_DIR, type=Path, help="Templates directory")
+    parser.add_argument("--overwrite", action="store_true", help="Re-render existing files (unchanged ones are skipped)")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="Projects written concurrently")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List every file")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    width = len(str(max(args.count - 1, 0)))
+    names = args.name + [f"{args.prefix}{i:0{width}d}" for i in range(args.count)]
+    start = time.perf_counter()
+    try:
+        templates = load_templates(args.templates)
+        if names:
+            results = scaffold_many(Path(args.dest), names, templates, args.overwrite, args.jobs)
+        else:
+            results = {args.dest: scaffold_project(Path(args.dest), templates, args.project_name, args.overwrite)}
+    except ScaffoldError as e:
+        print(f"❌ {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    totals = {}
+    for outcome in results.values():
+        for status in outcome.values():
+            totals[status] = totals.get(status, 0) + 1
+    if args.json:
+        print(json.dumps({"projects": len(results), "files": totals, "seconds": round(elapsed, 3)}, indent=2))
+        return 0
+    if args.verbose:
+        for project, outcome in results.items():
+            prefix = f"{project}/" if names else ""
+            for rel, status in outcome.items():
+                print(f"{ICONS[status]} {prefix}{rel}")
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(totals.items()))
+    print(f"📦 Scaffolded {len(results)} project(s) in {elapsed:.2f}s: {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Streaming section index for FlowChain Markdown docs.
+
+One pass over a document records its YAML front matter (``title`` / ``env``
+/ ``version``), the heading tree with byte offsets, and the location of every
+enforcement marker. Consumers then fetch a single section by seeking to its
+offsets instead of re-reading and re-scanning the whole file. Large files are
+memory-mapped, and indexes are shared per process until the file changes.
+
+Like ``core/init.sh``, headings are recognised line by line; fenced code
+blocks are not special-cased.
+"""
+
+import bisect
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowchain.validate import (
+    CONTRADICTION_MARKER,
+    MISSING_SECTION_MARKER,
+    PLACEHOLDER_MARKER,
+)
+
+MMAP_THRESHOLD = 1 << 20
+
+MARKERS = {
+    "placeholder": PLACEHOLDER_MARKER.encode(),
+    "missing_section": MISSING_SECTION_MARKER.encode(),
+    "contradiction": CONTRADICTION_MARKER.encode(),
+}
+
+_HEADING = re.compile(rb"(#{1,6})[ \t]+([^\r\n]*?)[ \t]*\r?$", re.MULTILINE)
+_FRONT_MATTER_END = re.compile(rb"^---[ \t]*\r?$", re.MULTILINE)
+
+
+@dataclass(slots=True)
+class Section:
+    title: str
+    level: int
+    start: int  # offset of the heading line
+    body_start: int  # offset just past the heading line
+    body_end: int  # next heading of any level
+    end: int  # next heading of the same or a higher level
+    parent: int = None
+    markers: list = field(default_factory=list)  # (kind, offset) inside [start, body_end)
+
+    @property
+    def heading(self) -> str:
+        return f"{'#' * self.level} {self.title}" if self.level else ""
+
+
+def _parse_front_matter(buf) -> tuple:
+    """Return ``(front_matter, end_offset)`` for a leading ``---`` block."""
+    if buf[:4] not in (b"---\n", b"---\r"):
+        return {}, 0
+    close = _FRONT_MATTER_END.search(buf, 4)
+    if not close:
+        return {}, 0
+    front = {}
+    for line in bytes(buf[4:close.start()]).decode("utf-8", "replace").splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip():
+            front[key.strip()] = value.strip().strip("\"'")
+    end = buf.find(b"\n", close.start())
+    return front, len(buf) if end == -1 else end + 1
+
+
+def _next_hash_line(buf, pos: int) -> int:
+    found = buf.find(b"\n#", pos)
+    return -1 if found == -1 else found + 1
+
+
+def _headings(buf, start: int):
+    """Yield ``(offset, match)`` for headings, probing only line starts that begin with ``#``."""
+    pos = start if buf[start:start + 1] == b"#" else _next_hash_line(buf, start)
+    while pos != -1:
+        match = _HEADING.match(buf, pos)
+        if match:
+            yield pos, match
+        pos = _next_hash_line(buf, pos)
+
+
+class SectionIndex:
+    def __init__(self, path: Path, front_matter: dict, sections: list, size: int):
+        self.path = Path(path)
+        self.front_matter = front_matter
+        self.sections = sections  # sections[0] is the preamble before the first heading
+        self.size = size
+        self._starts = [section.start for section in sections]
+        self._by_title = {}
+        for i, section in enumerate(sections):
+            self._by_title.setdefault(section.title, i)
+            self._by_title.setdefault(section.heading, i)
+
+    @classmethod
+    def build(cls, path: Path) -> "SectionIndex":
+        path = Path(path)
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    return cls._from_buffer(path, buf, size)
+            return cls._from_buffer(path, handle.read(), size)
+
+    @classmethod
+    def _from_buffer(cls, path: Path, buf, size: int) -> "SectionIndex":
+        front_matter, offset = _parse_front_matter(buf)
+        sections = [Section("", 0, offset, offset, size, size)]
+        stack = [0]
+        for pos, match in _headings(buf, offset):
+            level = len(match.group(1))
+            while sections[stack[-1]].level >= level:
+                sections[stack.pop()].end = pos
+            sections[-1].body_end = pos
+            title = match.group(2).decode("utf-8", "replace").rstrip("#").rstrip()
+            sections.append(Section(title, level, pos, min(match.end() + 1, size), size, size, stack[-1]))
+            stack.append(len(sections) - 1)
+
+        index = cls(path, front_matter, sections, size)
+        for kind, marker in MARKERS.items():
+            pos = buf.find(marker, offset)
+            while pos != -1:
+                index.section_at(pos).markers.append((kind, pos))
+                pos = buf.find(marker, pos + len(marker))
+        for section in sections:
+            section.markers.sort(key=lambda item: item[1])
+        return index
+
+    # ────────── lookups ──────────
+
+    def section_at(self, offset: int) -> Section:
+        return self.sections[bisect.bisect_right(self._starts, offset) - 1]
+
+    def get(self, title: str) -> Section:
+        """Find a section by title (``"Enforcement Rules"``) or heading (``"## Enforcement Rules"``)."""
+        i = self._by_title.get(title.strip())
+        return None if i is None else self.sections[i]
+
+    def children(self, section: Section) -> list:
+        me = self.sections.index(section)
+        return [s for s in self.sections if s.parent == me]
+
+    def markers(self, kind: str = None) -> list:
+        found = [m for section in self.sections for m in section.markers]
+        return [m for m in found if kind is None or m[0] == kind]
+
+    def read_bytes(self, start: int, end: int) -> bytes:
+        with self.path.open("rb") as handle:
+            handle.seek(start)
+            return handle.read(end - start)
+
+    def read(self, section, include_children: bool = True, include_heading: bool = True) -> str:
+        """Return the text of one section, reading only its byte range."""
+        if isinstance(section, str):
+            found = self.get(section)
+            if found is None:
+                raise KeyError(section)
+            section = found
+        start = section.start if include_heading else section.body_start
+        end = section.end if include_children else section.body_end
+        return self.read_bytes(start, end).decode("utf-8", "replace")
+
+
+_INDEXES = {}
+
+
+def index_document(path: Path) -> SectionIndex:
+    """Return the shared index for ``path``, rebuilding it only when the file changed."""
+    path = Path(path)
+    st = path.stat()
+    key = os.fspath(path.resolve())
+    cached = _INDEXES.get(key)
+    if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+    index = SectionIndex.build(path)
+    _INDEXES[key] = ((st.st_mtime_ns, st.st_size), index)
+    return index
@@ -0,0 +1,382 @@
+"""Long-running FlowChain service.
+
+Keeps a process pool, parsed docs, validation caches and GitHub sessions warm
+across requests instead of paying interpreter start-up per ``os.system``
+call. Long operations run as jobs with IDs; their progress streams over
+Server-Sent Events.
+
+    python -m flowchain.service --port 8000
+    curl -X POST localhost:8000/validate -d '{"root": ".", "recursive": true}'
+    curl -N localhost:8000/jobs/<id>/events
+
+``GET /metrics`` serves Prometheus text (disable with ``FLOWCHAIN_METRICS=0``).
+Every ``root`` a request names is resolved against ``--root`` (or
+``FLOWCHAIN_ROOT``, default: the working directory at start-up); paths that
+escape it are refused with 403. With ``--key-file chat.env`` (or
+``FLOWCHAIN_KEY_FILE``) every endpoint but
+``/health`` requires ``Authorization: Bearer <GPT_AGENT_API_KEY>``; keys
+rotated with ``flowchain rotate --dual`` are picked up without a restart.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from flowchain import __version__, telemetry
+from flowchain.hooks import HookRunner, declared_hooks
+from flowchain.intake import Intake, QueueFull
+from flowchain.keys import KeyProvider
+from flowchain.state import PHASES, STATE_FILE, FlowState, TransitionError, transaction
+from flowchain.validate import build_report, discover_projects, validate_projects
+
+BATCH_SIZE = 32
+MAX_FINISHED_JOBS = 1000
+
+_pool: Optional[ProcessPoolExecutor] = None
+_keys: Optional[KeyProvider] = None
+_hooks: Optional[HookRunner] = None
+_github_clients = {}
+_base: Optional[Path] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pool, _keys, _hooks, _base
+    _base = Path(os.getenv("FLOWCHAIN_ROOT", ".")).resolve()
+    if os.getenv("FLOWCHAIN_METRICS", "1") != "0":
+        telemetry.enable()
+    _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    _hooks = HookRunner()
+    key_file = os.getenv("FLOWCHAIN_KEY_FILE")
+    if key_file:
+        _keys = KeyProvider(key_file).start()
+    try:
+        yield
+    finally:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+        _hooks.close()
+        _hooks = None
+        if _keys is not None:
+            _keys.stop()
+            _keys = None
+
+
+app = FastAPI(title="FlowChain", version=__version__, lifespan=lifespan)
+
+
+def _confine(root: str) -> str:
+    """Resolve a client-supplied ``root`` under the service base directory; 403 if it escapes."""
+    base = _base or Path(os.getenv("FLOWCHAIN_ROOT", ".")).resolve()
+    path = (base / root).resolve()
+    if not path.is_relative_to(base):
+        raise HTTPException(status_code=403, detail=f"root '{root}' is outside the service root")
+    return str(path)
+
+
+@app.middleware("http")
+async def require_key(request: Request, call_next):
+    if _keys is not None and request.url.path != "/health":
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not _keys.verify(token):
+            return JSONResponse({"detail": "Invalid or missing API key"}, status_code=401)
+    return await call_next(request)
+
+
+# ────────────────────────────────
+# 📨 MODELS
+# ────────────────────────────────
+
+
+class ValidateRequest(BaseModel):
+    root: str = "."
+    recursive: bool = False
+    use_cache: bool = True
+
+
+class TransitionRequest(BaseModel):
+    root: str = "."
+    phase: str
+
+
+class IssueSyncRequest(BaseModel):
+    root: str = "docs"
+    repo: Optional[str] = None
+    api_url: Optional[str] = None
+    dry_run: bool = False
+
+
+class HookRunRequest(BaseModel):
+    root: str = "."
+    all: bool = False
+    context: dict = {}
+
+
+class IntakeRequest(BaseModel):
+    root: str = "."
+    requests: list[dict]
+
+
+class ProcessRequest(BaseModel):
+    operation: str  # validate | transition | sync_issues | run_hooks
+    params: dict = {}
+
+
+# ────────────────────────────────
+# 🧵 JOBS
+# ────────────────────────────────
+
+
+class Job:
+    def __init__(self, kind: str):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"
+        self.events = []
+        self.result = None
+        self.error = None
+        self._changed = asyncio.Condition()
+
+    async def emit(self, event: str, **data):
+        async with self._changed:
+            self.events.append({"event": event, **data})
+            self._changed.notify_all()
+
+    def summary(self) -> dict:
+        return {"id": self.id, "kind": self.kind, "status": self.status, "result": self.result, "error": self.error}
+
+    async def stream(self):
+        seen = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.events) > seen)
+                pending = self.events[seen:]
+            for item in pending:
+                seen += 1
+                yield f"event: {item['event']}\ndata: {json.dumps(item)}\n\n"
+                if item["event"] in ("done", "failed"):
+                    return
+
+
+_jobs = {}
+
+
+async def _run_job(job: Job, work):
+    job.status = "running"
+    await job.emit("started", kind=job.kind)
+    try:
+        with telemetry.span("flowchain_job", kind=job.kind):
+            job.result = await work(job)
+        job.status = "done"
+        await job.emit("done", result=job.result)
+    except Exception as e:
+        job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+        await job.emit("failed", error=job.error)
+    telemetry.count("flowchain_jobs_total", kind=job.kind, status=job.status)
+
+
+def _start_job(kind: str, work) -> Job:
+    finished = [key for key, job in _jobs.items() if job.status in ("done", "failed")]
+    for key in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[key]
+    job = Job(kind)
+    _jobs[job.id] = job
+    asyncio.get_running_loop().create_task(_run_job(job, work))
+    return job
+
+
+# ────────────────────────────────
+# ⚙️ OPERATIONS
+# ────────────────────────────────
+
+
+async def _validate(job: Job, request: ValidateRequest) -> dict:
+    top = Path(request.root)
+    roots = await asyncio.to_thread(discover_projects, top) if request.recursive else [top]
+    results, caches = {}, {}
+    for start in range(0, len(roots), BATCH_SIZE):
+        batch = roots[start:start + BATCH_SIZE]
+        got, cache = await asyncio.to_thread(
+            validate_projects, batch, use_cache=request.use_cache, executor=_pool
+        )
+        results.update(got)
+        caches.update(cache)
+        await job.emit("progress", done=len(results), total=len(roots))
+    return build_report(top, results, caches)
+
+
+def _transition(request: TransitionRequest) -> dict:
+    with transaction(Path(request.root) / STATE_FILE) as state:
+        state.advance(request.phase)
+    return state.to_dict()
+
+
+def _github_client(request: IssueSyncRequest):
+    from flowchain.cache import CACHE_DIR
+    from flowchain.issues import DEFAULT_API_URL, ETAG_CACHE, GitHubClient
+
+    repo = request.repo or os.environ.get("GITHUB_REPOSITORY")
+    if not repo:
+        raise ValueError("Repository not set. Pass repo or set GITHUB_REPOSITORY.")
+    api_url = request.api_url or os.environ.get("GITHUB_API_URL", DEFAULT_API_URL)
+    key = (repo, api_url, request.root)
+    if key not in _github_clients:
+        etags = Path(request.root) / CACHE_DIR / ETAG_CACHE
+        _github_clients[key] = GitHubClient(repo, os.environ.get("GITHUB_TOKEN"), api_url, etag_path=etags)
+    client = _github_clients[key]
+    client.calls = client.not_modified = 0
+    return client
+
+
+async def _sync_issues(job: Job, request: IssueSyncRequest) -> dict:
+    from flowchain.issues import sync
+
+    client = _github_client(request)
+    return await asyncio.to_thread(sync, Path(request.root), client, request.dry_run)
+
+
+async def _run_hooks(job: Job, request: HookRunRequest) -> dict:
+    hooks = await asyncio.to_thread(declared_hooks, Path(request.root))
+    context = {"root": os.path.abspath(request.root), **request.context}
+    results = await asyncio.to_thread(_hooks.run, hooks, context, not request.all)
+    return {"results": [result.to_dict() for result in results], "timings": _hooks.stats()}
+
+
+# ────────────────────────────────
+# 🌐 ENDPOINTS
+# ────────────────────────────────
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "version": __version__, "jobs": len(_jobs)}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of every span, histogram and counter."""
+    return telemetry.prometheus_text()
+
+
+@app.post("/validate", status_code=202)
+async def validate(request: ValidateRequest):
+    request.root = _confine(request.root)
+    job = _start_job("validate", lambda job: _validate(job, request))
+    return job.summary()
+
+
+@app.get("/state")
+async def get_state(root: str = "."):
+    root = _confine(root)
+    try:
+        state = await asyncio.to_thread(FlowState.load, Path(root) / STATE_FILE)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"No {STATE_FILE} under {root}")
+    except TransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return state.to_dict()
+
+
+@app.post("/state/transition")
+async def transition(request: TransitionRequest):
+    request.root = _confine(request.root)
+    if request.phase not in PHASES:
+        raise HTTPException(status_code=422, detail=f"Unknown phase '{request.phase}'")
+    try:
+        return await asyncio.to_thread(_transition, request)
+    except TransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"No {STATE_FILE} under {request.root}")
+
+
+@app.post("/issues/sync", status_code=202)
+async def sync_issues(request: IssueSyncRequest):
+    request.root = _confine(request.root)
+    job = _start_job("sync_issues", lambda job: _sync_issues(job, request))
+    return job.summary()
+
+
+@app.post("/hooks/run", status_code=202)
+async def run_hooks(request: HookRunRequest):
+    request.root = _confine(request.root)
+    job = _start_job("run_hooks", lambda job: _run_hooks(job, request))
+    return job.summary()
+
+
+@app.post("/intake", status_code=202)
+async def intake(request: IntakeRequest):
+    """Durably queue agent requests in ``requests.jsonl``; 429 while the backlog is full."""
+    request.root = _confine(request.root)
+    try:
+        ids = await asyncio.to_thread(Intake(request.root).put_many, request.requests)
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    return {"ids": ids}
+
+
+@app.post("/process", status_code=202)
+async def process(request: ProcessRequest):
+    """Single entry point for GPT actions: dispatch an operation by name."""
+    if request.operation not in OPERATIONS:
+        raise HTTPException(status_code=422, detail=f"Unknown operation '{request.operation}'")
+    model, endpoint = OPERATIONS[request.operation]
+    try:
+        params = model(**request.params)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=jsonable_encoder(e.errors(include_url=False)))
+    return await endpoint(params)
+
+
+# operation → (params model, endpoint) for /process
+OPERATIONS = {
+    "validate": (ValidateRequest, validate),
+    "transition": (TransitionRequest, transition),
+    "sync_issues": (IssueSyncRequest, sync_issues),
+    "run_hooks": (HookRunRequest, run_hooks),
+}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    if job_id not in _jobs:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return _jobs[job_id].summary()
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    if job_id not in _jobs:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return StreamingResponse(_jobs[job_id].stream(), media_type="text/event-stream")
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="FlowChain service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--key-file", help="Require a bearer key from this env file (e.g. chat.env)")
+    parser.add_argument("--root", help="Directory every request's root must stay inside (default: .)")
+    args = parser.parse_args(argv)
+    if args.root:
+        os.environ["FLOWCHAIN_ROOT"] = args.root
+    if args.key_file:
+        os.environ["FLOWCHAIN_KEY_FILE"] = args.key_file
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Typed, transactional engine for ``flow_state.json``.
+
+Stage order is compiled once into lookup tables, so "Out-of-Order
+Progression = Error" is a dictionary probe rather than a walk over the
+history list. Writes go through a lock file and an atomic rename so
+concurrent agents never see a torn file or race a transition.
+
+    python -m flowchain.state show [--file flow_state.json]
+    python -m flowchain.state advance design_ready
+    python -m flowchain.state check design_ready
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flowchain import telemetry
+
+STATE_FILE = "flow_state.json"
+
+# ────────────────────────────────
+# 🔗 PHASE ORDER (docs/TECHNICAL_GUIDE.md, docs/USER_MANUAL.md)
+# ────────────────────────────────
+
+PHASES = (
+    "idea_captured",
+    "validation_passed",
+    "scaffold_generated",
+    "design_ready",
+    "build_started",
+    "review_passed",
+    "released",
+)
+
+PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+
+# Precomputed transition table: phase → the only phase it may advance to.
+TRANSITIONS = {current: nxt for current, nxt in zip(PHASES, PHASES[1:])}
+
+# Boolean flags in flow_state.json that mirror "has this phase been reached".
+PHASE_FLAGS = {
+    "docs_generated": "scaffold_generated",
+    "design_ready": "design_ready",
+    "build_started": "build_started",
+}
+
+
+class TransitionError(ValueError):
+    """Raised for out-of-order progression or an unknown phase."""
+
+
+def _phase_index(phase: str) -> int:
+    try:
+        return PHASE_INDEX[phase]
+    except KeyError:
+        raise TransitionError(f"Unknown phase '{phase}'. Expected one of: {', '.join(PHASES)}") from None
+
+
+@dataclass(slots=True)
+class FlowState:
+    project_name: str
+    current_step: str = PHASES[0]
+    last_validated_score: int = 0
+    override_flags: list = field(default_factory=list)
+    history: list = field(default_factory=list)
+    extra: dict = field(default_factory=dict)
+    _index: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._index = _phase_index(self.current_step)
+
+    # ────────── gate checks (O(1)) ──────────
+
+    def reached(self, phase: str) -> bool:
+        return self._index >= _phase_index(phase)
+
+    def can_advance(self, phase: str) -> bool:
+        return TRANSITIONS.get(self.current_step) == phase
+
+    def require(self, phase: str):
+        if not self.reached(phase):
+            raise TransitionError(f"Phase '{phase}' not reached (current: '{self.current_step}')")
+
+    def advance(self, phase: str):
+        _phase_index(phase)
+        if not self.can_advance(phase):
+            expected = TRANSITIONS.get(self.current_step, "nothing (final phase)")
+            raise TransitionError(
+                f"Out-of-order progression: '{self.current_step}' → '{phase}' (next allowed: {expected})"
+            )
+        self.current_step = phase
+        self._index += 1
+        self.history.append(phase)
+
+    # ────────── (de)serialisation ──────────
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FlowState":
+        """Build a state; flags that contradict ``current_step`` raise :class:`TransitionError`."""
+        data = dict(data)
+        flags = {flag: data.pop(flag) for flag in PHASE_FLAGS if flag in data}
+        fields = ("project_name", "current_step", "last_validated_score", "override_flags", "history")
+        known = {name: data.pop(name) for name in fields if name in data}
+        state = cls(extra=data, **known)
+        mismatched = [
+            f"{flag}={json.dumps(value)}" for flag, value in flags.items() if value != state.reached(PHASE_FLAGS[flag])
+        ]
+        if mismatched:
+            raise TransitionError(
+                f"Phase flags {', '.join(mismatched)} contradict current_step '{state.current_step}'"
+            )
+        return state
+
+    def to_dict(self) -> dict:
+        data = {
+            "project_name": self.project_name,
+            "current_step": self.current_step,
+            "last_validated_score": self.last_validated_score,
+        }
+        data.update({flag: self.reached(phase) for flag, phase in PHASE_FLAGS.items()})
+        data["override_flags"] = self.override_flags
+        data["history"] = self.history
+        data.update(self.extra)
+        return data
+
+    @classmethod
+    def read(cls, path: Path = STATE_FILE) -> "FlowState":
+        """The snapshot in ``path`` alone, ignoring any event log."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    @classmethod
+    def load(cls, path: Path = STATE_FILE) -> "FlowState":
+        """The current state: the snapshot plus the tail of ``flow_events.jsonl`` beside it, if any."""
+        from flowchain.events import EventLog  # events builds on this module
+
+        log = EventLog.for_state(path)
+        if log.log_path.exists():
+            return log.current()
+        return cls.read(path)
+
+    def save(self, path: Path = STATE_FILE):
+        """Atomically replace ``path`` (temp file + fsync + rename), keeping its permissions."""
+        path = Path(path)
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(self.to_dict(), handle, indent=2, ensure_ascii=False)
+                handle.write("\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+@contextmanager
+def locked(path: Path = STATE_FILE):
+    """Hold an exclusive lock on ``<path>.lock`` (the state file itself is replaced on save)."""
+    lock_path = Path(f"{path}.lock")
+    with open(lock_path, "a") as lock:
+        waiting = time.perf_counter()
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        telemetry.observe("flowchain_state_lock_wait_seconds", time.perf_counter() - waiting)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def transaction(path: Path = STATE_FILE):
+    """Load, mutate and save ``flow_state.json`` under the lock; nothing is written on error.
+
+    With a ``flow_events.jsonl`` beside it the change goes through the event log
+    (:meth:`flowchain.events.EventLog.transaction`), so both stay in step.
+    """
+    from flowchain.events import EventLog
+
+    log = EventLog.for_state(path)
+    with telemetry.span("flowchain_state_transaction"):
+        if log.log_path.exists():
+            with log.transaction() as state:
+                yield state
+            return
+        with locked(path):
+            state = FlowState.read(path)
+            yield state
+            state.save(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain state engine")
+    parser.add_argument("--file", default=STATE_FILE, help=f"State file (default: {STATE_FILE})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("show", help="Print the current state")
+    for name, text in (("advance", "Move to the next phase"), ("check", "Fail unless PHASE has been reached")):
+        sub.add_parser(name, help=text).add_argument("phase", choices=PHASES)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "show":
+            print(json.dumps(FlowState.load(args.file).to_dict(), indent=2, ensure_ascii=False))
+        elif args.command == "check":
+            FlowState.load(args.file).require(args.phase)
+            print(f"✅ Phase '{args.phase}' reached")
+        else:
+            with transaction(args.file) as state:
+                state.advance(args.phase)
+            print(f"✅ Advanced to '{args.phase}'")
+    except TransitionError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Spans, counters and histograms for FlowChain.
+
+Off by default: every entry point checks one module global and returns, and
+``span`` hands back a shared no-op context manager, so instrumented code
+costs a function call when nobody is listening. Turn it on with
+:func:`enable` (the service does), ``flowchain --trace FILE`` or
+``FLOWCHAIN_TRACE=FILE`` for CLI runs.
+
+Exports:
+
+* :func:`prometheus_text` — Prometheus text exposition (``GET /metrics``)
+* :func:`write_trace` — Chrome/Perfetto trace-event JSON plus a metrics snapshot
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+# Seconds; covers a single cached file check up to a slow model response.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_TRACE_EVENTS = 100_000
+
+_enabled = False
+_lock = threading.Lock()
+_counters = {}  # (name, labels) → float
+_histograms = {}  # (name, labels) → [bucket counts..., +Inf count, sum]
+_events = []
+_origin_ns = time.perf_counter_ns()
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _events.clear()
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# ────────────────────────────────
+# 📈 RECORDING
+# ────────────────────────────────
+
+
+def count(name: str, value: float = 1, **labels):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, seconds: float, **labels):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        row = _histograms.get(key)
+        if row is None:
+            row = _histograms[key] = [0] * (len(DEFAULT_BUCKETS) + 2)
+        row[bisect_left(DEFAULT_BUCKETS, seconds)] += 1
+        row[-1] += seconds
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "labels", "attrs", "start")
+
+    def __init__(self, name: str, labels: dict):
+        self.name = name
+        self.labels = labels
+        self.attrs = {}
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        seconds = (end - self.start) / 1e9
+        observe(f"{self.name}_seconds", seconds, **self.labels)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        event = {
+            "name": self.name,
+            "ph": "X",
+            "ts": (self.start - _origin_ns) / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {**self.labels, **self.attrs},
+        }
+        with _lock:
+            if len(_events) < MAX_TRACE_EVENTS:
+                _events.append(event)
+        return False
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+def span(name: str, **labels):
+    """Time a block: records a ``<name>_seconds`` histogram and a trace event."""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, labels)
+
+
+# ────────────────────────────────
+# 📤 EXPORTERS
+# ────────────────────────────────
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def prometheus_text() -> str:
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted((key, list(row)) for key, row in _histograms.items())
+    lines, typed = [], set()
+    for (name, labels), value in counters:
+        if name not in typed:
+            lines.append(f"# TYPE {name} counter")
+            typed.add(name)
+        lines.append(f"{name}{_labels(labels)} {value:g}")
+    for (name, labels), row in histograms:
+        if name not in typed:
+            lines.append(f"# TYPE {name} histogram")
+            typed.add(name)
+        cumulative = 0
+        for bound, n in zip(DEFAULT_BUCKETS, row):
+            cumulative += n
+            lines.append(f"{name}_bucket{_labels(labels, (('le', f'{bound:g}'),))} {cumulative}")
+        cumulative += row[len(DEFAULT_BUCKETS)]
+        lines.append(f"{name}_bucket{_labels(labels, (('le', '+Inf'),))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {row[-1]:.6f}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def snapshot() -> dict:
+    """Counters and histogram summaries as plain JSON."""
+    with _lock:
+        counters = [{"name": n, "labels": dict(l), "value": v} for (n, l), v in sorted(_counters.items())]
+        histograms = []
+        for (name, labels), row in sorted(_histograms.items()):
+            total = sum(row[:-1])
+            histograms.append({
+                "name": name,
+                "labels": dict(labels),
+                "count": total,
+                "sum": row[-1],
+                "mean": row[-1] / total if total else 0.0,
+                "buckets": dict(zip(map(str, DEFAULT_BUCKETS + ("+Inf",)), row[:-1])),
+            })
+    return {"counters": counters, "histograms": histograms}
+
+
+def write_trace(path: Path):
+    """Write ``{"traceEvents": [...], "metrics": {...}}``; opens in chrome://tracing or Perfetto."""
+    with _lock:
+        events = list(_events)
+    data = {"traceEvents": events, "displayTimeUnit": "ms", "metrics": snapshot()}
+    Path(path).write_text(json.dumps(data) + "\n")
@@ -0,0 +1,115 @@
+"""Content-addressed cache for model file uploads.
+
+Maps a file's SHA-256 to the URI / mime type the provider returned, so the
+same context file is uploaded once per expiry window instead of on every
+call. Entries are revalidated lazily with a cheap metadata lookup, and files
+that are not cached are uploaded concurrently.
+
+Works with any client exposing ``files.upload(file=...)`` and
+``files.get(name=...)`` (``google.genai.Client`` or a test fake).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from flowchain.cache import CACHE_DIR, write_json
+
+UPLOAD_CACHE = "uploads.json"
+
+# Gemini keeps uploaded files for 48 hours; stop reusing them a bit earlier.
+DEFAULT_TTL = 47 * 3600
+EXPIRY_MARGIN = 15 * 60
+REVALIDATE_AFTER = 3600
+MAX_CONCURRENT_UPLOADS = 4
+
+UploadedFile = namedtuple("UploadedFile", "name uri mime_type")
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _expiry(remote) -> float:
+    expires = getattr(remote, "expiration_time", None)
+    return expires.timestamp() if expires else time.time() + DEFAULT_TTL
+
+
+class UploadCache:
+    def __init__(self, client, path: Path = CACHE_DIR / UPLOAD_CACHE, revalidate_after: float = REVALIDATE_AFTER):
+        self.client = client
+        self.path = Path(path)
+        self.revalidate_after = revalidate_after
+        self.entries = {}
+        self.uploads = 0
+        self.hits = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            self.entries = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def save(self):
+        if not self.dirty:
+            return
+        write_json(self.path, self.entries, sort_keys=True)
+        self.dirty = False
+
+    def _fresh(self, entry: dict) -> bool:
+        now = time.time()
+        if entry["expires_at"] - EXPIRY_MARGIN <= now:
+            return False
+        if now - entry["checked_at"] < self.revalidate_after:
+            return True
+        try:
+            self.client.files.get(name=entry["name"])
+        except Exception:
+            return False
+        entry["checked_at"] = now
+        self.dirty = True
+        return True
+
+    def _upload(self, digest: str, path: Path) -> dict:
+        remote = self.client.files.upload(file=os.fspath(path))
+        entry = {
+            "name": remote.name,
+            "uri": remote.uri,
+            "mime_type": remote.mime_type,
+            "expires_at": _expiry(remote),
+            "checked_at": time.time(),
+        }
+        with self._lock:
+            self.entries[digest] = entry
+            self.uploads += 1
+            self.dirty = True
+        return entry
+
+    def upload_all(self, paths: list) -> list:
+        """Return an ``UploadedFile`` per path, uploading only uncached or expired content."""
+        digests = [sha256_file(path) for path in paths]
+        results = {}
+        missing = {}
+        for digest, path in zip(digests, paths):
+            entry = self.entries.get(digest)
+            if entry and self._fresh(entry):
+                self.hits += 1
+                results[digest] = entry
+            else:
+                missing.setdefault(digest, path)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_UPLOADS, len(missing))) as pool:
+                futures = {digest: pool.submit(self._upload, digest, path) for digest, path in missing.items()}
+            results.update({digest: future.result() for digest, future in futures.items()})
+        self.save()
+        return [UploadedFile(results[d]["name"], results[d]["uri"], results[d]["mime_type"]) for d in digests]
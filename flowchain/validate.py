@@ -0,0 +1,372 @@
+"""FlowChain compliance validator.
+
+Native port of the ``check_file`` loop in ``core/init.sh``. Each core file
+is read once, in blocks of whole lines; every block is checked for all
+markers at once and the read stops as soon as LEVEL 3 is reached.
+
+    python -m flowchain.validate [PROJECT_DIR]
+    python -m flowchain.validate --recursive --jobs 8 --json MONOREPO_DIR
+    python -m flowchain.validate core --docs docs
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from flowchain import telemetry
+from flowchain.cache import CACHE_DIR, ValidationCache, file_digest
+
+# ────────────────────────────────
+# 📏 ENFORCEMENT RULES (mirrors core/init.sh)
+# ────────────────────────────────
+
+CORE_FILES = (
+    "README.md",
+    "TECHNICAL_GUIDE.md",
+    "USER_MANUAL.md",
+    "DESIGN_GUIDE.md",
+    "FLEX_LOGIC.md",
+    "SIMULATION_REPORT.md",
+    "flow_state.json",
+)
+
+UPPERCASE_SECTION_REGEX = r"^## [A-Z0-9_ ]+$"
+PLACEHOLDER_MARKER = "<!-- PLACEHOLDER -->"
+MISSING_SECTION_MARKER = "<!-- MISSING_SECTION:"
+CONTRADICTION_MARKER = "🚨 CONTRADICTION"
+
+STATE_FILE = "flow_state.json"
+# templates/ holds placeholder projects for the scaffolder, not projects of its own.
+SKIP_DIRS = {"node_modules", "__pycache__", "venv", "templates"}
+
+LEVEL_VALID = 0
+LEVEL_PLACEHOLDER = 1
+LEVEL_MISSING_SECTION = 2
+LEVEL_CONTRADICTION = 3
+LEVEL_FILE_MISSING = 4
+
+LEGEND = """
+🧾 FlowChain Compliance Legend
+  ✅ LEVEL 0: Fully valid
+  ⚠  LEVEL 1: Placeholder present
+  ❌ LEVEL 2: Missing section
+  🚨 LEVEL 3: Contradiction detected
+  🛑 LEVEL 4: File missing
+"""
+
+CHUNK_SIZE = 1 << 16
+
+# Bump whenever a rule above changes so cached levels are discarded.
+VALIDATOR_VERSION = "1"
+
+# Headers are matched unanchored (CPython's regex engine can then use its
+# literal-prefix search) and the line start is checked by hand. The literal
+# markers use ``bytes.find``, which is far faster than any alternation.
+_HEADER = re.compile(UPPERCASE_SECTION_REGEX[1:].encode(), re.MULTILINE)
+
+_MARKERS = (
+    (LEVEL_CONTRADICTION, CONTRADICTION_MARKER.encode()),
+    (LEVEL_MISSING_SECTION, MISSING_SECTION_MARKER.encode()),
+    (LEVEL_PLACEHOLDER, PLACEHOLDER_MARKER.encode()),
+)
+
+
+def _has_header(data: bytes) -> bool:
+    for match in _HEADER.finditer(data):
+        start = match.start()
+        if start == 0 or data[start - 1] == 0x0A:
+            return True
+    return False
+
+
+def scan_bytes(data: bytes, level: int = LEVEL_VALID, has_header: bool = False):
+    """Scan a block of complete lines, returning the updated ``(level, has_header)``."""
+    for found, marker in _MARKERS:
+        if found <= level:
+            break
+        if marker in data:
+            level = found
+            break
+    if not has_header and level < LEVEL_MISSING_SECTION:
+        has_header = _has_header(data)
+    return level, has_header
+
+
+def check_file(path: Path) -> int:
+    """Return the enforcement level of a single file (LEVEL 0–4)."""
+    try:
+        handle = path.open("rb")
+    except (FileNotFoundError, IsADirectoryError):
+        return LEVEL_FILE_MISSING
+
+    level, has_header = LEVEL_VALID, False
+    with handle:
+        tail = b""
+        while True:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                block, tail = tail, b""
+            else:
+                # Only scan complete lines so no marker straddles two reads.
+                data = tail + chunk
+                cut = data.rfind(b"\n") + 1
+                block, tail = data[:cut], data[cut:]
+            if block:
+                level, has_header = scan_bytes(block, level, has_header)
+                if level == LEVEL_CONTRADICTION:
+                    return level
+            if not chunk:
+                break
+
+    return _final_level(level, has_header)
+
+
+def _final_level(level: int, has_header: bool) -> int:
+    if not has_header and level < LEVEL_MISSING_SECTION:
+        return LEVEL_MISSING_SECTION
+    return level
+
+
+def check_bytes(data: bytes) -> int:
+    """Return the enforcement level of a file already read into memory."""
+    return _final_level(*scan_bytes(data))
+
+
+def _rescan(task):
+    """Process-pool worker: hash a file and rescan it unless the hash is known.
+
+    Returns ``(stat, digest, level, seconds)`` with ``level`` left as ``None``
+    when the content still matches ``known_digest``, or ``None`` if the file
+    vanished. ``known_digest=False`` skips hashing and streams the file instead.
+    """
+    path, known_digest = task
+    start = time.perf_counter()
+    try:
+        st = os.stat(path)
+        if known_digest is False:
+            return st, None, check_file(Path(path)), time.perf_counter() - start
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    digest = file_digest(data)
+    level = None if digest == known_digest else check_bytes(data)
+    return st, digest, level, time.perf_counter() - start
+
+
+def _probe(path: Path, cache: ValidationCache):
+    """Resolve ``path`` from the cache alone; return ``(level, key)``."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return LEVEL_FILE_MISSING, None
+    if not path.is_file():
+        return LEVEL_FILE_MISSING, None
+    key = os.fspath(path.resolve())
+    level = cache.get(key, st)
+    if level is not None:
+        cache.hits += 1
+    return level, key
+
+
+def _record(cache: ValidationCache, key: str, outcome) -> int:
+    if outcome is None:
+        return LEVEL_FILE_MISSING
+    st, digest, level, seconds = outcome
+    # Timed in the worker; pool processes keep no telemetry of their own.
+    telemetry.observe("flowchain_validate_file_seconds", seconds)
+    if level is None:
+        level = cache.entries[key]["level"]
+        cache.hits += 1
+    else:
+        cache.misses += 1
+    cache.put(key, st, digest, level)
+    return level
+
+
+def _known_digest(cache: ValidationCache, key: str):
+    return cache.entries.get(key, {}).get("sha256")
+
+
+def check_file_cached(path: Path, cache: ValidationCache) -> int:
+    """Like :func:`check_file`, but answer unchanged files from ``cache``."""
+    level, key = _probe(path, cache)
+    if level is not None:
+        return level
+    return _record(cache, key, _rescan((key, _known_digest(cache, key))))
+
+
+def describe(file: str, level: int) -> str:
+    if level == LEVEL_VALID:
+        return f"✅ LEVEL 0: {file} is valid"
+    if level == LEVEL_PLACEHOLDER:
+        return f"⚠  LEVEL 1: {file} contains placeholders"
+    if level == LEVEL_MISSING_SECTION:
+        return "❌ LEVEL 2: Missing sections or UPPERCASE headers"
+    if level == LEVEL_CONTRADICTION:
+        return "🚨 LEVEL 3: Contradictions found"
+    if level == LEVEL_FILE_MISSING:
+        return f"🛑 LEVEL 4: {file} is missing"
+    return f"🛑 LEVEL 4: Unknown error in {file}"
+
+
+def _check_timed(path: Path) -> int:
+    start = time.perf_counter()
+    level = check_file(path)
+    telemetry.observe("flowchain_validate_file_seconds", time.perf_counter() - start)
+    return level
+
+
+def validate_project(root: Path, files=CORE_FILES, cache: ValidationCache = None) -> dict:
+    """Check every core file under ``root`` and return ``{file: level}``."""
+    if cache is None:
+        return {file: _check_timed(root / file) for file in files}
+    return {file: check_file_cached(root / file, cache) for file in files}
+
+
+def discover_projects(top: Path) -> list:
+    """Return every directory under ``top`` holding a ``flow_state.json``, sorted.
+
+    Python packages (an ``__init__.py``) are skipped with everything below them.
+    """
+    roots = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        if "__init__.py" in filenames:
+            dirnames[:] = []
+            continue
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+        if STATE_FILE in filenames:
+            roots.append(Path(dirpath))
+    return sorted(roots)
+
+
+def validate_projects(roots: list, files=CORE_FILES, jobs: int = None, use_cache: bool = True,
+                      executor=None) -> tuple:
+    """Validate many projects, fanning uncached file checks over a process pool.
+
+    A long-lived ``executor`` may be passed in to skip pool start-up.
+    Returns ``({root: {file: level}}, {root: cache})`` in the order of ``roots``.
+    """
+    results, caches, pending = {}, {}, []
+    for root in roots:
+        cache = ValidationCache(Path(root) / CACHE_DIR, VALIDATOR_VERSION)
+        if use_cache:
+            cache.load()
+        caches[root] = cache
+        results[root] = {}
+        for file in files:
+            level, key = _probe(Path(root) / file, cache)
+            results[root][file] = level
+            if level is None:
+                pending.append((root, file, key))
+
+    tasks = [(key, use_cache and _known_digest(caches[root], key)) for root, _, key in pending]
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    if executor is not None and len(tasks) > 1:
+        outcomes = list(executor.map(_rescan, tasks, chunksize=chunksize))
+    elif jobs == 1 or len(tasks) < 2:
+        outcomes = map(_rescan, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(_rescan, tasks, chunksize=chunksize))
+
+    for (root, file, key), outcome in zip(pending, outcomes):
+        results[root][file] = _record(caches[root], key, outcome)
+
+    if use_cache:
+        for cache in caches.values():
+            cache.save()
+    return results, caches
+
+
+def build_report(top: Path, results: dict, caches: dict, conflicts: list = ()) -> dict:
+    """Deterministic, JSON-ready summary for the GitHub workflows.
+
+    ``conflicts`` are ``flowchain.facts`` conflicts, each tagged with its ``project``.
+    """
+    projects = []
+    for root, levels in results.items():
+        name = Path(os.path.relpath(root, top)).as_posix()
+        projects.append({"path": name, "level": max(levels.values(), default=LEVEL_VALID), "files": levels})
+    hits = sum(cache.hits for cache in caches.values())
+    misses = sum(cache.misses for cache in caches.values())
+    return {
+        "validator_version": VALIDATOR_VERSION,
+        "overall_level": max((p["level"] for p in projects), default=LEVEL_VALID),
+        "projects": projects,
+        "conflicts": list(conflicts),
+        "cache": {"hits": hits, "misses": misses},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="FlowChain compliance validator")
+    parser.add_argument("root", nargs="?", default=".", help="Project directory (default: .)")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file, ignoring .flowchain/cache")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Validate every project (flow_state.json) under ROOT")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes for --recursive (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report instead of the legend")
+    parser.add_argument("--docs", type=Path, help="Read the Markdown core files from DIR instead of the project root")
+    parser.add_argument("--facts", action="store_true", help="Also flag JSON ↔ Markdown contradictions as LEVEL 3")
+    parser.add_argument(
+        "--max-level",
+        type=int,
+        help="Exit 1 only if the overall level exceeds this value (default: exit with the level itself)",
+    )
+    args = parser.parse_args(argv)
+
+    top = Path(args.root)
+    roots = discover_projects(top) if args.recursive else [top]
+    with telemetry.span("flowchain_validate_run", projects=len(roots)):
+        files = CORE_FILES
+        if args.docs:
+            files = [os.path.relpath(args.docs / f, top) if f != STATE_FILE else f for f in CORE_FILES]
+        results, caches = validate_projects(roots, files, jobs=args.jobs if args.recursive else 1, use_cache=not args.no_cache)
+    conflicts = []
+    if args.facts:
+        from flowchain.facts import check_facts, conflicted_sources, default_sources, doc_sources
+
+        # Each project's state is compared with the docs it was validated against and the
+        # top-level docs, like ``flowchain.facts --state``; docs beside nested states are not enough.
+        shared = doc_sources(top) + ([args.docs / f for f in CORE_FILES if f != STATE_FILE] if args.docs else [])
+        for root in roots:
+            found = check_facts(root, default_sources(root, docs=shared))
+            for source in conflicted_sources(found):
+                key = source if source in results[root] else os.path.normpath(source)
+                results[root][key] = max(results[root].get(key, LEVEL_VALID), LEVEL_CONTRADICTION)
+            project = Path(os.path.relpath(root, top)).as_posix()
+            conflicts += [{"project": project, **conflict} for conflict in found["conflicts"]]
+    report = build_report(top, results, caches, conflicts)
+    overall_status = report["overall_level"]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for project in report["projects"]:
+            if args.recursive:
+                print(f"📁 {project['path']} (LEVEL {project['level']})")
+            for file, level in project["files"].items():
+                print(describe(file, level))
+        if conflicts:
+            from flowchain.facts import describe_conflict
+
+            for conflict in conflicts:
+                print(describe_conflict(conflict))
+        print(LEGEND)
+        print(f"📦 Final Enforcement Level: {overall_status}")
+        if not args.no_cache:
+            print(f"🗃  Validation cache: {report['cache']['hits']} hits, {report['cache']['misses']} misses")
+
+    if args.max_level is not None:
+        return int(overall_status > args.max_level)
+    return overall_status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
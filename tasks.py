@@ -1,5 +1,4 @@
 from invoke import task
-import os
 import secrets
 from pathlib import Path
 
@@ -26,6 +25,6 @@ def check_env(c):
 @task
 def run_tool(c):
     check_env(c)
-    from dotenv import load_dotenv
-    load_dotenv("chat.env")
-    os.system(". .env/bin/activate && python rotate_api_key.py")
+    # Rotate in this interpreter; flowchain.rotate reads the key from chat.env itself.
+    from flowchain.rotate import main
+    main([])
@@ -0,0 +1,3 @@
+# Placeholder script
+# Would parse DESIGN_GUIDE.md + FEATURES.md
+# Call GitHub API to generate build issues
@@ -0,0 +1,83 @@
+"""AgentRunner against a fake provider with known latencies."""
+
+import asyncio
+import time
+
+from flowchain.agents import AGENTS, METHODS, AgentCall, AgentRunner, validation_round
+
+
+class FakeProvider:
+    """Streams two chunks per prompt; ``latency`` maps a prompt to its seconds (default ``delay``)."""
+
+    model = "fake-model"
+
+    def __init__(self, delay: float = 0.2, latency: dict = None):
+        self.delay = delay
+        self.latency = latency or {}
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def stream(self, prompt: str):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            wait = self.latency.get(prompt, self.delay)
+            yield "first "
+            await asyncio.sleep(wait)
+            yield prompt
+        finally:
+            self.active -= 1
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_calls_take_the_slowest_not_the_sum():
+    latency = {f"p{i}": 0.1 + 0.05 * i for i in range(6)}
+    provider = FakeProvider(latency=latency)
+    runner = AgentRunner({"gemini": provider}, default_concurrency=len(latency))
+    calls = [AgentCall("Validator", "internal_logic", prompt) for prompt in latency]
+
+    started = time.perf_counter()
+    results = run(runner.run(calls))
+    wall = time.perf_counter() - started
+
+    assert [r.status for r in results] == ["ok"] * len(calls)
+    assert [r.text for r in results] == [f"first {prompt}" for prompt in latency]  # call order kept
+    assert max(latency.values()) <= wall < max(latency.values()) + 0.2
+    assert wall < sum(latency.values()) / 2
+    assert all(r.ttft is not None and r.ttft < r.latency for r in results)
+
+
+def test_provider_semaphore_bounds_concurrency():
+    provider = FakeProvider(delay=0.05)
+    runner = AgentRunner({"gemini": provider}, concurrency={"gemini": 2})
+    results = run(runner.run([AgentCall("Review", "external_search", f"p{i}") for i in range(6)]))
+    assert provider.peak == 2
+    assert sum(r.queued > 0.04 for r in results) == 4  # every call past the first two waited for a slot
+
+
+def test_timeout_cancels_the_slow_call_only():
+    provider = FakeProvider(delay=0.05, latency={"slow": 5.0})
+    runner = AgentRunner({"gemini": provider})
+    calls = [AgentCall("Build", "internal_logic", "slow", timeout=0.2), AgentCall("Build", "external_search", "fast")]
+
+    started = time.perf_counter()
+    slow, fast = run(runner.run(calls))
+
+    assert time.perf_counter() - started < 1.0
+    assert (slow.status, slow.text) == ("timeout", "first ")  # the chunk before the stall is kept
+    assert 0.2 <= slow.latency < 0.5
+    assert (fast.status, fast.text) == ("ok", "first fast")
+    assert provider.active == 0  # the cancelled stream was closed
+
+
+def test_validation_round_reports_wall_time_below_summed_latency():
+    provider = FakeProvider(delay=0.1)
+    runner = AgentRunner({"gemini": provider}, default_concurrency=len(AGENTS) * len(METHODS))
+    report = run(validation_round(runner, "# Doc\n", "DOC.md"))
+    assert provider.calls == len(AGENTS) * len(METHODS)
+    assert report["wall_time"] < report["sum_latency"] / 3
@@ -0,0 +1,46 @@
+"""Benchmark suite: the regression gate's comparison, exit status, and a tiny end-to-end run."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS = Path(__file__).resolve().parent.parent / "benchmarks"
+
+
+@pytest.fixture
+def suite(monkeypatch):
+    monkeypatch.syspath_prepend(str(BENCHMARKS))
+    import suite
+
+    monkeypatch.setitem(suite.SIZES, "tiny", (2, 20, 10, 3, 20, 2))
+    return suite
+
+
+def test_compare_flags_only_slowdowns_past_the_threshold(suite):
+    report = suite.compare({"a": 1.3, "b": 1.2, "c": 0.5, "new": 1.0}, {"a": 1.0, "b": 1.0, "c": 1.0}, 0.25)
+    assert report["regressions"] == ["a"]
+    assert report["metrics"]["b"] == {"current": 1.2, "baseline": 1.0, "change": 0.2}
+    assert report["metrics"]["c"]["change"] == -0.5
+    assert report["metrics"]["new"] == {"current": 1.0, "baseline": None, "change": None}
+
+
+def test_run_suite_measures_every_component(suite, tmp_path):
+    metrics = suite.run_suite(tmp_path, "tiny", repeat=1)
+    assert set(metrics) == {
+        "validate_cold_per_file", "validate_cached_per_file", "state_load_per_state", "state_transition_per_state",
+        "forms_stream_per_form", "scaffold_cold_per_project", "scaffold_unchanged_per_project",
+    }
+    assert all(value > 0 for value in metrics.values())
+
+
+def test_main_gates_on_the_baseline(suite, tmp_path, monkeypatch, capsys):
+    fast = {name: 1e-9 for name in ("validate_cold_per_file", "forms_stream_per_form")}
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"size": "tiny", "metrics": fast}))
+    monkeypatch.setattr(sys, "argv", ["suite.py", "--size", "tiny", "--repeat", "1", "--compare", str(baseline), "--json"])
+    with pytest.raises(SystemExit) as raised:
+        suite.main()
+    assert raised.value.code == 1
+    assert sorted(json.loads(capsys.readouterr().out)["regressions"]) == sorted(fast)
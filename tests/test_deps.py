@@ -0,0 +1,106 @@
+"""Dependency scheduler: waves, cycles, blocking, incremental unblocking and wave-by-wave checks."""
+
+import json
+
+import pytest
+
+from flowchain.deps import DependencyError, DependencyGraph, Project, main, parse_requirement
+from flowchain.state import PHASES, STATE_FILE, FlowState, TransitionError
+from flowchain.validate import CORE_FILES
+
+
+def project(name, step=PHASES[0], requires=(), unlocks=()):
+    return Project(name, None, FlowState(name, step),
+                   [parse_requirement(r) for r in requires], [parse_requirement(u) for u in unlocks])
+
+
+def write_project(top, name, step=PHASES[0], requires=(), valid=True):
+    root = top / name
+    root.mkdir()
+    state = FlowState(name, step, history=list(PHASES[1:PHASES.index(step) + 1]),
+                      extra={"state_dependencies": {"requires": list(requires), "unlocks": []}})
+    state.save(root / STATE_FILE)
+    for file in CORE_FILES[:-1]:
+        (root / file).write_text("# Doc\n\n## PURPOSE\n\n" + ("Text\n" if valid else "🚨 CONTRADICTION\n"))
+    return root
+
+
+def test_parse_requirement_defaults_to_released():
+    assert parse_requirement("api") == ("api", "released")
+    assert parse_requirement("api:design_ready") == ("api", "design_ready")
+    with pytest.raises(DependencyError, match="Unknown phase 'soon'"):
+        parse_requirement("api:soon")
+
+
+def test_waves_follow_requires_and_unlocks():
+    graph = DependencyGraph([
+        project("ui", requires=["api:design_ready", "auth"]),
+        project("api", requires=["db"]),
+        project("db"),
+        project("auth", unlocks=["api:build_started"]),
+        project("docs"),
+    ])
+    assert graph.waves() == [["auth", "db", "docs"], ["api"], ["ui"]]
+    assert graph.blocked() == {"api": ["auth:build_started", "db:released"], "ui": ["api:design_ready", "auth:released"]}
+
+
+def test_duplicate_edges_keep_the_stricter_phase():
+    graph = DependencyGraph([project("a", unlocks=["b:released"]), project("b", requires=["a:design_ready"])])
+    assert graph.requires["b"] == {"a": "released"}
+
+
+@pytest.mark.parametrize("projects, message", [
+    ([project("a", requires=["b"]), project("b", requires=["c"]), project("c", requires=["a"])],
+     "Dependency cycle: a → b → c → a"),
+    ([project("a", requires=["a"])], "Project 'a' depends on itself"),
+    ([project("a", requires=["ghost"])], "Unknown project 'ghost'"),
+    ([project("a"), project("a")], "Duplicate project 'a'"),
+])
+def test_invalid_graphs_are_rejected(projects, message):
+    with pytest.raises(DependencyError, match=message):
+        DependencyGraph(projects)
+
+
+def test_cycle_behind_an_acyclic_prefix_is_reported_once():
+    with pytest.raises(DependencyError, match="Dependency cycle: b → c → b"):
+        DependencyGraph([project("a", requires=["b"]), project("b", requires=["c"]), project("c", requires=["b"])])
+
+
+def test_critical_path_counts_remaining_phase_steps():
+    graph = DependencyGraph([
+        project("db", "build_started"),
+        project("api", "idea_captured", requires=["db"]),
+        project("docs", "review_passed"),
+    ])
+    assert graph.critical_path() == (["db", "api"], 2 + 6)
+
+
+def test_advance_unblocks_only_when_every_requirement_is_met():
+    graph = DependencyGraph([
+        project("db", "scaffold_generated"),
+        project("auth", "released"),
+        project("api", requires=["db:design_ready", "auth"]),
+    ])
+    with pytest.raises(TransitionError, match="'api' is blocked by: db:design_ready"):
+        graph.advance("api", "validation_passed", save=False)
+    assert graph.advance("db", "design_ready", save=False) == ["api"]
+    assert graph.advance("db", "build_started", save=False) == []
+    assert graph.blocked() == {}
+
+
+def test_discover_advance_and_check_on_disk(tmp_path, capsys):
+    write_project(tmp_path, "db", "design_ready")
+    write_project(tmp_path, "api", requires=["db:build_started"], valid=False)
+    write_project(tmp_path, "ui", requires=["api:design_ready"])
+
+    assert main(["advance", str(tmp_path), "db", "build_started", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["unblocked"] == ["api"]
+    assert FlowState.load(tmp_path / "db" / STATE_FILE).current_step == "build_started"
+
+    # flow_state.json has no "## " header, so a sound project sits at LEVEL 2, as in core/init.sh.
+    assert main(["check", str(tmp_path), "--jobs", "1", "--max-level", "2", "--json"]) == 1
+    assert json.loads(capsys.readouterr().out) == {
+        "db": {"status": "passed", "level": 2},
+        "api": {"status": "failed", "level": 3},
+        "ui": {"status": "skipped", "level": None},
+    }
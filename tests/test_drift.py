@@ -0,0 +1,112 @@
+"""Drift graph: path heuristics, name-status parsing and incremental updates over a real git repo."""
+
+import subprocess
+
+import pytest
+
+from flowchain import drift
+from flowchain.drift import DriftGraph, check_drift, looks_like_path
+
+
+def git(root, *args):
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+def commit(root, message="change"):
+    git(root, "add", "-A")
+    git(root, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "dev@example.com")
+    git(tmp_path, "config", "user.name", "dev")
+    (tmp_path / "lang-hooks" / "python").mkdir(parents=True)
+    (tmp_path / "lang-hooks" / "python" / "runner.py").write_text("print('hook')\n")
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core" / "init.sh").write_text("#!/bin/sh\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "GUIDE.md").write_text(
+        "# Guide\n\n## HOOKS\n\nRun \"lang-hooks/python/runner.py\" from `lang-hooks/python/`.\n\n"
+        "## SETUP\n\nSee `core/init.sh`. Responses are \"application/json\" from `owner/repo`.\n"
+    )
+    commit(tmp_path, "initial")
+    return tmp_path
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("generate_issues.py", True),
+    ("lang-hooks/python/runner.py", True),
+    ("lang-hooks/python/", True),
+    ("application/json", False),
+    ("owner/repo", False),
+    ("https://example.com/a.py", False),
+    ("./", False),
+    ("v1.2/notes", False),
+])
+def test_looks_like_path_needs_an_extension_or_a_known_top_dir(text, expected):
+    assert looks_like_path(text, top_dirs={"lang-hooks"}) is expected
+
+
+def test_extensionless_paths_count_when_they_exist(tmp_path):
+    (tmp_path / "interfaces" / "cli").mkdir(parents=True)
+    assert looks_like_path("interfaces/cli", root=tmp_path)
+    assert not looks_like_path("interfaces/web", root=tmp_path)
+
+
+def test_parse_name_status_splits_renames_and_keeps_copies():
+    output = "M\0a.md\0R087\0old.py\0new.py\0C100\0src.py\0copy.py\0D\0gone.sh\0"
+    assert drift._parse_name_status(output) == [
+        ("M", "a.md"), ("D", "old.py"), ("A", "new.py"), ("A", "copy.py"), ("D", "gone.sh"),
+    ]
+
+
+def test_rebuild_ignores_mime_types_and_slugs(repo):
+    graph = DriftGraph(repo)
+    assert graph.rebuild() == {"docs/GUIDE.md"}
+    refs = {ref for ref, _ in graph.docs["docs/GUIDE.md"]}
+    assert refs == {"lang-hooks/python/runner.py", "lang-hooks/python/", "core/init.sh"}
+    assert graph.evaluate({"docs/GUIDE.md"})["missing"] == []
+
+
+def test_rename_reports_the_old_path_missing_and_the_new_one_tracked(repo):
+    check_drift(repo)
+    git(repo, "mv", "lang-hooks/python/runner.py", "lang-hooks/python/main.py")
+    commit(repo, "rename")
+
+    report = check_drift(repo, base="HEAD~1")
+    assert report["evaluated_docs"] == 1
+    assert report["missing"] == [
+        {"doc": "docs/GUIDE.md", "section": "HOOKS", "ref": "lang-hooks/python/runner.py"},
+    ]
+    graph = DriftGraph(repo)
+    assert graph.load()
+    assert "lang-hooks/python/main.py" in graph.files and "lang-hooks/python/runner.py" not in graph.files
+
+
+def test_delete_and_modify_only_re_evaluate_referring_docs(repo):
+    (repo / "docs" / "OTHER.md").write_text("# Other\n\nNothing to see.\n")
+    commit(repo, "other")
+    check_drift(repo)
+
+    (repo / "core" / "init.sh").write_text("#!/bin/sh\nexit 0\n")
+    commit(repo, "modify")
+    report = check_drift(repo, base="HEAD~1")
+    assert report["evaluated_docs"] == 1
+    assert report["changed"] == [
+        {"doc": "docs/GUIDE.md", "section": "SETUP", "ref": "core/init.sh", "target": "core/init.sh"},
+    ]
+
+    git(repo, "rm", "-q", "core/init.sh")
+    commit(repo, "delete")
+    report = check_drift(repo, base="HEAD~1")
+    assert report["missing"] == [{"doc": "docs/GUIDE.md", "section": "SETUP", "ref": "core/init.sh"}]
+
+
+def test_deleted_doc_leaves_the_graph(repo):
+    graph = DriftGraph(repo)
+    graph.rebuild()
+    git(repo, "rm", "-q", "docs/GUIDE.md")
+    assert graph.apply([("D", "docs/GUIDE.md")]) == (set(), {"docs/GUIDE.md"})
+    assert graph.docs == {} and graph.referrers("core/init.sh") == set()
@@ -0,0 +1,62 @@
+"""Event log: appended events are visible to every FlowState reader before compaction."""
+
+import json
+
+import pytest
+
+from flowchain import events
+from flowchain.events import EVENT_LOG, EventLog
+from flowchain.state import STATE_FILE, FlowState, TransitionError, main, transaction
+
+
+@pytest.fixture
+def project(tmp_path):
+    state = FlowState("demo", "scaffold_generated", history=["idea_captured", "validation_passed", "scaffold_generated"])
+    state.save(tmp_path / STATE_FILE)
+    return tmp_path
+
+
+def test_appended_event_is_read_back_through_load(project):
+    EventLog(project).append("transition", phase="design_ready")
+    assert json.loads((project / STATE_FILE).read_text())["current_step"] == "scaffold_generated"  # not compacted
+    state = FlowState.load(project / STATE_FILE)
+    assert state.current_step == "design_ready"
+    assert main(["--file", str(project / STATE_FILE), "check", "design_ready"]) == 0
+
+
+def test_transaction_logs_and_moves_the_offset(project):
+    log = EventLog(project)
+    log.append("score", value=7)
+    with transaction(project / STATE_FILE) as state:
+        state.advance("design_ready")
+        state.advance("build_started")
+    snapshot = FlowState.read(project / STATE_FILE)
+    assert snapshot.current_step == "build_started"
+    assert snapshot.extra["event_offset"] == (project / EVENT_LOG).stat().st_size
+    kinds = [json.loads(line)["type"] for line in (project / EVENT_LOG).read_text().splitlines()]
+    assert kinds == ["score", "transition", "transition"]
+    assert FlowState.load(project / STATE_FILE).last_validated_score == 7
+
+
+def test_out_of_order_append_is_rejected_and_not_logged(project):
+    log = EventLog(project)
+    with pytest.raises(TransitionError):
+        log.append("transition", phase="released")
+    assert not (project / EVENT_LOG).exists()
+
+
+def test_snapshot_every_compacts(project, monkeypatch):
+    monkeypatch.setattr(events, "SNAPSHOT_EVERY", 2)
+    log = EventLog(project)
+    log.append("override", flag="a")
+    log.append("override", flag="b")
+    snapshot = FlowState.read(project / STATE_FILE)
+    assert snapshot.override_flags == ["a", "b"]
+    assert snapshot.extra["event_offset"] == (project / EVENT_LOG).stat().st_size
+
+
+def test_phase_at(project):
+    log = EventLog(project)
+    event = log.append("transition", phase="design_ready")
+    assert log.phase_at(event["ts"] - 1) == "scaffold_generated"
+    assert log.phase_at(event["ts"] + 1) == "design_ready"
@@ -0,0 +1,111 @@
+"""Fact store: extraction, JSON ↔ Markdown contradictions and incremental re-extraction."""
+
+import json
+
+import pytest
+
+from flowchain import validate
+from flowchain.facts import check_facts, conflicted_sources, extract_markdown, main
+from flowchain.state import STATE_FILE, FlowState
+from flowchain.validate import LEVEL_CONTRADICTION, LEVEL_VALID
+
+FORM = {
+    "project_name": "Demo",
+    "tech_stack": {"languages": ["Python", "Bash"], "frameworks": [], "platforms": [], "tools": []},
+    "features": ["Intake queue", "Drift watcher"],
+    "integrations": {"GitHub": "issues"},
+    "definition_of_done": "<!-- PLACEHOLDER -->",
+}
+
+DESIGN = """# Design Guide – Demo
+
+## Tech Stack
+
+- Languages: bash, python
+
+## Features
+
+- **Intake queue**
+- Drift watcher.
+
+## Integrations
+
+- GitHub: issue sync
+
+## Stage Completion
+
+- ✅ Design Locked
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    FlowState("demo", "design_ready").save(tmp_path / STATE_FILE)
+    (tmp_path / "project_form.json").write_text(json.dumps(FORM))
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "DESIGN_GUIDE.md").write_text(DESIGN)
+    return tmp_path
+
+
+def subjects(report):
+    return [conflict["subject"] for conflict in report["conflicts"]]
+
+
+def test_markdown_extraction(project):
+    facts = {f["subject"]: f["value"] for f in extract_markdown(project / "docs" / "DESIGN_GUIDE.md")}
+    assert facts == {
+        "project_name": "demo",
+        "phase.design_ready": True,
+        "tech_stack.languages": ["bash", "python"],
+        "features": ["drift watcher", "intake queue"],
+        "integrations": ["github"],
+    }
+
+
+def test_agreeing_sources_have_no_conflicts(project):
+    report = check_facts(project)
+    assert (report["sources"], report["extracted"], report["conflicts"]) == (3, 3, [])
+    assert main([str(project)]) == LEVEL_VALID
+
+
+def test_contradictions_name_every_source(project):
+    doc = project / "docs" / "DESIGN_GUIDE.md"
+    doc.write_text(DESIGN.replace("– Demo", "– Other").replace("Design Locked", "Design Locked\n- [x] Build Started"))
+    report = check_facts(project)
+    assert subjects(report) == ["phase.build_started", "project_name"]
+    [name] = [c for c in report["conflicts"] if c["subject"] == "project_name"]
+    assert name["values"] == [
+        {"value": "other", "sources": [{"source": "docs/DESIGN_GUIDE.md", "where": "Design Guide – Other"}]},
+        {"value": "demo", "sources": [{"source": STATE_FILE, "where": "project_name"},
+                                      {"source": "project_form.json", "where": "project_name"}]},
+    ]
+    assert conflicted_sources(report) == {"docs/DESIGN_GUIDE.md", STATE_FILE, "project_form.json"}
+    assert main([str(project)]) == LEVEL_CONTRADICTION
+
+
+def test_only_changed_sources_are_re_extracted(project):
+    check_facts(project)
+    form = project / "project_form.json"
+    form.write_text(json.dumps(dict(FORM, features=["Intake queue"])))
+    report = check_facts(project)
+    assert report["extracted"] == 1
+    assert subjects(report) == ["features"]
+
+    form.write_text(json.dumps(FORM))
+    assert check_facts(project)["conflicts"] == []
+
+    form.write_text(json.dumps(dict(FORM, project_name="Renamed")))
+    assert subjects(check_facts(project)) == ["project_name"]
+    form.unlink()
+    report = check_facts(project)
+    assert (report["sources"], report["conflicts"]) == (2, [])
+
+
+def test_validate_facts_raises_the_conflicting_files_to_level_3(project, capsys):
+    (project / "docs" / "DESIGN_GUIDE.md").write_text(DESIGN.replace("Design Locked", "Released"))
+    validate.main([str(project), "--docs", str(project / "docs"), "--facts", "--json", "--no-cache"])
+    report = json.loads(capsys.readouterr().out)
+    [conflict] = report["conflicts"]
+    assert conflict["subject"] == "phase.released"
+    files = report["projects"][0]["files"]
+    assert files[STATE_FILE] == files["docs/DESIGN_GUIDE.md"] == LEVEL_CONTRADICTION
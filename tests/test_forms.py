@@ -0,0 +1,114 @@
+"""Project form validator: the shipped example, error codes, paths and levels, JSONL streaming and bad files."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from flowchain import forms
+from flowchain.forms import FormValidator
+from flowchain.validate import LEVEL_FILE_MISSING, LEVEL_MISSING_SECTION, LEVEL_PLACEHOLDER, LEVEL_VALID
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "templates" / "project_form.example.json"
+
+
+@pytest.fixture
+def form():
+    """The shipped example with every placeholder filled in."""
+    form = json.loads(EXAMPLE.read_text())
+    form.update(description="A demo", purpose="Testing", definition_of_done="Shipped", features=["intake"])
+    return form
+
+
+@pytest.fixture
+def validator():
+    return FormValidator()
+
+
+def codes(errors):
+    return [(e.path, e.code, e.level) for e in errors]
+
+
+def test_filled_example_is_valid(validator, form, tmp_path):
+    assert validator.validate(form) == []
+    path = tmp_path / "form.json"
+    path.write_text(json.dumps(form, indent=2))
+    assert validator.validate_file(path).level == LEVEL_VALID
+
+
+def test_shipped_example_only_has_placeholders(validator):
+    result = validator.validate_file(EXAMPLE)
+    assert codes(result.errors) == [
+        ("description", "placeholder", LEVEL_PLACEHOLDER),
+        ("purpose", "placeholder", LEVEL_PLACEHOLDER),
+        ("features[0]", "placeholder", LEVEL_PLACEHOLDER),
+        ("definition_of_done", "placeholder", LEVEL_PLACEHOLDER),
+    ]
+    assert result.level == LEVEL_PLACEHOLDER
+
+
+def test_format_unknown_missing_and_type_errors(validator, form):
+    form["project_name"] = "-bad name"
+    form["flowchain_version"] = "2.0"
+    form["tech_stack"]["runtime"] = "cpython"
+    del form["state_dependencies"]["unlocks"]
+    form["integrations"]["CI"] = 3
+    assert codes(validator.validate(form)) == [
+        ("project_name", "format", LEVEL_MISSING_SECTION),
+        ("tech_stack.runtime", "unknown_field", LEVEL_MISSING_SECTION),
+        ("integrations.CI", "type", LEVEL_MISSING_SECTION),
+        ("flowchain_version", "format", LEVEL_MISSING_SECTION),
+        ("state_dependencies.unlocks", "missing_field", LEVEL_MISSING_SECTION),
+    ]
+
+
+def test_non_object_form(validator):
+    assert codes(validator.validate([])) == [("$", "type", LEVEL_MISSING_SECTION)]
+
+
+def test_stream_reports_each_line_and_reads_wrapped_forms(validator, form, tmp_path):
+    broken = dict(form, flowchain_version="1")
+    path = tmp_path / "intake.jsonl"
+    path.write_text("\n".join([
+        json.dumps({"form": form}),
+        "",
+        "{not json",
+        json.dumps({"id": 7}),
+        json.dumps({"form": broken}),
+    ]) + "\n")
+
+    results = list(validator.validate_stream(path, key="form"))
+    assert [(r.line, r.level) for r in results] == [
+        (1, LEVEL_VALID), (3, LEVEL_FILE_MISSING), (4, LEVEL_MISSING_SECTION), (5, LEVEL_MISSING_SECTION),
+    ]
+    assert codes(results[1].errors) == [("$", "json", LEVEL_FILE_MISSING)]
+    assert codes(results[2].errors) == [("form", "missing_field", LEVEL_MISSING_SECTION)]
+    assert codes(results[3].errors) == [("flowchain_version", "format", LEVEL_MISSING_SECTION)]
+
+
+def test_main_with_field_exits_with_the_worst_level(form, tmp_path, capsys):
+    path = tmp_path / "intake.jsonl"
+    path.write_text(json.dumps({"form": form}) + "\n" + json.dumps({"form": dict(form, purpose=None)}) + "\n")
+    assert forms.main(["--field", "form", "--json", str(path)]) == LEVEL_MISSING_SECTION
+    [line] = capsys.readouterr().out.splitlines()
+    assert json.loads(line) == {
+        "source": str(path), "line": 2, "level": LEVEL_MISSING_SECTION,
+        "errors": [{"path": "purpose", "code": "type", "message": "expected string, got NoneType"}],
+    }
+    assert forms.main(["--field", "form", "--max-level", "2", str(path)]) == 0
+
+
+def test_unreadable_and_undecodable_files_fail_instead_of_raising(validator, tmp_path):
+    missing = validator.validate_file(tmp_path / "missing.json")
+    assert codes(missing.errors) == [("$", "file", LEVEL_FILE_MISSING)]
+
+    [stream] = validator.validate_stream(tmp_path / "missing.jsonl")
+    assert (stream.line, codes(stream.errors)) == (0, [("$", "file", LEVEL_FILE_MISSING)])
+
+    binary = tmp_path / "binary.json"
+    binary.write_bytes(b"\xff\xfe\xfa")
+    assert codes(validator.validate_file(binary).errors) == [("$", "json", LEVEL_FILE_MISSING)]
+
+    directory = tmp_path / "dir.jsonl"
+    directory.mkdir()
+    assert [r.level for r in forms.iter_results([directory])] == [LEVEL_FILE_MISSING]
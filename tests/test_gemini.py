@@ -0,0 +1,57 @@
+"""Gemini prompt context: uploads and server caches are scoped to the API key the client was built with."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+from flowchain import gemini  # noqa: E402
+
+
+class FakeUploads:
+    def __init__(self, client, path):
+        self.path = path
+
+    def upload_all(self, paths):
+        return [SimpleNamespace(uri=f"https://files.test/{self.path.stem}/{i}", mime_type="application/json")
+                for i, _ in enumerate(paths)]
+
+
+class FakeCaches:
+    def __init__(self):
+        self.created = 0
+
+    def create(self, model, config):
+        self.created += 1
+        return SimpleNamespace(name=f"cachedContents/{self.created}")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(gemini, "UploadCache", FakeUploads)
+    monkeypatch.setattr(gemini, "CONTEXT_CACHE", tmp_path / "gemini-context.json")
+    monkeypatch.setattr(gemini, "_UPLOADS", {})
+    monkeypatch.setattr(gemini, "_CONTEXTS", {})
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    return SimpleNamespace(caches=FakeCaches())
+
+
+def test_account_fingerprints_the_key_without_revealing_it(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "secret-one")
+    assert gemini.account() == gemini.account("secret-one") != gemini.account("secret-two")
+    assert len(gemini.account()) == 16 and "secret" not in gemini.account()
+
+
+def test_contexts_are_scoped_per_key(client, monkeypatch):
+    first = gemini.prompt_context(client, api_key="key-1")
+    second = gemini.prompt_context(client, api_key="key-2")
+    assert first is not second and first.key != second.key
+    assert (first.cached_content, second.cached_content) == ("cachedContents/1", "cachedContents/2")
+    assert sorted(cache.path.name for cache in gemini._UPLOADS.values()) == sorted(
+        f"uploads-{gemini.account(key)}.json" for key in ("key-1", "key-2")
+    )
+
+    monkeypatch.setenv("GEMINI_API_KEY", "key-1")
+    assert gemini.prompt_context(client) is first
+    assert client.caches.created == 2
@@ -0,0 +1,112 @@
+"""Hook registry and runner: declarations, statuses, timeouts and killing only a stuck hook's worker."""
+
+import os
+import time
+
+import pytest
+
+from flowchain import hooks
+from flowchain.hooks import HookRunner, declared_hooks
+
+FLEX = """# Flex Logic
+
+## DECLARING A HOOK
+
+```json
+{"extension": "python", "entry": "lang-hooks/ok.py", "required": true}
+```
+
+```json
+[{"extension": "python", "entry": "lang-hooks/fail.py", "required": true},
+ {"extension": "shell", "entry": "lang-hooks/echo.sh"},
+ {"extension": "ruby", "entry": "lang-hooks/missing.rb", "required": true}]
+```
+
+```json
+{not json}
+```
+
+```json
+{"extension": "python", "entry": "lang-hooks/slow.py", "timeout": 0.3}
+"""
+
+SOURCES = {
+    "ok.py": "import os\n\ndef run(context):\n    return {'root': context['root'], 'pid': os.getpid()}\n",
+    "fail.py": "def run(context):\n    raise ValueError('bad input')\n",
+    "echo.sh": "read line\necho \"got $line\"\n",
+    "slow.py": "import time\n\ndef run(context):\n    time.sleep(30)\n",
+    # SIGALRM blocked: the in-worker alarm cannot fire, so only the parent's kill ends it.
+    "stuck.py": "import signal, time\n\ndef run(context):\n"
+                "    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})\n    time.sleep(30)\n",
+    "nap.py": "import os, time\n\ndef run(context):\n    time.sleep(context.get('nap', 0))\n    return os.getpid()\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "FLEX_LOGIC.md").write_text(FLEX)
+    (tmp_path / "lang-hooks").mkdir()
+    for name, source in SOURCES.items():
+        (tmp_path / "lang-hooks" / name).write_text(source)
+    return tmp_path
+
+
+def hook(project, name, timeout=None):
+    return hooks.Hook("python", f"lang-hooks/{name}", project / "lang-hooks" / name, True, timeout)
+
+
+def test_declarations_resolve_from_the_project_root(project):
+    found = declared_hooks(project)
+    assert [(h.name, h.required, h.missing) for h in found] == [
+        ("python:lang-hooks/ok.py", True, False),
+        ("python:lang-hooks/fail.py", True, False),
+        ("shell:lang-hooks/echo.sh", False, False),
+        ("ruby:lang-hooks/missing.rb", True, True),
+        ("python:lang-hooks/slow.py", False, False),
+    ]
+    assert found[-1].timeout == 0.3
+
+
+def test_run_reports_each_status_in_declaration_order(project):
+    with HookRunner(workers=2) as runner:
+        required = runner.run(declared_hooks(project), {"root": "/r"})
+        everything = runner.run(declared_hooks(project)[:3], {"root": "/r"}, required_only=False)
+    assert [(r.hook, r.status) for r in required] == [
+        ("python:lang-hooks/ok.py", "ok"),
+        ("python:lang-hooks/fail.py", "failed"),
+        ("ruby:lang-hooks/missing.rb", "missing"),
+    ]
+    assert required[0].output["root"] == "/r"
+    assert required[1].error == "ValueError: bad input"
+    assert everything[2].status == "ok" and everything[2].output == 'got {"root": "/r"}'
+    assert runner.stats()["python:lang-hooks/ok.py"]["runs"] == 2
+
+
+def test_alarm_stops_a_slow_python_hook_inside_its_worker(project):
+    with HookRunner(workers=1) as runner:
+        [slow] = runner.run([hook(project, "slow.py", timeout=0.2)])
+        [after] = runner.run([hook(project, "ok.py")], {"root": "."})
+    assert (slow.status, slow.error) == ("timeout", "exceeded 0.2s")
+    assert after.status == "ok"
+
+
+def test_stuck_hook_kills_only_its_own_worker(project, monkeypatch):
+    monkeypatch.setattr(hooks, "KILL_GRACE", 0.3)
+    with HookRunner(workers=2) as runner:
+        started = time.monotonic()
+        stuck, napper = runner.run([hook(project, "stuck.py", timeout=0.2), hook(project, "nap.py")], {"nap": 1.0})
+        assert time.monotonic() - started < 10
+        assert (stuck.status, stuck.error) == ("timeout", "killed after 0.5s")
+        assert napper.status == "ok"
+        os.kill(napper.output, 0)  # the other worker survived
+
+        [again] = runner.run([hook(project, "nap.py")])
+        assert again.status == "ok"
+
+
+def test_queued_hooks_time_out_from_their_own_start(project, monkeypatch):
+    monkeypatch.setattr(hooks, "KILL_GRACE", 0.0)
+    with HookRunner(workers=1) as runner:
+        results = runner.run([hook(project, "nap.py", timeout=1.0)] * 3, {"nap": 0.5})
+    assert [r.status for r in results] == ["ok"] * 3
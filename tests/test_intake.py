@@ -0,0 +1,101 @@
+"""Intake queue: batched claims, lease redelivery, dead-lettering, backpressure and segment rotation."""
+
+import json
+
+import pytest
+
+from flowchain.intake import DEAD_FILE, INTAKE_DIR, QUEUE_FILE, Intake, QueueFull
+
+
+@pytest.fixture
+def intake(tmp_path):
+    return Intake(tmp_path, max_attempts=2)
+
+
+def dead_letters(intake):
+    return [json.loads(line) for line in (intake.dir / DEAD_FILE).read_text().splitlines()]
+
+
+def test_claims_resume_from_the_cursor_across_instances(intake, tmp_path):
+    ids = intake.put_many([{"n": i} for i in range(5)])
+    assert [r.data["n"] for r in intake.claim(limit=3)] == [0, 1, 2]
+    again = Intake(tmp_path)
+    assert [(r.id, r.data["n"], r.attempts) for r in again.claim(limit=10)] == [(ids[3], 3, 1), (ids[4], 4, 1)]
+    assert again.claim() == []
+    assert again.ack(ids + ["9:9"]) == 5
+    assert again.stats()["inflight"] == 0
+
+
+def test_expired_leases_are_redelivered_then_dead_lettered(intake, monkeypatch):
+    [request_id] = intake.put_many([{"job": "x"}])
+    clock = [1000.0]
+    monkeypatch.setattr("flowchain.intake.time.time", lambda: clock[0])
+
+    assert [r.attempts for r in intake.claim(lease=10)] == [1]
+    clock[0] += 5
+    assert intake.claim(lease=10) == []  # lease still held
+    clock[0] += 10
+    [retry] = intake.claim(lease=10)
+    assert (retry.id, retry.attempts) == (request_id, 2)
+    clock[0] += 20
+    assert intake.claim(lease=10) == []
+    [letter] = dead_letters(intake)
+    assert (letter["id"], letter["attempts"], letter["error"], letter["request"]) == (request_id, 2, "lease expired", {"job": "x"})
+    assert intake.stats()["dead"] == 1 and intake.stats()["inflight"] == 0
+
+
+def test_nack_retries_immediately_and_keeps_the_last_error(intake):
+    [request_id] = intake.put_many([{"job": "x"}])
+    intake.claim()
+    assert intake.nack({request_id: "boom 1"}) == 0
+    [retry] = intake.claim()
+    assert retry.attempts == 2
+    assert intake.nack({request_id: "boom 2"}) == 1
+    assert dead_letters(intake)[0]["error"] == "boom 2"
+
+
+def test_invalid_lines_are_dead_lettered_and_torn_writes_sealed(intake):
+    intake.queue_path.write_bytes(b'{"n": 0}\nnot json\n{"n": 1')  # last line still being written
+    assert [r.data for r in intake.claim()] == [{"n": 0}]
+    assert dead_letters(intake)[0]["error"].startswith("Invalid JSON")
+    intake.put_many([{"n": 2}])
+    assert [r.data for r in intake.claim()] == [{"n": 2}]
+    assert [d["request"] for d in dead_letters(intake)] == ["not json\n", '{"n": 1\n']
+
+
+def test_backpressure(tmp_path):
+    intake = Intake(tmp_path, max_backlog=50)  # one request is 21 bytes
+    intake.put_many([{"pad": "x" * 10}, {"pad": "y" * 10}])
+    with pytest.raises(QueueFull):
+        intake.put({"pad": "z" * 10})
+    with pytest.raises(QueueFull):
+        intake.put({"pad": "z" * 10}, block=True, timeout=0.1)
+    intake.claim()
+    assert intake.put({"pad": "z" * 10})
+
+
+def test_rotated_segments_are_deleted_once_settled(tmp_path):
+    intake = Intake(tmp_path, segment_bytes=20)  # one request is 8 bytes
+    first = intake.put_many([{"n": i} for i in range(3)])
+    assert not (tmp_path / QUEUE_FILE).exists()
+    second = intake.put_many([{"n": i} for i in range(3, 6)])
+    claimed = intake.claim(limit=10)
+    assert [r.data["n"] for r in claimed] == [0, 1, 2, 3, 4, 5]
+    segments = tmp_path / INTAKE_DIR / "segments"
+    assert sorted(p.name for p in segments.iterdir()) == ["000000.jsonl", "000001.jsonl"]
+    intake.ack(first)
+    assert sorted(p.name for p in segments.iterdir()) == ["000001.jsonl"]
+    intake.ack(second)
+    assert list(segments.iterdir()) == []
+
+
+def test_run_acks_successes_and_dead_letters_repeated_failures(intake):
+    intake.put_many([{"n": i} for i in range(6)])
+
+    def handler(request):
+        if request["n"] % 3 == 0:
+            raise ValueError(f"bad {request['n']}")
+
+    assert intake.run(handler, workers=3, batch=4) == {"ok": 4, "failed": 4, "dead": 2}
+    assert sorted(d["request"]["n"] for d in dead_letters(intake)) == [0, 3]
+    assert intake.stats()["acked"] == 4
@@ -0,0 +1,211 @@
+"""GitHub sync: the client against a local mock server (ETag reuse, rate limits), plan() and sync()."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from flowchain import issues
+from flowchain.issues import GitHubClient
+
+ISSUES = [{"number": 1, "state": "open", "body": "<!-- flowchain-issue: 0123456789abcdef 0123456789abcdef -->"}]
+
+
+class MockGitHub(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    script = []  # queued (status, headers) answers served before the normal response
+    seen = []
+
+    def do_GET(self):
+        type(self).seen.append(dict(self.headers))
+        if self.script:
+            status, headers = self.script.pop(0)
+            return self._reply(status, headers, {"message": "slow down"})
+        if self.headers.get("If-None-Match") == self.etag:
+            return self._reply(304, {"ETag": self.etag})
+        self._reply(200, {"ETag": self.etag, "X-RateLimit-Remaining": "4999"}, ISSUES)
+
+    def _reply(self, status, headers, body=None):
+        data = json.dumps(body).encode() if body is not None and status != 304 else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api():
+    MockGitHub.script, MockGitHub.seen = [], []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(issues.time, "sleep", calls.append)
+    return calls
+
+
+def test_etag_is_reused_across_runs(api, tmp_path):
+    etag_path = tmp_path / ".flowchain" / "cache" / issues.ETAG_CACHE
+    first = GitHubClient("o/r", api_url=api, etag_path=etag_path)
+    assert set(first.existing_issues()) == {"0123456789abcdef"}
+    first.save_etags()
+
+    second = GitHubClient("o/r", api_url=api, etag_path=etag_path)
+    assert set(second.existing_issues()) == {"0123456789abcdef"}
+    assert second.not_modified == 1
+    assert MockGitHub.seen[-1]["If-None-Match"] == MockGitHub.etag
+
+
+def test_rate_limit_waits_for_reset(api, sleeps):
+    reset = time.time() + 30
+    MockGitHub.script = [(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})]
+    client = GitHubClient("o/r", api_url=api)
+    assert client.existing_issues()
+    assert client.calls == 2
+    assert 29 < sleeps[0] <= 31  # waits out the window instead of hammering the API
+
+
+def test_server_errors_back_off_exponentially(api, sleeps):
+    MockGitHub.script = [(502, {}), (502, {}), (429, {"Retry-After": "7"})]
+    client = GitHubClient("o/r", api_url=api)
+    assert client.existing_issues()
+    assert sleeps == [issues.BACKOFF_BASE, issues.BACKOFF_BASE * 2, 7.0]
+
+
+# ────────── desired set, plan and sync ──────────
+
+DESIGN = """# Design Guide
+
+## OVERVIEW
+<!-- PLACEHOLDER -->
+
+## ARCHITECTURE
+<!-- MISSING_SECTION: Data Model -->
+- [ ] Pick a queue
+- [x] Pick a database
+"""
+
+FEATURES = "# Features\n\n## CORE\n- Export to CSV\n"
+
+FLEX = """# Flex Logic
+
+```json
+{"extension": "python", "entry": "lang-hooks/python/runner.py", "required": true}
+```
+```json
+{"extension": "ruby", "entry": "lang-hooks/ruby/present.rb"}
+```
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "DESIGN_GUIDE.md").write_text(DESIGN)
+    (tmp_path / "FEATURES.md").write_text(FEATURES)
+    (tmp_path / "FLEX_LOGIC.md").write_text(FLEX)
+    (tmp_path / "lang-hooks" / "ruby").mkdir(parents=True)
+    (tmp_path / "lang-hooks" / "ruby" / "present.rb").write_text("")
+    return tmp_path
+
+
+def titles(issues):
+    return sorted(issue.title for issue in issues)
+
+
+def test_collect_issues_finds_every_unfinished_item(project):
+    desired = issues.collect_issues(project)
+    assert titles(desired.values()) == [
+        "Add missing section to DESIGN_GUIDE.md: Data Model",
+        "Add python hook: lang-hooks/python/runner.py",
+        "Build feature: Export to CSV",
+        "Complete DESIGN_GUIDE.md: OVERVIEW",
+        "Task: Pick a queue",
+    ]
+    assert issues.collect_issues(project).keys() == desired.keys()  # keys are stable across runs
+
+
+def test_plan_creates_updates_reopens_and_closes(project):
+    desired = issues.collect_issues(project)
+    by_title = {issue.title: issue for issue in desired.values()}
+    task, feature, hook = (by_title[t] for t in ("Task: Pick a queue", "Build feature: Export to CSV",
+                                                  "Add python hook: lang-hooks/python/runner.py"))
+    existing = {
+        task.key: (1, task.digest, "open"),  # unchanged
+        feature.key: (2, "0" * 16, "open"),  # edited
+        hook.key: (3, hook.digest, "closed"),  # still missing: reopen
+        "f" * 16: (4, "0" * 16, "open"),  # finished: close
+        "e" * 16: (5, "0" * 16, "closed"),  # already closed
+    }
+    actions = issues.plan(desired, existing)
+    assert titles(actions["create"]) == titles(set(desired.values()) - {task, feature, hook})
+    assert sorted(number for number, _ in actions["update"]) == [2, 3]
+    assert actions["close"] == [4]
+
+
+class FakeClient:
+    def __init__(self, existing=None):
+        self.existing = existing or {}
+        self.created, self.updated, self.closed = [], [], []
+        self.saved = False
+        self.calls = self.not_modified = 0
+
+    def existing_issues(self):
+        return self.existing
+
+    def create(self, issue):
+        self.created.append(issue)
+
+    def update(self, number, issue):
+        self.updated.append(number)
+
+    def close(self, number):
+        self.closed.append(number)
+
+    def save_etags(self):
+        self.saved = True
+
+
+def test_sync_applies_the_plan_and_dry_run_does_not(project):
+    desired = issues.collect_issues(project)
+    key = next(iter(desired))
+    dry = FakeClient({key: (7, "0" * 16, "closed")})
+    report = issues.sync(project, dry, dry_run=True)
+    assert (dry.created, dry.updated, dry.closed) == ([], [], [])
+    assert report["dry_run"] and report["updated"] == [7] and len(report["created"]) == len(desired) - 1
+
+    client = FakeClient({key: (7, "0" * 16, "closed"), "a" * 16: (8, "0" * 16, "open")})
+    report = issues.sync(project, client)
+    assert (len(client.created), client.updated, client.closed) == (len(desired) - 1, [7], [8])
+    assert client.saved and report["closed"] == [8]
+
+
+def test_adding_the_hook_entry_closes_its_issue(project):
+    desired = issues.collect_issues(project)
+    existing = {key: (n, issue.digest, "open") for n, (key, issue) in enumerate(desired.items())}
+    entry = project / "lang-hooks" / "python" / "runner.py"
+    entry.parent.mkdir(parents=True)
+    entry.write_text("def run(context):\n    return 'ok'\n")
+    actions = issues.plan(issues.collect_issues(project), existing)
+    closed = [key for key, (n, _, _) in existing.items() if n in actions["close"]]
+    assert [desired[key].title for key in closed] == ["Add python hook: lang-hooks/python/runner.py"]
+
+
+def test_save_etags_is_atomic_json(tmp_path):
+    path = tmp_path / "cache" / issues.ETAG_CACHE
+    client = GitHubClient("o/r", etag_path=path)
+    client.etags = {"https://x/issues": {"etag": '"v1"', "body": [], "next": None}}
+    client.save_etags()
+    assert json.loads(path.read_text()) == client.etags
+    assert [p.name for p in path.parent.iterdir()] == [issues.ETAG_CACHE]
@@ -0,0 +1,74 @@
+"""KeyProvider: accepted keys across a dual rotation, stat-gated reloads and the background watcher."""
+
+import time
+
+import pytest
+
+from flowchain import keys
+from flowchain.keys import ENV_VAR, KeyProvider, parse_env
+from flowchain.rotate import prune_previous, rotate_dual
+
+
+@pytest.fixture
+def env(tmp_path):
+    path = tmp_path / "chat.env"
+    path.write_text(f"# agent key\n{ENV_VAR}=old-key\nOTHER=1\n")
+    return path
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_parse_env_keeps_the_first_value():
+    assert parse_env("A=1\n# note\nA=2\nB=x=y\n") == {"A": "1", "B": "x=y"}
+
+
+def test_previous_key_is_accepted_until_the_grace_window_ends(env, monkeypatch):
+    provider = KeyProvider(env)
+    assert provider.verify("old-key") and not provider.verify("new-key")
+
+    rotate_dual(env, ENV_VAR, "new-key", grace=60)
+    assert provider.reload()
+    assert provider.verify("new-key") and provider.verify("old-key")
+
+    later = time.time() + 120
+    monkeypatch.setattr(keys.time, "time", lambda: later)
+    assert provider.verify("new-key") and not provider.verify("old-key")
+    assert prune_previous(env, ENV_VAR, now=later)
+    assert provider.reload() and not provider.verify("old-key")
+
+
+def test_reload_only_swaps_when_the_file_changed(env):
+    provider = KeyProvider(env)
+    assert provider.reloads == 1
+    assert not provider.reload()
+    env.write_text(f"{ENV_VAR}=other-key\n")
+    assert provider.reload() and provider.reloads == 2
+    env.unlink()
+    assert provider.reload()
+    assert not provider.verify("other-key") and not provider.verify("")
+
+
+def test_missing_file_accepts_nothing(tmp_path):
+    provider = KeyProvider(tmp_path / "chat.env")
+    assert not provider.verify("") and not provider.verify("anything")
+
+
+@pytest.mark.parametrize("inotify", [True, False], ids=["inotify", "polling"])
+def test_watcher_picks_up_rotations(env, monkeypatch, inotify):
+    if not inotify:
+        monkeypatch.setattr(keys, "_inotify_fd", lambda directory: None)
+    provider = KeyProvider(env, poll_interval=0.05).start()
+    try:
+        rotate_dual(env, ENV_VAR, "new-key", grace=60)
+        assert wait_for(lambda: provider.verify("new-key"))
+        assert provider.verify("old-key")
+    finally:
+        provider.stop()
+    assert provider._thread is None
@@ -0,0 +1,148 @@
+"""Patch applier: idempotent doc ops, non-text and non-regular targets, and the compare-and-swap branch update."""
+
+import os
+import subprocess
+
+import pytest
+
+from flowchain import patch
+from flowchain.patch import PatchError, ensure_bullet, ensure_section, load_spec, patch_repo
+
+BRANCH = "flowchain/enforcement"
+REF = f"refs/heads/{BRANCH}"
+
+
+def git(repo, *args, input=None):
+    return subprocess.run(["git", "-C", os.fspath(repo), *args], check=True, capture_output=True, input=input).stdout
+
+
+def show(repo, path, ref=BRANCH):
+    return git(repo, "show", f"{ref}:{path}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "dev@example.com")
+    git(tmp_path, "config", "user.name", "dev")
+    (tmp_path / "README.md").write_text("# Project\n\n## Enforced Rules\n\n- Docs first\n")
+    (tmp_path / "LEGACY.md").write_bytes(b"# Caf\xe9\n")
+    (tmp_path / "LOGO.md").write_bytes(b"\x89PNG\r\n\x00\x00")
+    (tmp_path / "tools").mkdir()
+    (tmp_path / "tools" / "run.md").write_text("#!/usr/bin/env cat\n")
+    os.chmod(tmp_path / "tools" / "run.md", 0o755)
+    os.symlink("README.md", tmp_path / "LINK.md")
+    os.symlink("tools", tmp_path / "aliased")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def spec(*patches, message="Enforce"):
+    return {"message": message, "patches": [dict(p, file=[p["file"]] if isinstance(p["file"], str) else p["file"])
+                                            for p in patches]}
+
+
+def section(file, heading="## Enforcement Mechanisms", body="- **Missing Files = PR Blocked**"):
+    return {"op": "ensure_section", "file": file, "heading": heading, "body": body}
+
+
+# ────────── pure text ops ──────────
+
+def test_ensure_section_is_idempotent():
+    once = ensure_section("# Doc\n", {"heading": "## RULES", "body": "- one"})
+    assert once == "# Doc\n\n## RULES\n\n- one\n"
+    assert ensure_section(once, {"heading": "## RULES", "body": "- two"}) == once
+    assert ensure_section(None, {"heading": "## RULES", "content": "# New\n"}) == "# New\n\n## RULES\n"
+
+
+def test_ensure_bullet_is_idempotent_and_stays_above_subsections():
+    text = "## Rules\n\n- a\n\n### Details\n\n- b\n\n## Next\n"
+    once = ensure_bullet(text, {"heading": "## Rules", "bullet": "- c"})
+    assert once == "## Rules\n\n- a\n- c\n\n### Details\n\n- b\n\n## Next\n"
+    assert ensure_bullet(once, {"heading": "## Rules", "bullet": "c"}) == once
+    assert ensure_bullet(once, {"heading": "## Rules", "bullet": "* b"}) == once
+    assert ensure_bullet("", {"heading": "## Rules", "bullet": "x"}) == "## Rules\n\n- x\n"
+
+
+def test_load_spec_validates_and_runs_ensure_file_first(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text('{"patches": [{"op": "ensure_section", "file": "A.md", "heading": "## X"},'
+                    ' {"op": "ensure_file", "file": "A.md", "content": "# A\\n"}]}')
+    loaded = load_spec([path])
+    assert [p["op"] for p in loaded["patches"]] == ["ensure_file", "ensure_section"]
+    assert loaded["message"] == patch.DEFAULT_MESSAGE
+    path.write_text('{"patches": [{"op": "ensure_bullet", "file": "A.md", "heading": "## X"}]}')
+    with pytest.raises(PatchError, match="ensure_bullet needs bullet"):
+        load_spec([path])
+
+
+# ────────── repositories ──────────
+
+def test_rerun_is_a_no_op_and_the_worktree_is_untouched(repo):
+    rules = spec(section("README.md"), {"op": "ensure_bullet", "file": "README.md", "heading": "## Enforced Rules",
+                                        "bullet": "Issues for unfinished logic"})
+    first = patch_repo(repo, rules, BRANCH)
+    assert (first["status"], first["files"]) == ("patched", {"README.md": "modified"})
+    assert show(repo, "README.md").decode().count("Issues for unfinished logic") == 1
+    assert patch_repo(repo, rules, BRANCH)["status"] == "unchanged"
+    assert git(repo, "status", "--porcelain") == b""
+    assert git(repo, "rev-parse", "main") != git(repo, "rev-parse", BRANCH)
+
+
+def test_non_utf8_text_is_patched_byte_for_byte(repo):
+    report = patch_repo(repo, spec(section("LEGACY.md")), BRANCH)
+    assert report["status"] == "patched"
+    assert show(repo, "LEGACY.md").startswith(b"# Caf\xe9\n\n## Enforcement Mechanisms\n")
+
+
+def test_binary_and_symlink_targets_are_skipped_and_reported(repo):
+    report = patch_repo(repo, spec(section("LOGO.md"), section("LINK.md"), section("README.md")), BRANCH)
+    assert report["status"] == "patched"
+    assert report["skipped"] == {"LINK.md": "not a regular file (mode 120000)", "LOGO.md": "binary file"}
+    assert report["files"] == {"README.md": "modified"}
+    assert show(repo, "LOGO.md") == b"\x89PNG\r\n\x00\x00"
+    tree = git(repo, "ls-tree", BRANCH, "LINK.md").split()
+    assert tree[0] == b"120000" and show(repo, "LINK.md") == b"README.md"
+
+
+def test_executable_mode_is_kept(repo):
+    assert patch_repo(repo, spec(section("tools/run.md")), BRANCH)["status"] == "patched"
+    assert git(repo, "ls-tree", BRANCH, "tools/run.md").split()[0] == b"100755"
+
+
+def test_paths_through_a_symlinked_directory_are_refused(repo):
+    report = patch_repo(repo, spec({"op": "ensure_file", "file": "aliased/NEW.md", "content": "# New\n"}), BRANCH)
+    assert report["status"] == "error"
+    assert "aliased is not a directory (mode 120000)" in report["error"]
+    with pytest.raises(subprocess.CalledProcessError):
+        git(repo, "rev-parse", "--verify", "--quiet", REF)
+
+
+def test_write_tree_refuses_to_overwrite_a_symlink(repo):
+    oid = git(repo, "hash-object", "-w", "--stdin", input=b"text\n").decode().strip()
+    with pytest.raises(PatchError, match=r"refusing to replace LINK.md \(mode 120000\)"):
+        patch._write_tree(repo, "HEAD^{tree}", {"LINK.md": oid})
+
+
+def test_branch_moved_meanwhile_is_not_overwritten(repo, monkeypatch):
+    git(repo, "branch", BRANCH, "main")
+    read_blobs = patch._read_blobs
+
+    def racing(repo_, commit, paths):
+        blobs = read_blobs(repo_, commit, paths)
+        tree = git(repo, "rev-parse", "main^{tree}").decode().strip()
+        other = git(repo, "commit-tree", tree, "-p", commit, input=b"concurrent").decode().strip()
+        git(repo, "update-ref", REF, other)
+        return blobs
+
+    monkeypatch.setattr(patch, "_read_blobs", racing)
+    report = patch_repo(repo, spec(section("README.md")), BRANCH)
+    assert report["status"] == "error" and "update-ref failed" in report["error"]
+    assert git(repo, "log", "-1", "--format=%s", BRANCH).strip() == b"concurrent"
+
+
+def test_checked_out_branch_and_detached_head_are_refused(repo):
+    assert "is checked out" in patch_repo(repo, spec(section("README.md")))["error"]
+    git(repo, "checkout", "-q", "--detach")
+    assert "HEAD is detached" in patch_repo(repo, spec(section("README.md")))["error"]
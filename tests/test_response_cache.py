@@ -0,0 +1,78 @@
+"""ResponseCache: key invalidation (phase, sections), TTL expiry and LRU eviction."""
+
+import time
+
+import pytest
+
+from flowchain.events import EventLog
+from flowchain.response_cache import ResponseCache
+from flowchain.state import STATE_FILE, FlowState
+
+DOC = "# Design Guide\n\n## OVERVIEW\nA tool.\n\n## ARCHITECTURE\nOne process.\n"
+
+
+@pytest.fixture
+def project(tmp_path):
+    FlowState("demo", "scaffold_generated").save(tmp_path / STATE_FILE)
+    (tmp_path / "DESIGN_GUIDE.md").write_text(DOC)
+    return tmp_path
+
+
+@pytest.fixture
+def cache(project):
+    cache = ResponseCache(project / "cache.sqlite3", state_path=project / STATE_FILE)
+    yield cache
+    cache.close()
+
+
+def test_hit_after_put_and_prompt_whitespace_is_normalized(cache):
+    assert cache.get(cache.key("m", "Check this doc")) is None
+    cache.put(cache.key("m", "Check  this\n doc"), "m", "PASS")
+    assert cache.get(cache.key("m", "Check this doc")) == "PASS"
+    assert cache.get(cache.key("other-model", "Check this doc")) is None
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
+
+
+def test_logged_transition_changes_the_key(cache, project):
+    before = cache.key("m", "p")
+    EventLog(project).append("transition", phase="design_ready")
+    assert cache.phase() == "design_ready"
+    assert cache.key("m", "p") != before
+
+
+def test_only_the_edited_section_invalidates(cache, project):
+    doc = project / "DESIGN_GUIDE.md"
+    overview = cache.key("m", "p", [(doc, "OVERVIEW")])
+    architecture = cache.key("m", "p", [(doc, "ARCHITECTURE")])
+    whole = cache.key("m", "p", [(doc, None)])
+    doc.write_text(DOC.replace("One process.", "Two processes."))
+    assert cache.key("m", "p", [(doc, "OVERVIEW")]) == overview
+    assert cache.key("m", "p", [(doc, "ARCHITECTURE")]) != architecture
+    assert cache.key("m", "p", [(doc, None)]) != whole
+
+
+def test_ttl_expiry(project):
+    cache = ResponseCache(project / "ttl.sqlite3", ttl=0.05, state_path=project / STATE_FILE)
+    cache.put("k", "m", "old")
+    assert cache.get("k") == "old"
+    time.sleep(0.06)
+    assert cache.get("k") is None
+    assert cache.stats()["evictions"] == 1
+    cache.put("k2", "m", "x")
+    time.sleep(0.06)
+    assert cache.purge_expired() == 1
+    cache.close()
+
+
+def test_lru_eviction_keeps_recently_read_entries(project):
+    cache = ResponseCache(project / "lru.sqlite3", max_entries=2, state_path=project / STATE_FILE)
+    cache.put("a", "m", "A")
+    time.sleep(0.01)
+    cache.put("b", "m", "B")
+    time.sleep(0.01)
+    assert cache.get("a") == "A"  # a is now the most recently used
+    time.sleep(0.01)
+    cache.put("c", "m", "C")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
+    assert cache.stats()["entries"] == 2
+    cache.close()
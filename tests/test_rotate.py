@@ -0,0 +1,57 @@
+"""Key rotation: env-file edits, dual-key grace windows and manifest batches."""
+
+import json
+
+from flowchain import rotate
+from flowchain.rotate import EnvFile, load_manifest, prune_previous, rotate_batch, rotate_dual
+
+
+def write_manifest(tmp_path, entries):
+    path = tmp_path / "envs.json"
+    path.write_text(json.dumps(entries))
+    return path
+
+
+def test_duplicate_paths_are_merged_into_one_write(tmp_path):
+    (tmp_path / "x.env").write_text("A=1\nB=2\n")
+    manifest = load_manifest(write_manifest(tmp_path, [
+        {"file": "x.env", "keys": {"A": "aa"}},
+        {"file": "./x.env", "keys": {"B": "bb"}},
+        {"file": "sub/../x.env", "keys": {"A": "zz"}},
+    ]))
+    assert len(manifest) == 1
+    report = rotate_batch(manifest, workers=4)
+    assert (report["files"], report["changed"], report["errors"]) == (1, 1, 0)
+    assert (tmp_path / "x.env").read_text() == "A=zz\nB=bb\n"
+
+
+def test_batch_generates_fresh_keys_and_keeps_mode(tmp_path):
+    env = tmp_path / "a.env"
+    env.write_text("# comment\nGPT_AGENT_API_KEY=old\n")
+    env.chmod(0o640)
+    report = rotate_batch(load_manifest(write_manifest(tmp_path, [{"file": "a.env", "keys": {"GPT_AGENT_API_KEY": None}}])))
+    value = EnvFile(env).get("GPT_AGENT_API_KEY")
+    assert value != "old" and len(value) == 64
+    assert report["results"][0]["keys"]["GPT_AGENT_API_KEY"]["fingerprint"] == rotate.fingerprint(value)
+    assert env.read_text().startswith("# comment\n")
+    assert env.stat().st_mode & 0o777 == 0o640
+
+
+def test_dry_run_writes_nothing_and_masks_values(tmp_path):
+    env = tmp_path / "a.env"
+    env.write_text("K=secret\n")
+    report = rotate_batch(load_manifest(write_manifest(tmp_path, [{"file": "a.env", "keys": {"K": "new"}}])), dry_run=True)
+    assert env.read_text() == "K=secret\n"
+    assert "secret" not in report["results"][0]["diff"] and "new" not in report["results"][0]["diff"]
+
+
+def test_dual_rotation_keeps_previous_key_until_pruned(tmp_path, capsys):
+    env = tmp_path / "chat.env"
+    env.write_text("K=old\n")
+    rotate_dual(env, "K", "new", grace=60)
+    parsed = EnvFile(env)
+    assert (parsed.get("K"), parsed.get("K_PREVIOUS")) == ("new", "old")
+    expires = float(parsed.get("K_PREVIOUS_EXPIRES"))
+    assert not prune_previous(env, "K", now=expires - 1)
+    assert prune_previous(env, "K", now=expires + 1)
+    assert env.read_text() == "K=new\n"
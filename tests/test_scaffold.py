@@ -0,0 +1,69 @@
+"""Scaffolding engine: template compilation, SKIP_DIRS, create/skip/update/unchanged outcomes and names."""
+
+import pytest
+
+from flowchain.cache import CACHE_DIR
+from flowchain.scaffold import TEMPLATES_DIR, CompiledTemplate, ScaffoldError, load_templates, scaffold_many, scaffold_project
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    root = tmp_path / "templates"
+    tree = root / "project"
+    (tree / ".github" / "workflows").mkdir(parents=True)
+    (tree / "README.md").write_text("# $project_name\n\nCosts $$5.\n")
+    (tree / ".github" / "workflows" / "ci.yml").write_text("run: ${{ github.sha }}\n")
+    for skipped in (CACHE_DIR, "__pycache__", "node_modules", ".git"):
+        (tree / skipped).mkdir(parents=True, exist_ok=True)
+        (tree / skipped / "junk.txt").write_text("local state\n")
+    (root / "DESIGN_GUIDE.template.md").write_text("# Design Guide – ${project_name}\n")
+    return root
+
+
+def test_compiled_template_keeps_literals_and_invalid_placeholders():
+    assert CompiledTemplate("$project_name costs $$5").render({"project_name": "demo"}) == b"demo costs $5"
+    static = CompiledTemplate("run: ${{ github.sha }}")
+    assert static.static == b"run: ${{ github.sha }}"
+    with pytest.raises(ScaffoldError, match=r"Unknown template variable \$owner"):
+        CompiledTemplate("$owner").render({})
+
+
+def test_skip_dirs_stay_out_of_the_template_tree(templates_dir):
+    assert list(load_templates(templates_dir)) == [".github/workflows/ci.yml", "DESIGN_GUIDE.md", "README.md"]
+
+
+def test_shipped_templates_leave_local_state_behind():
+    templates = load_templates(TEMPLATES_DIR)
+    assert "DESIGN_GUIDE.md" in templates and "flow_state.json" in templates
+    assert not any(rel.startswith((".flowchain/", "__pycache__/")) or "/__pycache__/" in rel for rel in templates)
+
+
+def test_outcomes_across_reruns(templates_dir, tmp_path):
+    templates = load_templates(templates_dir)
+    dest = tmp_path / "demo"
+    assert scaffold_project(dest, templates) == dict.fromkeys(templates, "created")
+    assert (dest / "README.md").read_text() == "# demo\n\nCosts $5.\n"
+    assert (dest / "DESIGN_GUIDE.md").read_text() == "# Design Guide – demo\n"
+    assert not (dest / CACHE_DIR).exists()
+
+    assert set(scaffold_project(dest, templates).values()) == {"skipped"}
+    (dest / "README.md").write_text("edited\n")
+    mtime = (dest / "DESIGN_GUIDE.md").stat().st_mtime_ns
+    assert scaffold_project(dest, templates, overwrite=True) == {
+        ".github/workflows/ci.yml": "unchanged", "DESIGN_GUIDE.md": "unchanged", "README.md": "updated",
+    }
+    assert (dest / "DESIGN_GUIDE.md").stat().st_mtime_ns == mtime
+
+
+def test_names_are_validated(templates_dir, tmp_path):
+    templates = load_templates(templates_dir)
+    with pytest.raises(ScaffoldError, match="Invalid project name '-x'"):
+        scaffold_project(tmp_path / "-x", templates)
+    assert scaffold_project(tmp_path / "dir", templates, project_name="api")  # explicit name wins
+    assert (tmp_path / "dir" / "README.md").read_text().startswith("# api\n")
+
+
+def test_scaffold_many(templates_dir, tmp_path):
+    outcomes = scaffold_many(tmp_path / "fleet", ["a", "b"], load_templates(templates_dir), jobs=2)
+    assert list(outcomes) == ["a", "b"]
+    assert (tmp_path / "fleet" / "b" / "README.md").read_text().startswith("# b\n")
@@ -0,0 +1,68 @@
+"""HTTP service: request validation on /process and confinement of request roots."""
+
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from flowchain.service import app  # noqa: E402
+from flowchain.state import STATE_FILE, FlowState  # noqa: E402
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    project = tmp_path / "base" / "project"
+    project.mkdir(parents=True)
+    FlowState("demo", "scaffold_generated").save(project / STATE_FILE)
+    (tmp_path / STATE_FILE).write_text(json.dumps({"project_name": "outside"}))
+    monkeypatch.setenv("FLOWCHAIN_ROOT", str(tmp_path / "base"))
+    return tmp_path / "base"
+
+
+@pytest.fixture
+def client(base):
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("operation, params, field", [
+    ("transition", {"root": "."}, "phase"),
+    ("validate", {"recursive": "maybe"}, "recursive"),
+    ("run_hooks", {"context": []}, "context"),
+])
+def test_process_rejects_bad_params_with_422(client, operation, params, field):
+    response = client.post("/process", json={"operation": operation, "params": params})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [[field]]
+
+
+def test_process_rejects_unknown_operation(client):
+    assert client.post("/process", json={"operation": "deploy"}).status_code == 422
+
+
+def test_roots_resolve_under_the_service_root(client):
+    assert client.get("/state", params={"root": "project"}).json()["current_step"] == "scaffold_generated"
+    response = client.post("/state/transition", json={"root": "project", "phase": "design_ready"})
+    assert response.status_code == 200 and response.json()["current_step"] == "design_ready"
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("get", "/state", None),
+    ("post", "/state/transition", {"phase": "design_ready"}),
+    ("post", "/validate", {}),
+    ("post", "/hooks/run", {}),
+    ("post", "/issues/sync", {}),
+    ("post", "/intake", {"requests": [{"title": "x"}]}),
+])
+@pytest.mark.parametrize("root", ["..", "/etc", "project/../../"])
+def test_roots_outside_the_service_root_are_refused(client, base, method, path, body, root):
+    if body is None:
+        response = client.get(path, params={"root": root})
+    else:
+        response = getattr(client, method)(path, json={**body, "root": root})
+    assert response.status_code == 403
+    assert not (base.parent / ".flowchain").exists()
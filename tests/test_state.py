@@ -0,0 +1,111 @@
+"""FlowState: phase order, flag consistency, atomic saves and locked transactions."""
+
+import json
+import os
+import re
+import threading
+
+import pytest
+
+from flowchain.state import PHASES, STATE_FILE, FlowState, TransitionError, locked, main, transaction
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    path = tmp_path / STATE_FILE
+    FlowState("demo").save(path)
+    return path
+
+
+def test_advance_walks_the_phases_in_order():
+    state = FlowState("demo")
+    for phase in PHASES[1:]:
+        assert state.can_advance(phase)
+        state.advance(phase)
+    assert state.history == list(PHASES[1:])
+    assert state.reached("released") and not state.can_advance("released")
+
+
+@pytest.mark.parametrize("phase, message", [
+    ("design_ready", "Out-of-order progression: 'idea_captured' → 'design_ready' (next allowed: validation_passed)"),
+    ("idea_captured", "Out-of-order progression"),
+    ("shipped", "Unknown phase 'shipped'"),
+])
+def test_invalid_transitions_leave_the_state_alone(phase, message):
+    state = FlowState("demo")
+    with pytest.raises(TransitionError, match=re.escape(message)):
+        state.advance(phase)
+    assert (state.current_step, state.history) == ("idea_captured", [])
+
+
+def test_require_and_reached():
+    state = FlowState("demo", "design_ready")
+    state.require("scaffold_generated")
+    with pytest.raises(TransitionError, match="Phase 'build_started' not reached"):
+        state.require("build_started")
+
+
+def test_round_trip_keeps_unknown_keys_and_derives_flags(state_file):
+    data = json.loads(state_file.read_text())
+    data.update(current_step="design_ready", notes="keep me", docs_generated=True, design_ready=True)
+    state = FlowState.from_dict(data)
+    assert state.extra == {"notes": "keep me"}
+    assert state.to_dict() == dict(data, build_started=False)
+
+
+def test_contradictory_flags_are_rejected():
+    with pytest.raises(TransitionError, match=r"build_started=true contradict current_step 'design_ready'"):
+        FlowState.from_dict({"project_name": "demo", "current_step": "design_ready", "build_started": True})
+
+
+def test_save_keeps_the_file_mode_and_leaves_no_temp_files(state_file):
+    os.chmod(state_file, 0o600)
+    FlowState("demo", "validation_passed").save(state_file)
+    assert state_file.stat().st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in state_file.parent.iterdir()) == [STATE_FILE]
+
+
+def test_failed_transaction_writes_nothing(state_file):
+    before = state_file.read_text()
+    with pytest.raises(TransitionError):
+        with transaction(state_file) as state:
+            state.advance("validation_passed")
+            state.advance("build_started")
+    assert state_file.read_text() == before
+
+
+def test_concurrent_transactions_do_not_lose_updates(state_file):
+    def bump():
+        for _ in range(25):
+            with transaction(state_file) as state:
+                state.last_validated_score += 1
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert FlowState.read(state_file).last_validated_score == 100
+
+
+def test_lock_is_exclusive(state_file):
+    entered = threading.Event()
+
+    def contend():
+        with locked(state_file):
+            entered.set()
+
+    with locked(state_file):
+        thread = threading.Thread(target=contend)
+        thread.start()
+        assert not entered.wait(0.2)
+    assert entered.wait(5)
+    thread.join()
+
+
+def test_cli_advance_and_check(state_file, capsys):
+    assert main(["--file", str(state_file), "advance", "validation_passed"]) == 0
+    assert main(["--file", str(state_file), "advance", "design_ready"]) == 1
+    assert main(["--file", str(state_file), "check", "scaffold_generated"]) == 1
+    assert "Out-of-order progression" in capsys.readouterr().out
+    assert FlowState.read(state_file).current_step == "validation_passed"
@@ -0,0 +1,69 @@
+"""Telemetry: no-op when disabled, counters and histograms, Prometheus text and trace export."""
+
+import json
+
+import pytest
+
+from flowchain import telemetry
+from flowchain.state import STATE_FILE, FlowState, transaction
+
+
+@pytest.fixture
+def metrics():
+    telemetry.reset()
+    telemetry.enable()
+    yield telemetry
+    telemetry.disable()
+    telemetry.reset()
+
+
+def test_disabled_recording_is_a_no_op(metrics):
+    metrics.disable()
+    telemetry.count("flowchain_test_total")
+    with telemetry.span("flowchain_test") as span:
+        span.set(ignored=True)
+    assert telemetry.snapshot() == {"counters": [], "histograms": []}
+
+
+def test_counters_and_histograms(metrics):
+    metrics.count("flowchain_calls_total", status="ok")
+    metrics.count("flowchain_calls_total", 2, status="ok")
+    metrics.observe("flowchain_wait_seconds", 0.003)
+    metrics.observe("flowchain_wait_seconds", 100.0)
+    snap = metrics.snapshot()
+    assert snap["counters"] == [{"name": "flowchain_calls_total", "labels": {"status": "ok"}, "value": 3}]
+    [hist] = snap["histograms"]
+    assert (hist["count"], hist["sum"]) == (2, 100.003)
+    assert hist["buckets"]["0.005"] == 1 and hist["buckets"]["+Inf"] == 1
+
+
+def test_prometheus_text_is_cumulative_and_escaped(metrics):
+    metrics.count("flowchain_calls_total", agent='say "hi"\n')
+    metrics.observe("flowchain_wait_seconds", 0.02)
+    text = metrics.prometheus_text()
+    assert '# TYPE flowchain_calls_total counter\nflowchain_calls_total{agent="say \\"hi\\"\\n"} 1\n' in text
+    assert 'flowchain_wait_seconds_bucket{le="0.01"} 0\n' in text
+    assert 'flowchain_wait_seconds_bucket{le="0.025"} 1\n' in text
+    assert 'flowchain_wait_seconds_bucket{le="+Inf"} 1\nflowchain_wait_seconds_sum 0.020000\n' in text
+    assert text.endswith("flowchain_wait_seconds_count 1\n")
+
+
+def test_spans_time_blocks_and_record_errors(metrics, tmp_path):
+    with pytest.raises(KeyError):
+        with metrics.span("flowchain_step", phase="design") as span:
+            span.set(files=3)
+            raise KeyError("x")
+    path = tmp_path / "trace.json"
+    metrics.write_trace(path)
+    trace = json.loads(path.read_text())
+    [event] = trace["traceEvents"]
+    assert (event["name"], event["ph"], event["args"]) == ("flowchain_step", "X", {"phase": "design", "files": 3, "error": "KeyError"})
+    assert trace["metrics"]["histograms"][0]["name"] == "flowchain_step_seconds"
+
+
+def test_state_transactions_are_instrumented(metrics, tmp_path):
+    FlowState("demo").save(tmp_path / STATE_FILE)
+    with transaction(tmp_path / STATE_FILE) as state:
+        state.advance("validation_passed")
+    names = {h["name"] for h in metrics.snapshot()["histograms"]}
+    assert {"flowchain_state_transaction_seconds", "flowchain_state_lock_wait_seconds"} <= names
@@ -0,0 +1,81 @@
+"""UploadCache against a fake ``files`` client: reuse, expiry, re-upload and change detection."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from flowchain import uploads
+from flowchain.uploads import UploadCache
+
+
+class FakeFiles:
+    def __init__(self):
+        self.uploaded = []
+        self.deleted = set()
+
+    def upload(self, file):
+        name = f"files/{len(self.uploaded)}"
+        self.uploaded.append(file)
+        return SimpleNamespace(name=name, uri=f"https://files.test/{name}", mime_type="text/markdown",
+                               expiration_time=None)
+
+    def get(self, name):
+        if name in self.deleted:
+            raise LookupError(name)
+        return SimpleNamespace(name=name)
+
+
+@pytest.fixture
+def client():
+    return SimpleNamespace(files=FakeFiles())
+
+
+@pytest.fixture
+def doc(tmp_path):
+    path = tmp_path / "DESIGN_GUIDE.md"
+    path.write_text("# Design Guide\n")
+    return path
+
+
+def cache_for(client, tmp_path, **kwargs):
+    return UploadCache(client, tmp_path / "cache" / uploads.UPLOAD_CACHE, **kwargs)
+
+
+def test_unchanged_file_is_reused_without_rewriting_the_cache(client, doc, tmp_path):
+    first = cache_for(client, tmp_path)
+    [uploaded] = first.upload_all([doc])
+    assert client.files.uploaded == [str(doc)]
+    mtime = first.path.stat().st_mtime_ns
+
+    second = cache_for(client, tmp_path)
+    assert second.upload_all([doc]) == [uploaded]
+    assert (second.hits, second.uploads) == (1, 0)
+    assert second.path.stat().st_mtime_ns == mtime
+
+
+def test_changed_content_is_uploaded_again(client, doc, tmp_path):
+    cache = cache_for(client, tmp_path)
+    [before] = cache.upload_all([doc])
+    doc.write_text("# Design Guide\n\nEdited.\n")
+    [after] = cache.upload_all([doc])
+    assert after.name != before.name
+    assert len(client.files.uploaded) == 2
+
+
+def test_expired_entry_is_uploaded_again(client, doc, tmp_path):
+    cache = cache_for(client, tmp_path)
+    cache.upload_all([doc])
+    for entry in cache.entries.values():
+        entry["expires_at"] = time.time() + uploads.EXPIRY_MARGIN - 1
+    cache.upload_all([doc])
+    assert cache.uploads == 2
+
+
+def test_entry_missing_remotely_is_uploaded_again(client, doc, tmp_path):
+    cache = cache_for(client, tmp_path, revalidate_after=0)
+    [before] = cache.upload_all([doc])
+    client.files.deleted.add(before.name)
+    [after] = cache.upload_all([doc])
+    assert after.name != before.name
+    assert cache_for(client, tmp_path).entries[uploads.sha256_file(doc)]["name"] == after.name
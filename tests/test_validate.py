@@ -0,0 +1,72 @@
+"""Native validator levels, checked against ``check_file`` in ``core/init.sh`` on the same fixtures."""
+
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from flowchain.validate import (
+    CHUNK_SIZE,
+    LEVEL_CONTRADICTION,
+    LEVEL_FILE_MISSING,
+    LEVEL_MISSING_SECTION,
+    LEVEL_PLACEHOLDER,
+    LEVEL_VALID,
+    check_bytes,
+    check_file,
+)
+
+INIT_SH = Path(__file__).resolve().parent.parent / "core" / "init.sh"
+
+FIXTURES = {
+    "missing": (None, LEVEL_FILE_MISSING),
+    "placeholder": ("# Guide\n\n## PURPOSE\n\n<!-- PLACEHOLDER -->\n", LEVEL_PLACEHOLDER),
+    "lowercase_header": ("# Guide\n\n## Purpose\n\nText\n", LEVEL_MISSING_SECTION),
+    "indented_header": ("# Guide\n\n ## PURPOSE\n\nText\n", LEVEL_MISSING_SECTION),
+    "missing_section": ("## PURPOSE\n\n<!-- MISSING_SECTION: SCOPE -->\n<!-- PLACEHOLDER -->\n", LEVEL_MISSING_SECTION),
+    "contradiction": ("## PURPOSE\n\n<!-- PLACEHOLDER -->\n🚨 CONTRADICTION: phase mismatch\n", LEVEL_CONTRADICTION),
+    "valid": ("# Guide\n\n## PURPOSE\n\nText\n\n## DEFINITION OF DONE_2\n\nMore\n", LEVEL_VALID),
+}
+
+
+def write_fixture(tmp_path, name):
+    content, _ = FIXTURES[name]
+    path = tmp_path / f"{name}.md"
+    if content is not None:
+        path.write_text(content)
+    return path
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_native_levels(tmp_path, name):
+    path = write_fixture(tmp_path, name)
+    expected = FIXTURES[name][1]
+    assert check_file(path) == expected
+    if path.exists():
+        assert check_bytes(path.read_bytes()) == expected
+
+
+def test_markers_across_read_boundaries(tmp_path):
+    path = tmp_path / "big.md"
+    path.write_text("## PURPOSE\n" + "x" * (CHUNK_SIZE - 15) + "\n<!-- PLACEHOLDER -->\n")
+    assert check_file(path) == LEVEL_PLACEHOLDER
+
+
+def _bash_check_file() -> str:
+    """The marker variables and ``check_file`` function, cut out of ``core/init.sh``."""
+    script = INIT_SH.read_text()
+    variables = re.search(r"^UPPERCASE_SECTION_REGEX=.*?^CONTRADICTION_MARKER=.*?$", script, re.M | re.S).group()
+    function = re.search(r"^check_file\(\) \{.*?^\}$", script, re.M | re.S).group()
+    return f"{variables}\n{function}\n"
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+@pytest.mark.parametrize("name", FIXTURES)
+def test_native_level_matches_init_sh(tmp_path, name):
+    path = write_fixture(tmp_path, name)
+    script = _bash_check_file() + 'check_file "$1"\n'
+    shell = subprocess.run(["bash", "-c", script, "check_file", str(path)], capture_output=True, text=True,
+                           env={"LC_ALL": "C.UTF-8", "PATH": "/usr/bin:/bin"})
+    assert shell.returncode == check_file(path) == FIXTURES[name][1], shell.stdout
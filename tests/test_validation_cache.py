@@ -0,0 +1,124 @@
+"""Validation cache and recursive validation: stat/hash fast paths, invalidation and project discovery."""
+
+import json
+import os
+
+import pytest
+
+from flowchain import cache as cache_module
+from flowchain import validate
+from flowchain.cache import CACHE_DIR, CACHE_FILE, ValidationCache
+from flowchain.validate import (
+    CORE_FILES,
+    LEVEL_FILE_MISSING,
+    LEVEL_PLACEHOLDER,
+    LEVEL_VALID,
+    VALIDATOR_VERSION,
+    check_file_cached,
+    discover_projects,
+    validate_projects,
+)
+
+VALID = "# Doc\n\n## PURPOSE\n\nText\n"
+
+
+def make_project(root, placeholder=()):
+    root.mkdir(parents=True, exist_ok=True)
+    for file in CORE_FILES:
+        body = VALID + ("<!-- PLACEHOLDER -->\n" if file in placeholder else "")
+        (root / file).write_text(body if file.endswith(".md") else '{"x": 1}\n## STATE\n')
+    return root
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    """Treat freshly written files as outside the racy window, so the stat fast path is taken."""
+    monkeypatch.setattr(cache_module, "RACY_WINDOW_NS", 0)
+
+
+def test_unchanged_file_is_a_stat_hit(tmp_path, trusted):
+    path = tmp_path / "README.md"
+    path.write_text(VALID)
+    cache = ValidationCache(tmp_path, VALIDATOR_VERSION)
+    assert check_file_cached(path, cache) == LEVEL_VALID
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert check_file_cached(path, cache) == LEVEL_VALID
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_touched_but_identical_file_is_a_hash_hit(tmp_path, trusted):
+    path = tmp_path / "README.md"
+    path.write_text(VALID)
+    cache = ValidationCache(tmp_path, VALIDATOR_VERSION)
+    check_file_cached(path, cache)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert check_file_cached(path, cache) == LEVEL_VALID
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_edited_file_is_rescanned(tmp_path, trusted):
+    path = tmp_path / "README.md"
+    path.write_text(VALID)
+    cache = ValidationCache(tmp_path, VALIDATOR_VERSION)
+    check_file_cached(path, cache)
+    path.write_text(VALID + "<!-- PLACEHOLDER -->\n")
+    assert check_file_cached(path, cache) == LEVEL_PLACEHOLDER
+    assert cache.misses == 2
+
+
+def test_racy_entries_are_never_trusted_on_stat_alone(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text(VALID)
+    cache = ValidationCache(tmp_path, VALIDATOR_VERSION)
+    check_file_cached(path, cache)
+    key = os.fspath(path.resolve())
+    assert cache.entries[key]["racy"]
+    assert cache.get(key, path.stat()) is None
+
+
+def test_saved_cache_is_dropped_on_a_version_change(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text(VALID)
+    cache = ValidationCache.for_project(tmp_path, VALIDATOR_VERSION)
+    check_file_cached(path, cache)
+    cache.save()
+    assert not cache.dirty
+    assert ValidationCache.for_project(tmp_path, VALIDATOR_VERSION).entries == cache.entries
+    assert ValidationCache.for_project(tmp_path, VALIDATOR_VERSION + "-next").entries == {}
+
+
+def test_discovery_skips_templates_packages_and_hidden_dirs(tmp_path):
+    for project in ("a", "nested/b", "templates/project", "pkg/inner", ".hidden", "node_modules/x"):
+        (tmp_path / project).mkdir(parents=True)
+        (tmp_path / project / validate.STATE_FILE).write_text("{}")
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    assert discover_projects(tmp_path) == [tmp_path / "a", tmp_path / "nested" / "b"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_projects_aggregates_and_reuses_the_cache(tmp_path, trusted, jobs):
+    a = make_project(tmp_path / "a")
+    b = make_project(tmp_path / "b", placeholder={"USER_MANUAL.md"})
+    (b / "FLEX_LOGIC.md").unlink()
+
+    results, caches = validate_projects([a, b], jobs=jobs)
+    assert set(results[a].values()) == {LEVEL_VALID}
+    assert results[b]["USER_MANUAL.md"] == LEVEL_PLACEHOLDER
+    assert results[b]["FLEX_LOGIC.md"] == LEVEL_FILE_MISSING
+    assert json.loads((a / CACHE_DIR / CACHE_FILE).read_text())["version"] == VALIDATOR_VERSION
+
+    again, caches = validate_projects([a, b], jobs=jobs)
+    assert again == results
+    assert sum(c.misses for c in caches.values()) == 0
+    assert sum(c.hits for c in caches.values()) == 2 * len(CORE_FILES) - 1
+
+
+def test_recursive_json_report(tmp_path, capsys):
+    make_project(tmp_path / "b", placeholder={"README.md"})
+    make_project(tmp_path / "a")
+    assert validate.main([str(tmp_path), "--recursive", "--jobs", "1", "--json", "--no-cache"]) == LEVEL_PLACEHOLDER
+    report = json.loads(capsys.readouterr().out)
+    assert [(p["path"], p["level"]) for p in report["projects"]] == [("a", 0), ("b", 1)]
+    assert list(report["projects"][0]["files"]) == list(CORE_FILES)
+    assert validate.main([str(tmp_path), "-r", "-j", "1", "--json", "--max-level", "1"]) == 0